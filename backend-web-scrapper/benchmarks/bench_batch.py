@@ -0,0 +1,68 @@
+"""
+Throughput of /scrape-batch (shared keep-alive pool, concurrent fetches)
+against the previous one-URL-at-a-time path (requests.get without a session
+plus parsing), on a local server with simulated network latency.
+
+Run from the repository root:
+    python -m backend-web-scrapper.benchmarks.bench_batch --urls 200 --latency-ms 50
+"""
+import argparse
+import json
+import os
+import time
+
+import requests
+
+from ..dynamic_web_scrapper import _parse_static_html
+from .fixtures import FixtureServer, product_cards_page
+
+
+def run(url_count, cards, latency, per_host):
+    # The benchmark only exercises the static path, do not launch browsers
+    os.environ.setdefault("SCRAPER_POOL_WARMUP", "0")
+    os.environ["SCRAPER_BATCH_PER_HOST"] = str(per_host)
+    from fastapi.testclient import TestClient
+    from ..main import app
+
+    page = product_cards_page(cards)
+    report = {"urls": url_count, "cards_per_page": cards, "latency_ms": latency * 1000, "per_host": per_host}
+    with FixtureServer({"/page": page}, latency=latency) as server:
+        urls = [f"{server.base_url}/page?id={i}" for i in range(url_count)]
+
+        started = time.perf_counter()
+        for url in urls:
+            response = requests.get(url, timeout=10)
+            response.raise_for_status()
+            _parse_static_html(response.text)
+        elapsed = time.perf_counter() - started
+        report["sequential_no_session"] = {
+            "seconds": round(elapsed, 3),
+            "urls_per_second": round(url_count / elapsed, 2),
+        }
+
+        with TestClient(app) as client:
+            started = time.perf_counter()
+            response = client.post("/scrape-batch", json={"urls": urls, "cache": False})
+            elapsed = time.perf_counter() - started
+            body = response.json()
+            report["scrape_batch"] = {
+                "seconds": round(elapsed, 3),
+                "urls_per_second": round(url_count / elapsed, 2),
+                "succeeded": body["succeeded"],
+                "failed": body["failed"],
+            }
+
+    report["speedup"] = round(
+        report["scrape_batch"]["urls_per_second"] / report["sequential_no_session"]["urls_per_second"], 2
+    )
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--urls", type=int, default=200)
+    parser.add_argument("--cards", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--per-host", type=int, default=6, help="SCRAPER_BATCH_PER_HOST for the run")
+    args = parser.parse_args()
+    print(json.dumps(run(args.urls, args.cards, args.latency_ms / 1000, args.per_host), indent=2))
@@ -0,0 +1,77 @@
+"""
+Compare WebDriver round trips and wall time of the "webdriver" and "script"
+extraction modes of DynamicWebScraper on a local product listing, with the
+plain field spec and with the same fields as a recipe ("type": "auto", so
+types are decided on the first container).
+
+Run from the repository root:
+    python -m backend-web-scrapper.benchmarks.bench_extraction --cards 300
+"""
+import argparse
+import json
+import time
+
+from ..dynamic_web_scrapper import DynamicWebScraper
+from .fixtures import FixtureServer, product_cards_page, PRODUCT_CARD_FIELDS
+
+
+def count_round_trips(driver):
+    """Wrap driver.execute so every WebDriver command (element calls included) is counted"""
+    counter = {"commands": 0}
+    original_execute = driver.execute
+
+    def counting_execute(*args, **kwargs):
+        counter["commands"] += 1
+        return original_execute(*args, **kwargs)
+
+    driver.execute = counting_execute
+    return counter
+
+
+def run(cards, repeat):
+    report = {"cards": cards, "modes": {}}
+    pages = {"/listing": product_cards_page(cards)}
+    with FixtureServer(pages) as server:
+        scraper = DynamicWebScraper()
+        scraper.setup_driver()
+        try:
+            scraper.driver.get(f"{server.base_url}/listing")
+            counter = count_round_trips(scraper.driver)
+            recipe_fields = [dict(field, type="auto") for field in PRODUCT_CARD_FIELDS]
+            variants = [
+                (f"{mode}{suffix}", mode, fields)
+                for suffix, fields in (("", PRODUCT_CARD_FIELDS), ("_recipe", recipe_fields))
+                for mode in ("webdriver", "script")
+            ]
+            for name, mode, fields in variants:
+                scraper.extraction_mode = mode
+                timings = []
+                for _ in range(repeat):
+                    counter["commands"] = 0
+                    started = time.perf_counter()
+                    scraper._script_fields = None
+                    table = scraper._process_dynamic_page_data(".product-card", fields)
+                    timings.append(time.perf_counter() - started)
+                report["modes"][name] = {
+                    "rows": len(table),
+                    "round_trips": counter["commands"],
+                    "best_seconds": min(timings),
+                    "mean_seconds": sum(timings) / len(timings),
+                }
+        finally:
+            scraper.driver.quit()
+
+    webdriver_mode, script_mode = report["modes"]["webdriver"], report["modes"]["script"]
+    report["round_trip_reduction"] = webdriver_mode["round_trips"] / max(script_mode["round_trips"], 1)
+    report["speedup"] = webdriver_mode["best_seconds"] / max(script_mode["best_seconds"], 1e-9)
+    webdriver_recipe = report["modes"]["webdriver_recipe"]
+    report["recipe_round_trip_reduction"] = webdriver_mode["round_trips"] / max(webdriver_recipe["round_trips"], 1)
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cards", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    print(json.dumps(run(args.cards, args.repeat), indent=2))
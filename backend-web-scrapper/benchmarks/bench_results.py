@@ -0,0 +1,97 @@
+"""
+Latency and peak memory of turning extracted columns into the JSON response:
+the previous pandas path (DataFrame, row-wise emptiness filter, to_dict)
+against ResultTable, plus the cold import cost of each.
+
+Run from the repository root:
+    python -m backend-web-scrapper.benchmarks.bench_results --rows 20000
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from ..result_table import ResultTable
+from .fixtures import PRODUCT_CARD_FIELDS
+
+
+def make_columns(rows):
+    """Column lists shaped like a product listing, every tenth row empty"""
+    data = {field["name"]: [] for field in PRODUCT_CARD_FIELDS}
+    for i in range(rows):
+        empty = i % 10 == 9
+        for field in PRODUCT_CARD_FIELDS:
+            data[field["name"]].append("" if empty else f"{field['name']} value {i}")
+    return data
+
+
+def pandas_pipeline(data):
+    import pandas as pd
+
+    df = pd.DataFrame(data)
+    df = df.dropna(how='all')
+    df = df[~(df.astype(str).apply(lambda x: x.str.strip() == '').all(axis=1))]
+    df = df.reset_index(drop=True)
+    return json.dumps(df.to_dict(orient="records"))
+
+
+def result_table_pipeline(data):
+    return ResultTable.from_columns(data).to_json()
+
+
+def measure(pipeline, data, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        output = pipeline(data)
+        timings.append(time.perf_counter() - started)
+    tracemalloc.start()
+    pipeline(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "best_seconds": round(min(timings), 4),
+        "mean_seconds": round(sum(timings) / len(timings), 4),
+        "peak_memory_mb": round(peak / 1024 / 1024, 2),
+        "rows_out": len(json.loads(output)),
+    }
+
+
+def import_seconds(module):
+    """Cold import time of a module in a fresh interpreter (run from the repository root)"""
+    code = (
+        "import importlib, time; t = time.perf_counter(); "
+        f"importlib.import_module({module!r}); print(time.perf_counter() - t)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    return round(float(result.stdout), 3) if result.returncode == 0 else None
+
+
+def run(rows, repeat):
+    data = make_columns(rows)
+    report = {"rows": rows, "repeat": repeat, "pipelines": {}}
+    try:
+        import pandas  # noqa: F401
+        report["pipelines"]["pandas"] = measure(pandas_pipeline, data, repeat)
+        report["import_seconds"] = {"pandas": import_seconds("pandas")}
+    except ImportError:
+        report["pipelines"]["pandas"] = None
+        report["import_seconds"] = {"pandas": None}
+    report["pipelines"]["result_table"] = measure(result_table_pipeline, data, repeat)
+    report["import_seconds"]["result_table"] = import_seconds(ResultTable.__module__)
+
+    baseline, lean = report["pipelines"]["pandas"], report["pipelines"]["result_table"]
+    if baseline:
+        report["speedup"] = round(baseline["best_seconds"] / max(lean["best_seconds"], 1e-9), 2)
+        report["memory_ratio"] = round(baseline["peak_memory_mb"] / max(lean["peak_memory_mb"], 1e-9), 2)
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(run(args.rows, args.repeat), indent=2))
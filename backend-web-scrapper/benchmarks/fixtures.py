@@ -0,0 +1,188 @@
+import hashlib
+import html
+import json
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlsplit
+
+
+def product_card(i, style=""):
+    """Markup of one price-heavy product card"""
+    style_attr = f' style="{style}"' if style else ""
+    return (
+        f'<div class="product-card"{style_attr}>'
+        f'<h3 class="title">Product {i}</h3>'
+        f'<a class="name" href="/item/{i}">View</a>'
+        # With an extension, so the default resource policy's URL patterns block it
+        f'<img src="/img/{i}.png" alt="">'
+        f'<span class="badge">{"Top Seller" if i % 5 == 0 else ""}</span>'
+        f'<div class="prc">KSh {1000 + i * 7:,}</div>'
+        f'<div class="old-prc">KSh {1500 + i * 7:,}</div>'
+        f'</div>'
+    )
+
+
+def _page(title, body):
+    return (
+        f"<!DOCTYPE html><html><head><title>{html.escape(title)}</title></head>"
+        f"<body>{body}</body></html>"
+    )
+
+
+def product_cards_page(count=300, title="Fixture listing", first=0, extra=""):
+    """Static listing of price-heavy product cards like the ones the price heuristics target"""
+    cards = "".join(product_card(i) for i in range(first, first + count))
+    return _page(title, f'<div class="listing">{cards}</div>{extra}')
+
+
+PRODUCT_CARD_FIELDS = [
+    {"name": "name", "selector": ".title"},
+    {"name": "link", "selector": "a.name"},
+    {"name": "image", "selector": "img"},
+    {"name": "price", "selector": ".price-not-present"},
+]
+
+
+def js_rendered_page(count=100, delay_ms=200, title="JS listing"):
+    """Listing whose cards only exist after a script runs, so static HTML has no containers"""
+    cards = json.dumps([product_card(i) for i in range(count)])
+    script = (
+        "<script>"
+        f"setTimeout(function () {{ document.querySelector('.listing').innerHTML = {cards}.join(''); }}, {delay_ms});"
+        "</script>"
+    )
+    return _page(title, f'<div class="listing"></div>{script}')
+
+
+def infinite_scroll_page(total=200, batch=20, delay_ms=150, title="Infinite scroll listing"):
+    """Listing that appends the next batch of cards whenever the user scrolls near the bottom"""
+    cards = json.dumps([product_card(i, style="height:120px") for i in range(total)])
+    script = (
+        "<script>"
+        f"var cards = {cards}, shown = 0, loading = false;"
+        "function more() {"
+        "  if (loading || shown >= cards.length) return;"
+        "  loading = true;"
+        "  setTimeout(function () {"
+        f"    document.querySelector('.listing').insertAdjacentHTML('beforeend', cards.slice(shown, shown + {batch}).join(''));"
+        f"    shown += {batch}; loading = false;"
+        f"  }}, {delay_ms});"
+        "}"
+        "window.addEventListener('scroll', function () {"
+        "  if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 200) more();"
+        "});"
+        "more();"
+        "</script>"
+    )
+    return _page(title, f'<div class="listing"></div>{script}')
+
+
+def paginated_listing(per_page=20, pages=5, path="/paged"):
+    """Page callable for ?page=N listings with a "Next" link; pages past the last one are empty"""
+    def render(request_path):
+        query = parse_qs(urlsplit(request_path).query)
+        page = int(query.get("page", ["1"])[0])
+        if page > pages:
+            return product_cards_page(0, title=f"Page {page}")
+        next_link = ""
+        if page < pages:
+            next_link = f'<ul><li class="pagination-next"><a href="{path}?page={page + 1}">Next</a></li></ul>'
+        return product_cards_page(per_page, title=f"Page {page}", first=(page - 1) * per_page, extra=next_link)
+    return render
+
+
+PRICE_VARIANTS = [
+    '<span class="badge">Top Seller</span><span class="prc">KSh {price:,}</span>',
+    '<span class="price">${price}.99</span><span class="price">Sale</span>',
+    '<span class="price-now">{price:,}</span>',
+    '<span class="cost">Sold</span><span class="cost">£{price}</span>',
+    '<span class="amount">Rs. {price:,}</span><span class="discount">-20%</span>',
+]
+PRICE_VARIANT_FIELDS = [
+    {"name": "name", "selector": ".title"},
+    {"name": "price", "selector": ".price-block span"},
+]
+
+
+def price_variants_page(count=100, title="Price variants"):
+    """Cards mixing currencies, labels and decoys around the price, one pattern per card"""
+    cards = []
+    for i in range(count):
+        variant = PRICE_VARIANTS[i % len(PRICE_VARIANTS)].format(price=100 + i * 3)
+        cards.append(
+            f'<div class="product-card"><h3 class="title">Product {i}</h3>'
+            f'<div class="price-block">{variant}</div></div>'
+        )
+    return _page(title, f'<div class="listing">{"".join(cards)}</div>')
+
+
+def fixture_site(cards=100, pages=5, js_delay_ms=200, scroll_batch=20):
+    """Every fixture page, keyed by path, for FixtureServer"""
+    return {
+        "/static": product_cards_page(cards),
+        "/js": js_rendered_page(cards, delay_ms=js_delay_ms),
+        "/scroll": infinite_scroll_page(cards, batch=scroll_batch),
+        "/paged": paginated_listing(per_page=max(1, cards // pages), pages=pages),
+        "/prices": price_variants_page(cards),
+    }
+
+
+class FixtureServer:
+    """Serve fixture pages from memory on a local port in a background thread.
+
+    ``latency`` (seconds) is added to every response to mimic a remote site.
+    """
+
+    def __init__(self, pages, host="127.0.0.1", port=0, latency=0.0):
+        self.pages = pages
+        self.latency = latency
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, so clients with connection pools can reuse connections
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(handler):
+                if self.latency:
+                    time.sleep(self.latency)
+                path = handler.path.split("?")[0]
+                page = self.pages.get(path)
+                if page is None:
+                    handler.send_response(404)
+                    handler.send_header("Content-Length", "0")
+                    handler.end_headers()
+                    return
+                body = page(handler.path) if callable(page) else page
+                body = body.encode("utf-8")
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+                if handler.headers.get("If-None-Match") == etag:
+                    handler.send_response(304)
+                    handler.send_header("ETag", etag)
+                    handler.send_header("Content-Length", "0")
+                    handler.end_headers()
+                    return
+                handler.send_response(200)
+                handler.send_header("ETag", etag)
+                handler.send_header("Content-Type", "text/html; charset=utf-8")
+                handler.send_header("Content-Length", str(len(body)))
+                handler.end_headers()
+                handler.wfile.write(body)
+
+            def log_message(handler, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
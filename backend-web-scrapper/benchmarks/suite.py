@@ -0,0 +1,302 @@
+"""
+Benchmark suite: runs the API in-process against local fixture sites and
+records latency percentiles, throughput and memory per scenario and
+concurrency level as a JSON report that can be diffed between versions.
+
+Run from the repository root:
+    python -m backend-web-scrapper.benchmarks.suite --concurrency 1,4,16 --output bench.json
+    python -m backend-web-scrapper.benchmarks.suite --compare old.json bench.json
+
+Browser scenarios are recorded as skipped when Chrome cannot be started.
+Fixture images have .png URLs, the best case for the resource policies, which block by
+file extension: sites serving extensionless image or font URLs save less than measured here.
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import os
+import platform
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from ..memory_guard import process_tree_rss_mb
+from .fixtures import FixtureServer, fixture_site, PRODUCT_CARD_FIELDS, PRICE_VARIANT_FIELDS
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process alone (API, fixtures and load generator)"""
+    # ru_maxrss is in KiB on Linux
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+def summarize(latencies, errors, rows, elapsed):
+    report = {"requests": len(latencies) + errors, "errors": errors, "rows": rows, "seconds": round(elapsed, 3)}
+    if latencies:
+        report.update({
+            "p50_ms": round(percentile(latencies, 0.50) * 1000, 1),
+            "p90_ms": round(percentile(latencies, 0.90) * 1000, 1),
+            "p99_ms": round(percentile(latencies, 0.99) * 1000, 1),
+            "mean_ms": round(sum(latencies) / len(latencies) * 1000, 1),
+            "max_ms": round(max(latencies) * 1000, 1),
+        })
+    report["throughput_rps"] = round(len(latencies) / elapsed, 2) if elapsed else None
+    return report
+
+
+def count_rows(body):
+    if isinstance(body, dict) and isinstance(body.get("results"), list):
+        return len(body["results"])
+    return 0
+
+
+async def run_http_scenario(client, request, total, concurrency):
+    """Fire total requests, at most concurrency in flight; request is (method, path, params, json)"""
+    method, path, params, payload = request
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, results = [], {"errors": 0, "rows": 0}
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, params=params, json=payload)
+                response.raise_for_status()
+                body = response.json()
+                if isinstance(body, dict) and "error" in body:
+                    raise RuntimeError(body["error"])
+            except Exception:
+                results["errors"] += 1
+                return
+            latencies.append(time.perf_counter() - started)
+            results["rows"] += count_rows(body)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    return summarize(latencies, results["errors"], results["rows"], time.perf_counter() - started)
+
+
+def run_pagination_scenario(func, total, concurrency):
+    """Call func() total times on concurrency threads (each call drives its own browser)"""
+    latencies, results, lock = [], {"errors": 0, "rows": 0}, threading.Lock()
+
+    def one(_):
+        started = time.perf_counter()
+        try:
+            rows = func()
+        except Exception:
+            with lock:
+                results["errors"] += 1
+            return
+        with lock:
+            latencies.append(time.perf_counter() - started)
+            results["rows"] += len(rows)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(one, range(total)))
+    return summarize(latencies, results["errors"], results["rows"], time.perf_counter() - started)
+
+
+def chrome_available():
+    """Try to launch one browser; returns (available, reason)"""
+    from ..dynamic_web_scrapper import create_pooled_driver
+
+    try:
+        driver = create_pooled_driver()
+    except Exception as e:
+        return False, str(e).splitlines()[0] if str(e) else type(e).__name__
+    driver.quit()
+    return True, None
+
+
+def scenarios(base, cards, pages):
+    """name -> (needs_browser, kind, spec)"""
+    def dynamic(path, fields=PRODUCT_CARD_FIELDS, **extra):
+        payload = {"url": base + path, "container_selector": ".product-card", "custom_fields": fields, "cache": False}
+        payload.update(extra)
+        return ("POST", "/scrape-dynamic", None, payload)
+
+    return {
+        "scrape_static": (False, "http", ("GET", "/scrape", {"url": base + "/static", "cache": "false"}, None)),
+        "scrape_dynamic_auto_static": (False, "http", dynamic("/static")),
+        "scrape_dynamic_paginated_url": (False, "http", (
+            "POST", "/scrape-dynamic-paginated", None,
+            # Pinned to static: the empty page after the last one would otherwise escalate to a browser
+            {**dynamic("/paged", strategy="static")[3], "page_param": "page", "start_page": 1, "end_page": pages + 1},
+        )),
+        "scrape_dynamic_js": (True, "http", dynamic("/js", strategy="dynamic")),
+        "scrape_dynamic_prices": (True, "http", dynamic("/prices", PRICE_VARIANT_FIELDS, strategy="dynamic")),
+        "scrape_dynamic_infinite_scroll": (True, "http", dynamic(
+            "/scroll", strategy="dynamic", enable_scrolling=True, max_scrolls=cards // 20 + 1
+        )),
+        "pagination_next_button": (True, "direct", {
+            "url": base + "/paged", "pages": pages,
+        }),
+    }
+
+
+def next_button_pagination(spec):
+    from ..dynamic_web_scrapper import DynamicWebScraper
+
+    def run():
+        table = DynamicWebScraper().scrape_dynamic_with_pagination(
+            spec["url"], ".product-card", PRODUCT_CARD_FIELDS, 1, spec["pages"], "Next Button",
+            next_button_selector="//li[contains(@class,'pagination-next')]/a",
+        )
+        return table.records()
+    return run
+
+
+def start_api_server():
+    """Run the FastAPI app under uvicorn on a free local port in a background thread"""
+    import uvicorn
+    from ..main import app
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError("API server failed to start")
+        time.sleep(0.05)
+    return server, thread, f"http://127.0.0.1:{port}"
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except Exception:
+        return None
+
+
+async def run_suite(args, base, api_url, browser, browser_reason):
+    report = {}
+    selected = set(args.scenarios.split(",")) if args.scenarios else None
+    timeout = httpx.Timeout(args.timeout)
+    limits = httpx.Limits(max_connections=max(args.concurrency) * 2)
+    async with httpx.AsyncClient(base_url=api_url, timeout=timeout, limits=limits) as client:
+        for name, (needs_browser, kind, spec) in scenarios(base, args.cards, args.pages).items():
+            if selected and name not in selected:
+                continue
+            if needs_browser and not browser:
+                report[name] = {"skipped": f"Chrome unavailable: {browser_reason}"}
+                continue
+            report[name] = {}
+            for concurrency in args.concurrency:
+                total = max(args.requests, concurrency)
+                rss_before = process_tree_rss_mb()
+                if kind == "http":
+                    result = await run_http_scenario(client, spec, total, concurrency)
+                else:
+                    result = await asyncio.to_thread(
+                        run_pagination_scenario, next_button_pagination(spec), total, concurrency
+                    )
+                result["concurrency"] = concurrency
+                result["rss_mb_before"] = rss_before
+                result["rss_mb_after"] = process_tree_rss_mb()
+                result["api_peak_rss_mb"] = peak_rss_mb()
+                report[name][str(concurrency)] = result
+                print(f"{name} c={concurrency}: {result}", file=sys.stderr)
+    return report
+
+
+def run(args):
+    # Isolated job/recipe databases; no start-rate limit so local pagination measures the scraper, not the throttle
+    os.environ.setdefault("SCRAPER_JOBS_DB", os.path.join(tempfile.mkdtemp(), "bench-jobs.sqlite3"))
+    os.environ.setdefault("SCRAPER_RECIPES_DB", os.path.join(tempfile.mkdtemp(), "bench-recipes.sqlite3"))
+    os.environ.setdefault("SCRAPER_DOMAIN_RATE", "0")
+    browser, browser_reason = (False, "disabled with --no-browser") if args.no_browser else chrome_available()
+    if not browser:
+        os.environ["SCRAPER_POOL_WARMUP"] = "0"
+
+    with FixtureServer(fixture_site(args.cards, args.pages), latency=args.latency_ms / 1000) as fixtures:
+        server, thread, api_url = start_api_server()
+        try:
+            results = asyncio.run(run_suite(args, fixtures.base_url, api_url, browser, browser_reason))
+        finally:
+            server.should_exit = True
+            thread.join(timeout=30)
+
+    return {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "browser": browser,
+            "args": {
+                "concurrency": args.concurrency, "requests": args.requests, "cards": args.cards,
+                "pages": args.pages, "latency_ms": args.latency_ms,
+            },
+        },
+        "scenarios": results,
+    }
+
+
+def compare(old_path, new_path):
+    """Per scenario/concurrency ratios new/old of p50, p99 and throughput"""
+    with open(old_path) as old_file, open(new_path) as new_file:
+        old, new = json.load(old_file)["scenarios"], json.load(new_file)["scenarios"]
+    diff = {}
+    for name, levels in new.items():
+        for concurrency, result in levels.items():
+            before = old.get(name, {}).get(concurrency) if isinstance(old.get(name), dict) else None
+            if not isinstance(result, dict) or not isinstance(before, dict):
+                continue
+            entry = {}
+            for key in ("p50_ms", "p99_ms", "throughput_rps", "rss_mb_after"):
+                if before.get(key) and result.get(key) is not None:
+                    entry[key] = {"old": before[key], "new": result[key], "ratio": round(result[key] / before[key], 3)}
+            diff.setdefault(name, {})[concurrency] = entry
+    return diff
+
+
+def concurrency_levels(value):
+    return [int(level) for level in value.split(",") if level.strip()]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=concurrency_levels, default=[1, 4, 16])
+    parser.add_argument("--requests", type=int, default=32, help="requests per scenario and concurrency level")
+    parser.add_argument("--cards", type=int, default=100, help="cards per fixture listing")
+    parser.add_argument("--pages", type=int, default=5, help="pages of the paginated fixture")
+    parser.add_argument("--latency-ms", type=float, default=0, help="simulated latency of the fixture server")
+    parser.add_argument("--timeout", type=float, default=120, help="per-request timeout in seconds")
+    parser.add_argument("--scenarios", help="comma-separated subset of scenarios to run")
+    parser.add_argument("--no-browser", action="store_true", help="skip scenarios that need Chrome")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="diff two reports and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        print(json.dumps(compare(*args.compare), indent=2))
+        sys.exit(0)
+    # The API prints request logs; keep stdout for the report
+    with contextlib.redirect_stdout(sys.stderr):
+        report = run(args)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
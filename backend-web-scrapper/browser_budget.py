@@ -0,0 +1,105 @@
+import logging
+import os
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserSlot:
+    """A held slot of the browser budget (an exclusively locked slot file)"""
+
+    def __init__(self, index, fd):
+        self.index = index
+        self.fd = fd
+
+
+class BrowserBudget:
+    """Machine-wide cap on concurrent Chrome instances, shared by every process.
+
+    Each browser holds an exclusive flock on one of ``slots`` files in
+    ``directory``. The kernel drops the lock when the holder exits, so slots of
+    crashed processes are never leaked.
+    """
+
+    def __init__(self, directory, slots):
+        self.directory = directory
+        self.slots = max(1, int(slots))
+        os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def from_env(cls):
+        """Budget of SCRAPER_MAX_BROWSERS slots, or None when no global cap is configured"""
+        slots = int(os.getenv("SCRAPER_MAX_BROWSERS", "0"))
+        if slots <= 0:
+            return None
+        if fcntl is None:
+            logger.warning("SCRAPER_MAX_BROWSERS needs fcntl file locks, the global browser cap is disabled")
+            return None
+        directory = os.getenv(
+            "SCRAPER_BROWSER_SLOTS_DIR", os.path.join(tempfile.gettempdir(), "web-scrapper-browser-slots")
+        )
+        return cls(directory, slots)
+
+    def _path(self, index):
+        return os.path.join(self.directory, f"slot-{index}.lock")
+
+    def _try_lock(self, index):
+        fd = os.open(self._path(index), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return None
+        return fd
+
+    def try_acquire(self):
+        """Take a free slot without waiting; None when every slot is held"""
+        for index in range(self.slots):
+            fd = self._try_lock(index)
+            if fd is not None:
+                return BrowserSlot(index, fd)
+        return None
+
+    def release(self, slot):
+        if slot is None or slot.fd is None:
+            return
+        try:
+            fcntl.flock(slot.fd, fcntl.LOCK_UN)
+        finally:
+            os.close(slot.fd)
+            slot.fd = None
+
+    def in_use(self):
+        """
+        Slots currently held by any process, or None where /proc/locks is not
+        available. Read from the kernel's lock table rather than by trying the
+        locks, which would make a concurrent try_acquire() fail spuriously.
+        """
+        try:
+            with open("/proc/locks") as locks:
+                # "1: FLOCK  ADVISORY  WRITE 1234 fe:00:13533301 0 EOF"; "->" lines are waiters
+                held_inodes = {
+                    int(fields[5].rsplit(":", 1)[1])
+                    for fields in (line.split() for line in locks)
+                    if len(fields) > 5 and fields[1] == "FLOCK"
+                }
+        except (OSError, ValueError):
+            return None
+        held = 0
+        for index in range(self.slots):
+            try:
+                # Matched on the inode only: overlay filesystems may report another device there
+                if os.stat(self._path(index)).st_ino in held_inodes:
+                    held += 1
+            except OSError:
+                continue
+        return held
+
+    def metrics(self):
+        in_use = self.in_use()
+        return {"capacity": self.slots, "in_use": in_use, "free": None if in_use is None else self.slots - in_use}
@@ -0,0 +1,128 @@
+import itertools
+import json
+import logging
+import os
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserWorkerError(Exception):
+    """A browser-worker call failed; carries the HTTP status to answer with"""
+
+    def __init__(self, status_code, detail):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+class BrowserWorkers:
+    """Forwards browser work from an API process to the browser-worker processes.
+
+    Workers are tried round-robin. A worker answering 503 (pool exhausted,
+    memory pressure, draining) or not answering at all is skipped for the
+    next one, so load spreads to whichever worker has room. When every worker
+    refuses the caller gets a 503. Streaming endpoints answer 200 before they
+    know whether a browser is free, so a stream whose first event after "start"
+    is a 503 error counts as a refusal too.
+    """
+
+    def __init__(self, urls, timeout=300):
+        self.urls = [url.rstrip("/") for url in urls]
+        self.timeout = timeout
+        self._next = itertools.count()
+        self._metrics = {"forwarded": 0, "skipped": 0, "rejected": 0}
+
+    @classmethod
+    def from_env(cls):
+        """Workers listed in SCRAPER_BROWSER_WORKERS (comma-separated base URLs), or None"""
+        urls = [url.strip() for url in os.getenv("SCRAPER_BROWSER_WORKERS", "").split(",") if url.strip()]
+        if not urls:
+            return None
+        return cls(urls, timeout=float(os.getenv("SCRAPER_BROWSER_WORKER_TIMEOUT", "300")))
+
+    def _order(self):
+        start = next(self._next) % len(self.urls)
+        return self.urls[start:] + self.urls[:start]
+
+    def _skip(self, url, reason):
+        self._metrics["skipped"] += 1
+        logger.warning(f"Browser worker {url} unavailable: {reason}")
+        return f"{url}: {reason}"
+
+    def _all_busy(self, reasons):
+        self._metrics["rejected"] += 1
+        return BrowserWorkerError(503, "All browser workers are busy, try again later (" + "; ".join(reasons) + ")")
+
+    @staticmethod
+    def _detail(response):
+        try:
+            return response.json().get("detail", response.text)
+        except ValueError:
+            return response.text
+
+    async def post(self, client, path, payload):
+        """POST payload to the first worker that accepts it and return the decoded JSON"""
+        reasons = []
+        for url in self._order():
+            try:
+                response = await client.post(url + path, json=payload, timeout=self.timeout)
+            except httpx.TransportError as e:
+                reasons.append(self._skip(url, str(e) or type(e).__name__))
+                continue
+            if response.status_code == 503:
+                reasons.append(self._skip(url, self._detail(response)))
+                continue
+            if response.status_code >= 400:
+                raise BrowserWorkerError(response.status_code, self._detail(response))
+            self._metrics["forwarded"] += 1
+            return response.json()
+        raise self._all_busy(reasons)
+
+    async def stream(self, client, path, payload):
+        """Yield the NDJSON events of a streaming endpoint from the first worker that accepts"""
+        reasons = []
+        for url in self._order():
+            try:
+                async with client.stream("POST", url + path, json=payload, timeout=self.timeout) as response:
+                    if response.status_code == 503:
+                        await response.aread()
+                        reasons.append(self._skip(url, self._detail(response)))
+                        continue
+                    if response.status_code >= 400:
+                        await response.aread()
+                        raise BrowserWorkerError(response.status_code, self._detail(response))
+                    # Hold back "start" until the worker either sends real output or refuses
+                    held, refusal = [], None
+                    async for line in response.aiter_lines():
+                        if not line.strip():
+                            continue
+                        event = json.loads(line)
+                        if held is not None:
+                            if event["type"] == "start":
+                                held.append(event)
+                                continue
+                            if event["type"] == "error" and event.get("status") == 503:
+                                refusal = event["detail"]
+                                break
+                            self._metrics["forwarded"] += 1
+                            for earlier in held:
+                                yield earlier
+                            held = None
+                        yield event
+                    if refusal is not None:
+                        reasons.append(self._skip(url, refusal))
+                        continue
+                    if held is not None:
+                        self._metrics["forwarded"] += 1
+                        for earlier in held:
+                            yield earlier
+                    return
+            except httpx.ConnectError as e:
+                # Only failures to connect move on; a broken stream cannot be retried transparently
+                reasons.append(self._skip(url, str(e) or type(e).__name__))
+        raise self._all_busy(reasons)
+
+    def metrics(self):
+        return {"workers": list(self.urls), **self._metrics}
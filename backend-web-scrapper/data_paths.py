@@ -0,0 +1,16 @@
+import os
+
+
+def data_dir():
+    """Directory for the service's SQLite files: SCRAPER_DATA_DIR, else the user's data directory"""
+    directory = os.getenv("SCRAPER_DATA_DIR")
+    if not directory:
+        base = os.getenv("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+        directory = os.path.join(base, "web-scrapper")
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+def data_path(filename):
+    """Default path of a data file, independent of the working directory"""
+    return os.path.join(data_dir(), filename)
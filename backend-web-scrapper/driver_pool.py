@@ -0,0 +1,279 @@
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from .browser_budget import BrowserBudget
+
+logger = logging.getLogger(__name__)
+
+# How often a borrower blocked by the global browser budget looks for a freed slot
+BUDGET_POLL_INTERVAL = 0.25
+
+
+class PoolExhaustedError(Exception):
+    """Raised when no WebDriver could be borrowed within the timeout"""
+
+
+class PooledDriver:
+    """A WebDriver instance together with its usage bookkeeping"""
+
+    def __init__(self, driver, slot=None):
+        self.driver = driver
+        # Slot of the machine-wide browser budget held while this browser lives
+        self.slot = slot
+        self.created_at = time.monotonic()
+        self.navigations = 0
+        self.borrow_count = 0
+
+
+class WebDriverPool:
+    """Bounded pool of reusable headless Chrome WebDriver sessions.
+
+    Drivers are created lazily (or eagerly via ``warm_up``) up to ``size``,
+    health-checked when borrowed and recycled after ``max_navigations``
+    page loads or whenever a borrower reports them as broken.
+
+    With a BrowserBudget a browser is only launched once a machine-wide slot
+    is free, so several processes together never exceed the global cap.
+    """
+
+    def __init__(self, driver_factory, size=2, max_navigations=50, borrow_timeout=60, budget=None):
+        self.driver_factory = driver_factory
+        self.size = max(1, int(size))
+        self.max_navigations = max_navigations
+        self.borrow_timeout = borrow_timeout
+        self.budget = budget
+        self._idle = []
+        self._in_use = 0
+        self._creating = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._metrics = {
+            "created": 0,
+            "recycled": 0,
+            "health_check_failures": 0,
+            "borrows": 0,
+            "borrow_timeouts": 0,
+            "budget_waits": 0,
+            "total_wait_seconds": 0.0,
+        }
+
+    @classmethod
+    def from_env(cls, driver_factory):
+        """Build a pool using SCRAPER_POOL_* environment variables"""
+        return cls(
+            driver_factory,
+            size=int(os.getenv("SCRAPER_POOL_SIZE", "2")),
+            max_navigations=int(os.getenv("SCRAPER_POOL_MAX_NAVIGATIONS", "50")),
+            borrow_timeout=float(os.getenv("SCRAPER_POOL_BORROW_TIMEOUT", "60")),
+            budget=BrowserBudget.from_env(),
+        )
+
+    def _total(self):
+        return len(self._idle) + self._in_use + self._creating
+
+    def _reserve_slot(self):
+        """(reserved, slot): a budget slot for a new browser, always reserved without a budget"""
+        if self.budget is None:
+            return True, None
+        slot = self.budget.try_acquire()
+        return slot is not None, slot
+
+    def _create(self, slot=None):
+        """Launch a new driver outside the pool lock"""
+        try:
+            driver = self.driver_factory()
+        except Exception:
+            if self.budget is not None:
+                self.budget.release(slot)
+            raise
+        with self._condition:
+            self._metrics["created"] += 1
+        logger.info("WebDriver pool launched a new browser")
+        return PooledDriver(driver, slot)
+
+    def _quit(self, pooled):
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.warning(f"Error while quitting pooled WebDriver: {str(e)}")
+        finally:
+            if self.budget is not None:
+                self.budget.release(pooled.slot)
+
+    def _is_healthy(self, pooled):
+        try:
+            pooled.driver.execute_script("return 1;")
+            return True
+        except Exception as e:
+            logger.warning(f"Pooled WebDriver failed health check: {str(e)}")
+            return False
+
+    def warm_up(self, count=None):
+        """Pre-launch browsers so the first requests do not pay startup cost"""
+        count = self.size if count is None else min(count, self.size)
+        launched = 0
+        while True:
+            with self._condition:
+                if self._closed or self._total() >= count:
+                    break
+                reserved, slot = self._reserve_slot()
+                if not reserved:
+                    logger.info("Global browser budget reached, stopping warm-up")
+                    break
+                self._creating += 1
+            try:
+                pooled = self._create(slot)
+            except Exception as e:
+                logger.error(f"Failed to warm up WebDriver pool: {str(e)}")
+                with self._condition:
+                    self._creating -= 1
+                    self._condition.notify()
+                break
+            with self._condition:
+                self._creating -= 1
+                self._idle.append(pooled)
+                self._condition.notify()
+            launched += 1
+        logger.info(f"WebDriver pool warmed up with {launched} new browser(s)")
+        return launched
+
+    def acquire(self, timeout=None):
+        """Borrow a healthy driver, launching one if the pool has spare capacity"""
+        timeout = self.borrow_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        while True:
+            pooled = None
+            slot = None
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("WebDriver pool is closed")
+                    if self._idle:
+                        pooled = self._idle.pop()
+                        self._in_use += 1
+                        break
+                    blocked_by_budget = False
+                    if self._total() < self.size:
+                        reserved, slot = self._reserve_slot()
+                        if reserved:
+                            self._creating += 1
+                            break
+                        blocked_by_budget = True
+                        self._metrics["budget_waits"] += 1
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._metrics["borrow_timeouts"] += 1
+                        raise PoolExhaustedError(f"No WebDriver available after {timeout} seconds")
+                    # Slots freed by other processes do not notify us, so poll for them
+                    self._condition.wait(min(remaining, BUDGET_POLL_INTERVAL) if blocked_by_budget else remaining)
+
+            if pooled is None:
+                try:
+                    pooled = self._create(slot)
+                finally:
+                    with self._condition:
+                        self._creating -= 1
+                        if pooled is not None:
+                            self._in_use += 1
+                        else:
+                            self._condition.notify()
+            elif not self._is_healthy(pooled):
+                with self._condition:
+                    self._metrics["health_check_failures"] += 1
+                    self._metrics["recycled"] += 1
+                    self._in_use -= 1
+                    self._condition.notify()
+                self._quit(pooled)
+                continue
+
+            with self._condition:
+                pooled.borrow_count += 1
+                self._metrics["borrows"] += 1
+                self._metrics["total_wait_seconds"] += time.monotonic() - started
+            return pooled
+
+    def release(self, pooled, broken=False):
+        """Return a borrowed driver, recycling it when worn out or broken"""
+        recycle = broken or self._closed or pooled.navigations >= self.max_navigations
+        if not recycle:
+            try:
+                # Stop any scripts still running on the previous page
+                pooled.driver.get("about:blank")
+            except Exception as e:
+                logger.warning(f"Failed to reset pooled WebDriver, recycling it: {str(e)}")
+                recycle = True
+
+        with self._condition:
+            self._in_use -= 1
+            if not recycle:
+                self._idle.append(pooled)
+            else:
+                self._metrics["recycled"] += 1
+            self._condition.notify()
+
+        if recycle:
+            logger.info(f"Recycling WebDriver after {pooled.navigations} navigations (broken={broken})")
+            self._quit(pooled)
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """Context manager yielding a pooled driver; crashes mark it for recycling.
+
+        Borrowers should add the page loads they performed to ``pooled.navigations``.
+        """
+        pooled = self.acquire(timeout)
+        broken = False
+        try:
+            yield pooled
+        except Exception:
+            broken = True
+            raise
+        finally:
+            self.release(pooled, broken=broken)
+
+    def drain(self, timeout=30):
+        """Stop lending browsers, wait up to timeout for borrowed ones to come back, then shut down"""
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            while self._in_use and time.monotonic() < deadline:
+                self._condition.wait(deadline - time.monotonic())
+            busy = self._in_use
+        if busy:
+            logger.warning(f"{busy} browser(s) still in use after draining for {timeout} seconds")
+        self.shutdown()
+        return busy == 0
+
+    def shutdown(self):
+        """Quit all idle drivers; drivers in use are quit when released"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for pooled in idle:
+            self._quit(pooled)
+        logger.info(f"WebDriver pool shut down, closed {len(idle)} idle browser(s)")
+
+    def metrics(self):
+        """Snapshot of pool occupancy and lifetime counters"""
+        with self._condition:
+            snapshot = dict(self._metrics)
+            snapshot.update({
+                "size": self.size,
+                "max_navigations": self.max_navigations,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "starting": self._creating,
+                "alive": self._total(),
+                "closed": self._closed,
+            })
+        if self.budget is not None:
+            snapshot["budget"] = self.budget.metrics()
+        borrows = snapshot["borrows"]
+        snapshot["avg_wait_seconds"] = snapshot["total_wait_seconds"] / borrows if borrows else 0.0
+        return snapshot
@@ -1,3 +1,4 @@
+import asyncio
 import requests
 from bs4 import BeautifulSoup
 import time
@@ -9,40 +10,494 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium_stealth import stealth
-import pandas as pd
 import logging
+from functools import lru_cache
+from urllib.parse import urljoin
+from lxml import etree, html as lxml_html
+from cssselect import HTMLTranslator
+from .page_readiness import PageReadiness
+from .result_table import ResultTable, is_empty_row
+from .instrumentation import phase, record_phase, observe_fill_rates
 import random
 import os
 import subprocess
 
 logger = logging.getLogger(__name__)
 
+# Field names that get the special price handling
+PRICE_FIELD_NAMES = ["price", "cost", "amount"]
+# Common price selectors that might work when the user selector finds nothing
+ALTERNATIVE_PRICE_SELECTORS = [
+    ".prc", "span.prc", "div.prc",
+    ".price", "span.price", "div.price",
+    "*[class*='price']", "*[class*='prc']",
+    ".current-price", ".product-price"
+]
+PRICE_PATTERN = r'(?:(?:USD|Ksh|KSh|KES|Sh|$|£|€|Rs)\.?\s?)([\d,]+(?:\.\d+)?)|^[\d,]+(?:\.\d+)?$'
+CURRENCY_MARKERS = ['Ksh', 'KSh', '$', '£', '€']
+NON_PRICE_LABELS = ['sold', 'top seller', 'bestseller', 'sale', 'discount']
+PRICE_REGEX = re.compile(PRICE_PATTERN)
+# Field types of an extraction spec; "auto" is decided from the first container that has the field
+FIELD_TYPES = ("auto", "text", "href", "src", "price")
+# "script" extracts all containers in one injected JavaScript call,
+# "snapshot" parses the rendered page_source offline with lxml,
+# "webdriver" walks every container and field through WebDriver calls
+EXTRACTION_MODES = ("script", "snapshot", "webdriver")
+# Attribute marking containers already extracted by incremental scrolling
+SEEN_MARK = "data-scrape-seen"
+
+# URL patterns blocked through DevTools for each resource type. Extraction only
+# needs the DOM: image fields read the src attribute, not the pixels.
+# Network.setBlockedURLs only matches URLs, so a "type" here is really a list of file
+# extensions: resources served without one (/image?id=1, /fonts/abc, signed CDN URLs)
+# still load. Blocking by real resource type needs Fetch.enable with resourceType
+# patterns and answering every Fetch.requestPaused event, which execute_cdp_cmd cannot
+# do; the one type-based block used is Chrome's image content setting, set at launch
+# for standalone drivers only (pooled drivers serve requests with different policies).
+RESOURCE_TYPE_PATTERNS = {
+    "images": ["png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico", "bmp"],
+    "stylesheets": ["css"],
+    "fonts": ["woff", "woff2", "ttf", "otf", "eot"],
+    "media": ["mp4", "webm", "ogg", "mp3", "wav", "m4a", "m3u8", "mpd"],
+}
+# Third-party analytics/ad domains blocked by the "strict" policy
+TRACKER_DOMAINS = [
+    "google-analytics.com", "googletagmanager.com", "googleadservices.com", "doubleclick.net",
+    "googlesyndication.com", "facebook.net", "connect.facebook.net", "hotjar.com", "segment.io",
+    "segment.com", "mixpanel.com", "scorecardresearch.com", "quantserve.com", "criteo.com",
+    "taboola.com", "outbrain.com", "newrelic.com", "nr-data.net", "clarity.ms",
+]
+RESOURCE_POLICIES = {
+    "none": {"block": [], "block_domains": []},
+    "lean": {"block": ["images", "fonts", "media"], "block_domains": []},
+    "strict": {"block": ["images", "stylesheets", "fonts", "media"], "block_domains": TRACKER_DOMAINS},
+}
+
+def resolve_resource_policy(policy):
+    """
+    Normalize a resource policy given by name ("none", "lean", "strict") or as a dict
+    {"block": [resource types], "block_domains": [domains]} (a dict may also extend a
+    named policy with "base"). Returns (blocked types, blocked URL patterns).
+    Types are blocked by file extension, see RESOURCE_TYPE_PATTERNS for what that misses.
+    """
+    if not policy:
+        policy = "none"
+    if isinstance(policy, str):
+        if policy not in RESOURCE_POLICIES:
+            raise ValueError(f"Unknown resource policy '{policy}', expected one of {', '.join(RESOURCE_POLICIES)}")
+        policy = RESOURCE_POLICIES[policy]
+    base = RESOURCE_POLICIES.get(policy.get("base", "none"), RESOURCE_POLICIES["none"])
+    blocked_types = set(base["block"]) | set(policy.get("block", []))
+    unknown = blocked_types - set(RESOURCE_TYPE_PATTERNS)
+    if unknown:
+        raise ValueError(f"Unknown resource types: {', '.join(sorted(unknown))}")
+    patterns = []
+    for resource_type in sorted(blocked_types):
+        for extension in RESOURCE_TYPE_PATTERNS[resource_type]:
+            patterns.extend([f"*.{extension}", f"*.{extension}?*"])
+    for domain in list(base["block_domains"]) + list(policy.get("block_domains", [])):
+        patterns.append(f"*://*.{domain}/*")
+        patterns.append(f"*://{domain}/*")
+    return blocked_types, patterns
+
+# Field extraction in the page, shared by the extraction scripts below. Mirrors
+# DynamicWebScraper._extract_dynamic_field_data: fields are FieldPlan dicts
+# (see FieldPlan.to_script) and plans marked "resolve" are fixed to the type that
+# produced the first value. Expects `fields` and `price` (with
+# `pricePattern`) to be defined by the script.
+EXTRACT_FIELD_JS = r"""
+const plans = fields.slice();
+
+function textOf(el) {
+    let text = (el.innerText || '').trim();
+    if (!text) {
+        text = (el.textContent || '').trim();
+    }
+    return text;
+}
+
+function query(container, selector) {
+    try {
+        return Array.from(container.querySelectorAll(selector));
+    } catch (e) {
+        return [];
+    }
+}
+
+function hasCurrency(text) {
+    return price.currencies.some(currency => text.includes(currency));
+}
+
+function priceText(elements) {
+    const candidates = [];
+    for (const el of elements) {
+        const text = textOf(el);
+        if (!text || price.non_price_labels.includes(text.toLowerCase())) {
+            continue;
+        }
+        if (pricePattern.test(text) || hasCurrency(text) || /^\d+$/.test(text.replace(/[,.]/g, ''))) {
+            candidates.push(text);
+        }
+    }
+    candidates.sort((a, b) => ((hasCurrency(a) ? 0 : 1) - (hasCurrency(b) ? 0 : 1)) || (b.length - a.length));
+    return candidates.length ? candidates[0] : '';
+}
+
+function extractField(container, field) {
+    let elements = [];
+    let selector = null;
+    for (selector of field.selectors) {
+        elements = query(container, selector);
+        if (elements.length) {
+            break;
+        }
+    }
+
+    if (field.type === 'price') {
+        return {value: priceText(elements), type: 'price', selector: selector};
+    }
+    for (const el of elements) {
+        if (field.type === 'src' || field.type === 'href') {
+            const value = el[field.type] || el.getAttribute(field.type);
+            if (value) {
+                return {value: value, type: field.type, selector: selector};
+            }
+            continue;
+        }
+        if (!field.type) {
+            const tag = el.tagName.toLowerCase();
+            if (tag === 'img' && el.src) {
+                return {value: el.src, type: 'src', selector: selector};
+            }
+            if (tag === 'a' && el.href) {
+                return {value: el.href, type: 'href', selector: selector};
+            }
+        }
+        const text = textOf(el);
+        if (text) {
+            return {value: text, type: 'text', selector: selector};
+        }
+    }
+    return {value: '', type: field.type, selector: selector};
+}
+
+function extractRow(container) {
+    return plans.map((field, i) => {
+        const result = extractField(container, field);
+        if (field.resolve && result.value) {
+            plans[i] = {name: field.name, selectors: field.selectors, type: result.type, resolve: false};
+        }
+        return result.value;
+    });
+}
+"""
+
+# Extracts every container in a single WebDriver round trip and returns rows
+# as arrays in field order. Optional start/limit arguments extract a slice.
+EXTRACT_ROWS_SCRIPT = r"""
+const containerSelector = arguments[0];
+const fields = arguments[1];
+const price = arguments[2];
+const start = arguments[3] || 0;
+const limit = arguments[4];
+const pricePattern = new RegExp(price.pattern);
+""" + EXTRACT_FIELD_JS + r"""
+const containers = document.querySelectorAll(containerSelector);
+const end = limit == null ? containers.length : Math.min(containers.length, start + limit);
+const rows = [];
+for (let i = start; i < end; i++) {
+    rows.push(extractRow(containers[i]));
+}
+return {
+    rows: rows,
+    fields: plans,
+    total: containers.length,
+    sample: containers.length && start === 0 ? containers[0].outerHTML.slice(0, 200) : ''
+};
+"""
+
+# Incremental infinite scroll: extracts only containers not seen by a previous
+# call and marks them. With prune set, processed containers are removed instead
+# and replaced by a spacer of the same height so the feed's scroll trigger and
+# the scroll position keep working while the DOM stays small.
+EXTRACT_NEW_ROWS_SCRIPT = r"""
+const containerSelector = arguments[0];
+const fields = arguments[1];
+const price = arguments[2];
+const mark = arguments[3];
+const prune = arguments[4];
+const pricePattern = new RegExp(price.pattern);
+""" + EXTRACT_FIELD_JS + r"""
+const fresh = Array.from(document.querySelectorAll(containerSelector)).filter(el => !el.hasAttribute(mark));
+const rows = fresh.map(container => extractRow(container));
+if (prune && fresh.length) {
+    let top = Infinity, bottom = -Infinity;
+    for (const el of fresh) {
+        const rect = el.getBoundingClientRect();
+        top = Math.min(top, rect.top);
+        bottom = Math.max(bottom, rect.bottom);
+    }
+    const spacerId = mark + '-spacer';
+    let spacer = document.getElementById(spacerId);
+    if (!spacer) {
+        spacer = document.createElement('div');
+        spacer.id = spacerId;
+        spacer.style.height = '0px';
+        fresh[0].parentNode.insertBefore(spacer, fresh[0]);
+    }
+    spacer.style.height = (parseFloat(spacer.style.height) + Math.max(0, bottom - top)) + 'px';
+    fresh.forEach(el => el.remove());
+} else {
+    fresh.forEach(el => el.setAttribute(mark, '1'));
+}
+return {rows: rows, fields: plans, remaining: document.querySelectorAll(containerSelector).length};
+"""
+
+@lru_cache(maxsize=512)
+def _compile_css(selector: str, prefix: str = "descendant::"):
+    """Compile a CSS selector to an lxml XPath; descendant:: matches like querySelectorAll"""
+    return etree.XPath(HTMLTranslator().css_to_xpath(selector, prefix=prefix))
+
+def _snapshot_select(node, selector: str, prefix: str = "descendant::"):
+    try:
+        return _compile_css(selector, prefix)(node)
+    except Exception:
+        return []
+
+def _snapshot_text(element):
+    # Collapse whitespace like the rendered innerText would
+    return " ".join(element.text_content().split())
+
+def _select_price_text(texts):
+    """Pick the most likely price out of candidate texts, mirroring the Selenium heuristics"""
+    candidates = []
+    for text in texts:
+        if not text or text.lower() in NON_PRICE_LABELS:
+            continue
+        if PRICE_REGEX.search(text) or any(currency in text for currency in CURRENCY_MARKERS):
+            candidates.append(text)
+        elif text.replace(',', '').replace('.', '').isdigit():
+            candidates.append(text)
+    candidates.sort(key=lambda text: (
+        0 if any(currency in text for currency in CURRENCY_MARKERS) else 1,
+        -len(text)
+    ))
+    return candidates[0] if candidates else ''
+
+class FieldPlan:
+    """
+    How one custom field is extracted, worked out once per spec instead of per container.
+
+    type is None for the per-container heuristic (img src, link href, else text) or
+    one of "text", "href", "src", "price". selectors lists the field selector plus,
+    for prices, the alternative price selectors to fall back on, tried in order for
+    every container. A plan with resolve set is replaced by resolved() once a
+    container yields a value, so the remaining containers skip the img/link/text
+    guessing and are read with a fixed type.
+    """
+
+    __slots__ = ("name", "selectors", "type", "resolve")
+
+    def __init__(self, name, selectors, type=None, resolve=False):
+        self.name = name
+        self.selectors = tuple(selectors)
+        self.type = type
+        self.resolve = resolve
+
+    @classmethod
+    def from_field(cls, field):
+        """Plan of a {"name", "selector", "type" (optional)} field; fields without a type keep the per-container heuristics"""
+        declared = field.get("type")
+        if declared is not None and declared not in FIELD_TYPES:
+            raise ValueError(f"Unknown type '{declared}' for field '{field['name']}', expected one of {', '.join(FIELD_TYPES)}")
+        is_price = declared == "price" or (declared in (None, "auto") and field["name"].lower() in PRICE_FIELD_NAMES)
+        selectors = [field["selector"]] + (ALTERNATIVE_PRICE_SELECTORS if is_price else [])
+        field_type = "price" if is_price else (None if declared == "auto" else declared)
+        # Typed plans are final; auto plans are fixed to the type of the first value they find
+        return cls(field["name"], selectors, field_type, resolve=field_type is None and declared == "auto")
+
+    def resolved(self, field_type):
+        # The selectors stay: a fallback matching in one container says nothing about the next
+        return FieldPlan(self.name, self.selectors, field_type)
+
+    def to_script(self):
+        return {"name": self.name, "selectors": list(self.selectors), "type": self.type, "resolve": self.resolve}
+
+@lru_cache(maxsize=256)
+def _compile_field_plans(fields_key):
+    return tuple(
+        FieldPlan.from_field({"name": name, "selector": selector, "type": field_type})
+        for name, selector, field_type in fields_key
+    )
+
+def compile_field_plans(custom_fields):
+    """FieldPlans of custom_fields, compiled once per distinct spec (and process). Returns a fresh list to resolve in."""
+    return list(_compile_field_plans(tuple((field["name"], field["selector"], field.get("type")) for field in custom_fields)))
+
+def _extract_snapshot_field(container, plan, base_url):
+    """Offline counterpart of DynamicWebScraper._extract_dynamic_field_data; returns (value, type, selector)"""
+    elements, selector = [], None
+    for selector in plan.selectors:
+        elements = _snapshot_select(container, selector)
+        if elements:
+            break
+    if plan.type == "price":
+        return _select_price_text(_snapshot_text(element) for element in elements), "price", selector
+    for element in elements:
+        if plan.type in ("src", "href"):
+            if element.get(plan.type):
+                return urljoin(base_url, element.get(plan.type)), plan.type, selector
+            continue
+        if plan.type is None:
+            tag = element.tag.lower() if isinstance(element.tag, str) else ''
+            if tag == 'img' and element.get('src'):
+                return urljoin(base_url, element.get('src')), "src", selector
+            if tag == 'a' and element.get('href'):
+                return urljoin(base_url, element.get('href')), "href", selector
+        text = _snapshot_text(element)
+        if text:
+            return text, "text", selector
+    return '', plan.type, selector
+
+def extract_row(container, plans, extract):
+    """
+    Values of one container in field order. extract(container, plan) returns
+    (value, type, selector); plans still to be resolved are replaced in place
+    once they produced a value.
+    """
+    values = []
+    for i, plan in enumerate(plans):
+        value, field_type, _ = extract(container, plan)
+        if plan.resolve and value:
+            plans[i] = plan.resolved(field_type)
+        values.append(value)
+    return values
+
+def extract_columns_from_html(html: str, container_selector: str, custom_fields: list, base_url: str = ""):
+    """
+    Run the container/field extraction against an HTML snapshot with lxml.
+    Returns a dict of column lists keyed by field name. Pure function, safe to run in a process pool.
+    """
+    data = {field["name"]: [] for field in custom_fields}
+    if not html:
+        return data
+    document = lxml_html.fromstring(html)
+    containers = _snapshot_select(document, container_selector, prefix="descendant-or-self::")
+    logger.info(f"Found {len(containers)} containers in HTML snapshot")
+    plans = compile_field_plans(custom_fields)
+    columns = list(data.values())
+    extract = lambda container, plan: _extract_snapshot_field(container, plan, base_url)
+    for container in containers:
+        for column, value in zip(columns, extract_row(container, plans, extract)):
+            column.append(value)
+    return data
+
+def records_from_columns(data):
+    """Convert a dict of column lists to the list of non-empty row dicts returned by the API"""
+    return ResultTable.from_columns(data).records()
+
+def extract_records_from_html(html: str, container_selector: str, custom_fields: list, base_url: str = ""):
+    """Snapshot extraction returning the same list of dicts as scrape_dynamic_data"""
+    data = extract_columns_from_html(html, container_selector, custom_fields, base_url)
+    return records_from_columns(data)
+
+def _parse_static_html(html: str):
+    """Extract the page title and a text snippet from raw HTML"""
+    soup = BeautifulSoup(html, "html.parser")
+    title = soup.title.string if soup.title else "No title found"
+    text = soup.get_text(separator=" ", strip=True)
+    snippet = text[:200] + "..." if len(text) > 200 else text
+    return {
+        "title": title,
+        "snippet": snippet
+    }
+
+# Shared keep-alive connection pool for the synchronous static path
+http_session = requests.Session()
+
 def scrape_data(url: str):
     """
     Scrapes data from the given URL and returns the page title and a text snippet.
     """
     try:
-        response = requests.get(url, timeout=10)
+        response = http_session.get(url, timeout=10)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-        title = soup.title.string if soup.title else "No title found"
-        text = soup.get_text(separator=" ", strip=True)
-        snippet = text[:200] + "..." if len(text) > 200 else text
-        return {
-            "title": title,
-            "snippet": snippet
-        }
+        return _parse_static_html(response.text)
+    except Exception as e:
+        return {"error": str(e)}
+
+async def scrape_data_conditional(url: str, client, etag: str = None, last_modified: str = None):
+    """
+    Async static scrape that can revalidate a cached copy with ETag/Last-Modified.
+    Returns (result, validators); result is None when the server answered 304 Not Modified.
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    response = await client.get(url, headers=headers, timeout=10, follow_redirects=True)
+    validators = {
+        "etag": response.headers.get("etag"),
+        "last_modified": response.headers.get("last-modified"),
+    }
+    if response.status_code == 304 and headers:
+        return None, validators
+    response.raise_for_status()
+    return await asyncio.to_thread(_parse_static_html, response.text), validators
+
+async def scrape_data_async(url: str, client):
+    """
+    Async variant of scrape_data using a shared httpx.AsyncClient.
+    HTML parsing runs in a worker thread so the event loop stays responsive.
+    """
+    try:
+        result, _ = await scrape_data_conditional(url, client)
+        return result
     except Exception as e:
         return {"error": str(e)}
 
+def build_page_url(url: str, page_param: str, page: int):
+    """URL parameter pagination: replace any *page query parameter of url with page_param=page"""
+    base_url = url.split('?')[0]
+    params = {}
+    if '?' in url:
+        query_string = url.split('?')[1]
+        for param in query_string.split('&'):
+            if '=' in param:
+                key, value = param.split('=', 1)
+                if not key.endswith('page'):
+                    params[key] = value
+
+    params[page_param] = str(page)
+    return base_url + '?' + '&'.join([f"{k}={v}" for k, v in params.items()])
+
 class DynamicWebScraper:
-    def __init__(self, delay=2, timeout=10, max_retries=3, proxy=None, scroll_pause_time=2):
+    def __init__(self, delay=2, timeout=10, max_retries=3, proxy=None, scroll_pause_time=2,
+                 fixed_delays=False, extraction_mode="script", resource_policy=None,
+                 page_load_strategy="normal"):
         self.delay = delay
         self.timeout = timeout
         self.max_retries = max_retries
         self.proxy = proxy
         self.driver = None
+        self.navigations = 0
         self.scroll_pause_time = scroll_pause_time
+        # Politeness/stealth option: keep the historical fixed random sleeps
+        # instead of returning as soon as the page signals readiness
+        self.fixed_delays = fixed_delays
+        # See EXTRACTION_MODES
+        if extraction_mode not in EXTRACTION_MODES:
+            raise ValueError(f"Unknown extraction mode '{extraction_mode}', expected one of {', '.join(EXTRACTION_MODES)}")
+        self.extraction_mode = extraction_mode
+        # Resources (images, stylesheets, fonts, media, tracker domains) the browser must not load
+        self.blocked_resource_types, self.blocked_url_patterns = resolve_resource_policy(resource_policy)
+        self._policy_applied_to = None
+        # "eager" returns from driver.get at DOMContentLoaded instead of waiting for every resource
+        self.page_load_strategy = page_load_strategy
+        self._page_readiness = None
+        # Field plans sent to (and resolved by) the extraction scripts on the current page
+        self._script_fields = None
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -51,6 +506,7 @@ class DynamicWebScraper:
 
     def setup_driver(self):
         """Configure and initialize Chrome WebDriver with stealth settings"""
+        started = time.perf_counter()
         try:
             logger.info("Setting up Chrome WebDriver with stealth configuration...")
             chrome_options = Options()
@@ -59,6 +515,13 @@ class DynamicWebScraper:
             chrome_options.add_argument("--disable-dev-shm-usage")
             chrome_options.add_argument("--disable-gpu")
             chrome_options.add_argument(f"user-agent={random.choice(self.user_agents)}")
+            # DevTools network events let PageReadiness detect network idle
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+            chrome_options.page_load_strategy = self.page_load_strategy
+            if "images" in self.blocked_resource_types:
+                chrome_options.add_experimental_option(
+                    "prefs", {"profile.managed_default_content_settings.images": 2}
+                )
 
             if self.proxy:
                 chrome_options.add_argument(f'--proxy-server={self.proxy}')
@@ -82,6 +545,7 @@ class DynamicWebScraper:
 
             self.driver.set_page_load_timeout(self.timeout)
             logger.info("Chrome WebDriver initialized successfully with stealth mode")
+            record_phase("driver_setup", time.perf_counter() - started)
             return True
         except Exception as e:
             logger.error(f"Failed to initialize Chrome WebDriver: {str(e)}")
@@ -97,6 +561,50 @@ class DynamicWebScraper:
 
             raise
 
+    @property
+    def readiness(self):
+        """PageReadiness bound to the current driver (drivers may be swapped in by a pool)"""
+        if self._page_readiness is None or self._page_readiness.driver is not self.driver:
+            capabilities = getattr(self.driver, "capabilities", None) or {}
+            self._page_readiness = PageReadiness(
+                self.driver,
+                timeout=max(self.timeout, 20),
+                accept_interactive=capabilities.get("pageLoadStrategy") == "eager",
+            )
+        return self._page_readiness
+
+    def _apply_resource_policy(self):
+        """Install the blocked URL patterns on the current driver through DevTools.
+
+        Always applied (even when empty) so a pooled driver never keeps the
+        previous borrower's policy.
+        """
+        if self._policy_applied_to is self.driver:
+            return
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_url_patterns})
+            if self.blocked_url_patterns:
+                logger.info(f"Blocking {len(self.blocked_url_patterns)} URL patterns ({', '.join(sorted(self.blocked_resource_types)) or 'domains only'})")
+        except Exception as e:
+            logger.warning(f"Could not apply resource policy: {str(e)}")
+        self._policy_applied_to = self.driver
+
+    def _navigate(self, url, container_selector=None, fixed_wait=(2, 4)):
+        """Load url and wait until it is ready (or the fixed delay has elapsed)"""
+        self._apply_resource_policy()
+        # Field plans are resolved against each page's own markup
+        self._script_fields = None
+        self.readiness.begin_navigation()
+        with phase("navigation"):
+            self.driver.get(url)
+        self.navigations += 1
+        with phase("readiness"):
+            if self.fixed_delays:
+                time.sleep(random.uniform(*fixed_wait))  # Wait for page load
+            else:
+                self.readiness.wait_until_ready(container_selector)
+
     def _scroll_page(self, max_scrolls=5):
         """Scroll the page to load more content"""
         try:
@@ -105,16 +613,22 @@ class DynamicWebScraper:
             logger.info(f"Starting page scroll with max_scrolls={max_scrolls}")
 
             while scroll_count < max_scrolls:
+                scroll_started = time.perf_counter()
                 # Scroll down to bottom
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                logger.info(f"Performed scroll {scroll_count + 1}/{max_scrolls}")
+                logger.debug(f"Performed scroll {scroll_count + 1}/{max_scrolls}")
 
                 # Wait for new content to load
-                time.sleep(self.scroll_pause_time)
-                logger.info(f"Waited {self.scroll_pause_time} seconds for content to load")
+                if self.fixed_delays:
+                    time.sleep(self.scroll_pause_time)
+                    logger.debug(f"Waited {self.scroll_pause_time} seconds for content to load")
 
-                # Calculate new scroll height
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
+                    # Calculate new scroll height
+                    new_height = self.driver.execute_script("return document.body.scrollHeight")
+                else:
+                    # Return as soon as the height grows and settles, scroll_pause_time at most
+                    new_height = self.readiness.wait_for_scroll_height_change(last_height, self.scroll_pause_time)
+                record_phase("scroll", time.perf_counter() - scroll_started)
 
                 # Break if no more new content (height didn't change)
                 if new_height == last_height:
@@ -123,7 +637,7 @@ class DynamicWebScraper:
 
                 last_height = new_height
                 scroll_count += 1
-                logger.info(f"Page height changed from {last_height} to {new_height}")
+                logger.debug(f"Page height changed from {last_height} to {new_height}")
 
             logger.info(f"Completed scrolling with {scroll_count} scrolls performed")
             return True
@@ -131,7 +645,7 @@ class DynamicWebScraper:
             logger.error(f"Error while scrolling: {str(e)}")
             return False
 
-    def _make_dynamic_request(self, url, enable_scrolling=False, max_scrolls=5):
+    def _make_dynamic_request(self, url, enable_scrolling=False, max_scrolls=5, container_selector=None):
         """Load page with Selenium and wait for dynamic content"""
         try:
             logger.info(f"Making dynamic request to {url}")
@@ -139,9 +653,9 @@ class DynamicWebScraper:
                 logger.info("WebDriver not initialized. Initializing now...")
                 self.setup_driver()
 
-            self.driver.get(url)
             logger.info("Waiting for page to fully load...")
-            time.sleep(random.uniform(5, 8))  # Increased wait time for JavaScript execution
+            # Increased fixed wait time for JavaScript execution when fixed_delays is on
+            self._navigate(url, container_selector, fixed_wait=(5, 8))
 
             if enable_scrolling:
                 logger.info("Scrolling enabled, starting scroll process...")
@@ -152,162 +666,303 @@ class DynamicWebScraper:
             logger.error(f"Failed to load URL dynamically: {str(e)}")
             return False
 
-    def _extract_dynamic_field_data(self, container, field):
-        """Extract data from dynamic page using Selenium selectors"""
+    def _element_text(self, element):
+        text = element.text.strip()
+        if not text:
+            # Use JavaScript to get text content as a fallback
+            text = self.driver.execute_script("return arguments[0].textContent;", element).strip()
+        return text
+
+    def _extract_dynamic_field_data(self, container, plan):
+        """
+        Extract one field (a FieldPlan) from a container using Selenium selectors.
+        Returns (value, type, selector) like the extraction script.
+        """
         try:
-            # Try multiple ways to find the element
-            elements = container.find_elements(By.CSS_SELECTOR, field["selector"])
-            
-            # If no elements found with the direct selector, try a more generic approach
-            if not elements and field["name"].lower() in ["price", "cost", "amount"]:
-                logger.info(f"No elements found with selector '{field['selector']}', trying alternative price selectors")
-                # Common price selectors that might work
-                alternative_selectors = [
-                    ".prc", "span.prc", "div.prc", 
-                    ".price", "span.price", "div.price", 
-                    "*[class*='price']", "*[class*='prc']",
-                    ".current-price", ".product-price"
-                ]
-                
-                for alt_selector in alternative_selectors:
-                    elements = container.find_elements(By.CSS_SELECTOR, alt_selector)
-                    if elements:
-                        logger.info(f"Found elements using alternative selector: {alt_selector}")
-                        break
-            
-            # Process found elements
-            data = []
-            
+            # Try the field selector first, then (for prices) the alternative selectors
+            elements, selector = [], None
+            for selector in plan.selectors:
+                elements = container.find_elements(By.CSS_SELECTOR, selector)
+                if elements:
+                    break
+            if selector != plan.selectors[0] and elements:
+                logger.debug(f"Found elements for '{plan.name}' using alternative selector: {selector}")
+
             # Special handling for price fields to filter out non-price text
-            if field["name"].lower() in ["price", "cost", "amount"]:
-                price_pattern = r'(?:(?:USD|Ksh|KSh|KES|Sh|$|£|€|Rs)\.?\s?)([\d,]+(?:\.\d+)?)|^[\d,]+(?:\.\d+)?$'
-                price_elements = []
-                
-                for element in elements:
-                    # Get text from element
-                    text = element.text.strip()
-                    if not text:
-                        text = self.driver.execute_script("return arguments[0].textContent;", element).strip()
-                    
-                    # Skip empty elements or common non-price labels
-                    if not text or text.lower() in ['sold', 'top seller', 'bestseller', 'sale', 'discount']:
-                        continue
-                    
-                    # Check if text contains currency symbols or follows price format
-                    if re.search(price_pattern, text) or any(currency in text for currency in ['Ksh', 'KSh', '$', '£', '€']):
-                        price_elements.append((element, text))
-                    elif text.replace(',', '').replace('.', '').isdigit():
-                        # Text that's just a number is likely a price without currency symbol
-                        price_elements.append((element, text))
-                
-                logger.info(f"Found {len(price_elements)} potential price elements")
-                
-                # If we have price candidates, choose the most likely one
-                if price_elements:
-                    # Sort by priority:
-                    # 1. Elements with currency symbols first
-                    # 2. Longer textual content (often contains more price info)
-                    price_elements.sort(key=lambda x: (
-                        0 if any(currency in x[1] for currency in ['Ksh', 'KSh', '$', '£', '€']) else 1,
-                        -len(x[1])
-                    ))
-                    
-                    chosen_element, chosen_text = price_elements[0]
-                    logger.info(f"Selected price element with text: {chosen_text}")
-                    data.append(chosen_text)
-            else:
-                # Regular processing for non-price fields
-                for element in elements:
+            if plan.type == "price":
+                value = _select_price_text(self._element_text(element) for element in elements)
+                logger.debug(f"Selected price text for '{plan.name}': {value}")
+                return value, "price", selector
+
+            for element in elements:
+                if plan.type in ("src", "href"):
+                    value = element.get_attribute(plan.type)
+                    if value:
+                        return value, plan.type, selector
+                    continue
+                if plan.type is None:
                     if element.tag_name == 'img' and element.get_attribute('src'):
-                        data.append(element.get_attribute('src'))
-                    elif element.tag_name == 'a' and element.get_attribute('href'):
-                        data.append(element.get_attribute('href'))
-                    else:
-                        # Use JavaScript to get text content as a fallback
-                        text = element.text.strip()
-                        if not text:
-                            text = self.driver.execute_script("return arguments[0].textContent;", element).strip()
-                        if text:
-                            data.append(text)
-            
-            if data:
-                logger.info(f"Successfully extracted data for field '{field['name']}': {data[0]}")
-                return data[0]
-            else:
-                logger.warning(f"No data found for field '{field['name']}' in container")
-                return ''
+                        return element.get_attribute('src'), "src", selector
+                    if element.tag_name == 'a' and element.get_attribute('href'):
+                        return element.get_attribute('href'), "href", selector
+                text = self._element_text(element)
+                if text:
+                    return text, "text", selector
+
+            logger.debug(f"No data found for field '{plan.name}' in container")
+            return '', plan.type, selector
         except Exception as e:
-            logger.error(f"Error extracting dynamic field data for '{field['name']}': {str(e)}")
-            return ''
+            logger.error(f"Error extracting dynamic field data for '{plan.name}': {str(e)}")
+            return '', plan.type, None
+
+    def _collect_rows_webdriver(self, containers, custom_fields, data):
+        """Extract field values container by container through individual WebDriver calls"""
+        plans = compile_field_plans(custom_fields)
+        columns = [data[field["name"]] for field in custom_fields]
+        for i, container in enumerate(containers):
+            logger.debug(f"Processing container {i+1}/{len(containers)}")
+            for column, value in zip(columns, extract_row(container, plans, self._extract_dynamic_field_data)):
+                column.append(value)
+
+    def _script_arguments(self, custom_fields):
+        """
+        (fields, price_config) arguments shared by the extraction scripts. Plans the
+        scripts resolved on this page are reused, so later chunks and scrolls skip
+        the fallback selectors.
+        """
+        price_config = {
+            "pattern": PRICE_PATTERN,
+            "currencies": CURRENCY_MARKERS,
+            "non_price_labels": NON_PRICE_LABELS,
+        }
+        if self._script_fields is None:
+            self._script_fields = [plan.to_script() for plan in compile_field_plans(custom_fields)]
+        return self._script_fields, price_config
+
+    def _run_script(self, script, *arguments):
+        """Run an extraction script and keep the field plans it resolved"""
+        result = self.driver.execute_script(script, *arguments) or {}
+        if result.get("fields"):
+            self._script_fields = result["fields"]
+        return result
+
+    def _run_extract_script(self, container_selector, custom_fields, start=0, limit=None):
+        """Run EXTRACT_ROWS_SCRIPT over all (or a slice of the) containers"""
+        fields, price_config = self._script_arguments(custom_fields)
+        return self._run_script(EXTRACT_ROWS_SCRIPT, container_selector, fields, price_config, start, limit)
+
+    def _extract_new_rows(self, container_selector, custom_fields, prune_dom=False):
+        """Rows of the containers not extracted yet (EXTRACT_NEW_ROWS_SCRIPT)"""
+        fields, price_config = self._script_arguments(custom_fields)
+        result = self._run_script(EXTRACT_NEW_ROWS_SCRIPT, container_selector, fields, price_config, SEEN_MARK, prune_dom)
+        return result.get("rows", [])
+
+    def _collect_rows_script(self, container_selector, custom_fields, data):
+        """Extract all containers with one injected script call; returns the container count"""
+        result = self._run_extract_script(container_selector, custom_fields)
+        rows = result.get("rows", [])
+        logger.info(f"Found {len(rows)} dynamic containers")
+        if result.get("sample"):
+            logger.info(f"First container HTML structure sample: {result['sample']}...")
+        for row in rows:
+            for field, value in zip(custom_fields, row):
+                data[field["name"]].append(value or '')
+        return len(rows)
 
     def _process_dynamic_page_data(self, container_selector, custom_fields):
         """Process and extract data from dynamic page"""
         data = {field["name"]: [] for field in custom_fields}
         try:
             logger.info("Waiting for containers to be present...")
-            WebDriverWait(self.driver, 20).until(  # Increased timeout to 20 seconds
-                EC.presence_of_element_located((By.CSS_SELECTOR, container_selector))
-            )
+            with phase("container_discovery"):
+                WebDriverWait(self.driver, 20).until(  # Increased timeout to 20 seconds
+                    EC.presence_of_element_located((By.CSS_SELECTOR, container_selector))
+                )
+
+            extraction_started = time.perf_counter()
+            if self.extraction_mode == "script":
+                container_count = self._collect_rows_script(container_selector, custom_fields, data)
+            elif self.extraction_mode == "snapshot":
+                data = extract_columns_from_html(
+                    self.driver.page_source, container_selector, custom_fields, self.driver.current_url
+                )
+                container_count = len(next(iter(data.values()), []))
+            else:
+                containers = self.driver.find_elements(By.CSS_SELECTOR, container_selector)
+                logger.info(f"Found {len(containers)} dynamic containers")
+
+                # Extract and log HTML structure of the first container for debugging
+                if containers:
+                    first_container_html = self.driver.execute_script("return arguments[0].outerHTML;", containers[0])
+                    logger.info(f"First container HTML structure sample: {first_container_html[:200]}...")
+
+                # Process each container
+                self._collect_rows_webdriver(containers, custom_fields, data)
+                container_count = len(containers)
+            record_phase("extraction", time.perf_counter() - extraction_started)
 
-            containers = self.driver.find_elements(By.CSS_SELECTOR, container_selector)
-            logger.info(f"Found {len(containers)} dynamic containers")
-            
-            # Extract and log HTML structure of the first container for debugging
-            if containers:
-                first_container_html = self.driver.execute_script("return arguments[0].outerHTML;", containers[0])
-                logger.info(f"First container HTML structure sample: {first_container_html[:200]}...")
-
-            # Process each container
-            success_count = {field["name"]: 0 for field in custom_fields}
-            for i, container in enumerate(containers):
-                logger.info(f"Processing container {i+1}/{len(containers)}")
-                for field in custom_fields:
-                    try:
-                        field_value = self._extract_dynamic_field_data(container, field)
-                        data[field["name"]].append(field_value)
-                        if field_value:
-                            success_count[field["name"]] += 1
-                    except Exception as e:
-                        logger.error(f"Error processing field {field['name']} in container {i+1}: {str(e)}")
-                        data[field["name"]].append('')
-            
             # Log success rates for each field
-            for field_name, count in success_count.items():
-                success_rate = (count / len(containers)) * 100 if containers else 0
-                logger.info(f"Field '{field_name}' extraction success rate: {success_rate:.2f}% ({count}/{len(containers)})")
-
-            # Create DataFrame and clean empty cells
-            df = pd.DataFrame(data)
-            # Remove rows where all values are empty strings or None
-            df = df.dropna(how='all')
-            # Remove rows where all values are empty strings
-            df = df[~(df.astype(str).apply(lambda x: x.str.strip() == '').all(axis=1))]
-            # Reset index after filtering
-            df = df.reset_index(drop=True)
-            return df
+            rates = {}
+            for field in custom_fields:
+                count = sum(1 for value in data[field["name"]] if value)
+                success_rate = (count / container_count) * 100 if container_count else 0
+                rates[field["name"]] = success_rate / 100
+                logger.info(f"Field '{field['name']}' extraction success rate: {success_rate:.2f}% ({count}/{container_count})")
+            if container_count:
+                observe_fill_rates(rates, "dynamic")
+
+            # Drop rows without any value in a single pass
+            return ResultTable.from_columns(data)
+        except Exception as e:
+            logger.error(f"Error processing dynamic page data: {str(e)}")
+            return ResultTable(field["name"] for field in custom_fields)
+
+    def iter_dynamic_page_rows(self, container_selector, custom_fields, chunk_size=25):
+        """Yield non-empty row dicts from the loaded page as containers are extracted"""
+        try:
+            logger.info("Waiting for containers to be present...")
+            with phase("container_discovery"):
+                WebDriverWait(self.driver, 20).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, container_selector))
+                )
         except Exception as e:
             logger.error(f"Error processing dynamic page data: {str(e)}")
-            return pd.DataFrame()
+            return
 
-    def scrape_dynamic_page(self, url, container_selector, custom_fields, enable_scrolling=False, max_scrolls=5):
-        """Scrape data from a dynamic page"""
+        if self.extraction_mode == "webdriver":
+            plans = compile_field_plans(custom_fields)
+            names = [field["name"] for field in custom_fields]
+            for container in self.driver.find_elements(By.CSS_SELECTOR, container_selector):
+                values = extract_row(container, plans, self._extract_dynamic_field_data)
+                if not is_empty_row(values):
+                    yield dict(zip(names, values))
+            return
+
+        # Script mode, one round trip per chunk of containers
+        start = 0
+        while True:
+            result = self._run_extract_script(container_selector, custom_fields, start, chunk_size)
+            rows = result.get("rows", [])
+            for values in rows:
+                row = {field["name"]: value or '' for field, value in zip(custom_fields, values)}
+                if not is_empty_row(row.values()):
+                    yield row
+            start += len(rows)
+            if not rows or start >= result.get("total", 0):
+                break
+        logger.info(f"Streamed rows from {start} dynamic containers")
+
+    def iter_scroll_rows(self, container_selector, custom_fields, max_scrolls=5, target_rows=None,
+                         time_budget=None, prune_dom=False, dedupe_fields=None):
+        """
+        Incremental infinite scroll: extract the containers that appeared after each
+        scroll and yield new, non-empty row dicts. Rows are de-duplicated across
+        scrolls on dedupe_fields (all fields by default). Stops after max_scrolls,
+        at target_rows, when time_budget seconds have passed or when a scroll brings
+        no new containers. Rows yielded before a failure are kept.
+        """
+        started = time.monotonic()
+        names = [field["name"] for field in custom_fields]
+        key_indexes = [names.index(name) for name in dedupe_fields] if dedupe_fields else list(range(len(names)))
+        seen = set()
+        produced = duplicates = scrolls = 0
+        try:
+            logger.info("Waiting for containers to be present...")
+            with phase("container_discovery"):
+                WebDriverWait(self.driver, 20).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, container_selector))
+                )
+            while True:
+                with phase("extraction"):
+                    rows = self._extract_new_rows(container_selector, custom_fields, prune_dom)
+                for values in rows:
+                    values = [value or '' for value in values]
+                    if is_empty_row(values):
+                        continue
+                    key = tuple(values[i] for i in key_indexes)
+                    if key in seen:
+                        duplicates += 1
+                        continue
+                    seen.add(key)
+                    produced += 1
+                    yield dict(zip(names, values))
+                    if target_rows and produced >= target_rows:
+                        logger.info(f"Reached target of {target_rows} rows")
+                        return
+
+                if scrolls >= max_scrolls:
+                    break
+                elapsed = time.monotonic() - started
+                if time_budget is not None and elapsed >= time_budget:
+                    logger.info(f"Time budget of {time_budget} seconds used up")
+                    break
+
+                scroll_started = time.perf_counter()
+                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                if self.fixed_delays:
+                    time.sleep(self.scroll_pause_time)
+                    max_wait = 0
+                else:
+                    max_wait = self.scroll_pause_time
+                    if time_budget is not None:
+                        max_wait = max(0, min(max_wait, time_budget - elapsed))
+                new_containers = self.readiness.wait_for_new_containers(container_selector, SEEN_MARK, max_wait)
+                record_phase("scroll", time.perf_counter() - scroll_started)
+                scrolls += 1
+                logger.debug(f"Scroll {scrolls}/{max_scrolls} revealed {new_containers} new containers")
+                if not new_containers:
+                    logger.info("No new containers after scrolling, reached end of feed")
+                    break
+        except Exception as e:
+            logger.error(f"Error during incremental scroll extraction: {str(e)}")
+        finally:
+            logger.info(
+                f"Incremental scroll extracted {produced} rows over {scrolls} scrolls "
+                f"({duplicates} duplicates skipped)"
+            )
+
+    def scrape_dynamic_page(self, url, container_selector, custom_fields, enable_scrolling=False, max_scrolls=5,
+                            incremental=None):
+        """
+        Scrape data from a dynamic page. With enable_scrolling and an incremental
+        options dict (see iter_scroll_rows) rows are extracted after every scroll.
+        """
         try:
             logger.info(f"Starting dynamic scrape for URL: {url}")
-            if self._make_dynamic_request(url, enable_scrolling, max_scrolls):
+            if enable_scrolling and incremental is not None:
+                table = ResultTable(field["name"] for field in custom_fields)
+                if self._make_dynamic_request(url, False, max_scrolls, container_selector):
+                    for row in self.iter_scroll_rows(container_selector, custom_fields, max_scrolls, **incremental):
+                        table.append(row.values())
+                return table
+            if self._make_dynamic_request(url, enable_scrolling, max_scrolls, container_selector):
                 return self._process_dynamic_page_data(container_selector, custom_fields)
-            return pd.DataFrame()
         except Exception as e:
             logger.error(f"Error in dynamic page scraping: {str(e)}")
-            return pd.DataFrame()
+        return ResultTable(field["name"] for field in custom_fields)
 
     def scrape_dynamic_with_pagination(self, url, container_selector, custom_fields, 
                                      start_page, end_page, pagination_type, page_param=None, 
                                      session_id=None, enable_scrolling=False, max_scrolls=5,
-                                     next_button_selector=None):
+                                     next_button_selector=None, keep_driver=False):
         """Scrape data from dynamic pages with pagination"""
-        all_data = []
-        current_url = url
+        all_data = ResultTable(field["name"] for field in custom_fields)
+        for _, page_table in self.iter_pagination_pages(
+            url, container_selector, custom_fields, start_page, end_page, pagination_type,
+            page_param=page_param, enable_scrolling=enable_scrolling, max_scrolls=max_scrolls,
+            next_button_selector=next_button_selector, keep_driver=keep_driver
+        ):
+            all_data.extend(page_table)
+
+        # Every page is already cleaned and appended in order
+        if not all_data.empty:
+            logger.info(f"Total records scraped: {len(all_data)}")
+        return all_data
 
+    def iter_pagination_pages(self, url, container_selector, custom_fields, start_page, end_page,
+                              pagination_type, page_param=None, enable_scrolling=False, max_scrolls=5,
+                              next_button_selector=None, keep_driver=False):
+        """Generator of (page, ResultTable) as pages are scraped; stops at the first empty page"""
         try:
             # Initialize WebDriver once for the entire pagination process
             logger.info("Setting up WebDriver for pagination...")
@@ -316,8 +971,7 @@ class DynamicWebScraper:
 
             # Make initial request
             logger.info(f"Making initial request to {url}")
-            self.driver.get(url)
-            time.sleep(random.uniform(2, 4))  # Initial page load
+            self._navigate(url, container_selector)
 
             for page in range(start_page, end_page + 1):
                 logger.info(f"Processing page {page}")
@@ -326,11 +980,11 @@ class DynamicWebScraper:
                     self._scroll_page(max_scrolls)
 
                 # Extract data from current page
-                page_df = self._process_dynamic_page_data(container_selector, custom_fields)
+                page_table = self._process_dynamic_page_data(container_selector, custom_fields)
 
-                if not page_df.empty:
-                    all_data.append(page_df)
-                    logger.info(f"Successfully scraped {len(page_df)} records from page {page}")
+                if not page_table.empty:
+                    logger.info(f"Successfully scraped {len(page_table)} records from page {page}")
+                    yield page, page_table
                 else:
                     logger.warning(f"No data found on page {page}")
                     break
@@ -338,23 +992,10 @@ class DynamicWebScraper:
                 # Don't try to go to next page if we're on the last page
                 if page < end_page:
                     if pagination_type == "URL Parameter":
-                        # URL parameter pagination logic remains unchanged
-                        base_url = url.split('?')[0]
-                        params = {}
-                        if '?' in url:
-                            query_string = url.split('?')[1]
-                            for param in query_string.split('&'):
-                                if '=' in param:
-                                    key, value = param.split('=')
-                                    if not key.endswith('page'):
-                                        params[key] = value
-
-                        params[page_param] = str(page + 1)
-                        next_url = base_url + '?' + '&'.join([f"{k}={v}" for k, v in params.items()])
+                        next_url = build_page_url(url, page_param, page + 1)
 
                         logger.info(f"Navigating to next page: {next_url}")
-                        self.driver.get(next_url)
-                        time.sleep(random.uniform(2, 4))  # Wait for page load
+                        self._navigate(next_url, container_selector)
 
                     elif pagination_type == "Next Button":
                         try:
@@ -367,10 +1008,12 @@ class DynamicWebScraper:
                             if not next_button.is_displayed():
                                 logger.info("Next button found but not visible, scrolling into view")
                                 self.driver.execute_script("arguments[0].scrollIntoView(true);", next_button)
-                                time.sleep(1)  # Wait for scroll to complete
+                                if self.fixed_delays:
+                                    time.sleep(1)  # Wait for scroll to complete
 
                             logger.info("Clicking next button...")
                             next_button.click()
+                            self.navigations += 1
                             logger.info("Clicked next button, waiting for new page to load...")
 
                             # Wait for the container on the new page to be present
@@ -378,50 +1021,250 @@ class DynamicWebScraper:
                                 EC.presence_of_element_located((By.CSS_SELECTOR, container_selector))
                             )
 
-                            time.sleep(2)  # Wait for any animations to complete
+                            if self.fixed_delays:
+                                time.sleep(2)  # Wait for any animations to complete
+                            else:
+                                self.readiness.wait_for_containers(container_selector)
 
                         except Exception as e:
                             logger.error(f"Error navigating to next page: {str(e)}")
                             break
 
-                time.sleep(random.uniform(self.delay, self.delay + 2))
+                if self.fixed_delays:
+                    time.sleep(random.uniform(self.delay, self.delay + 2))
 
         except Exception as e:
             logger.error(f"Error in pagination scraping: {str(e)}")
         finally:
-            if self.driver:
+            # Borrowed (pooled) drivers are left open for their owner to release
+            if self.driver and not keep_driver:
                 logger.info("Closing WebDriver...")
                 self.driver.quit()
                 self.driver = None
 
-        # Combine all data with continuous indexing
-        if all_data:
-            final_df = pd.concat(all_data, ignore_index=True)  # ignore_index ensures continuous indexing
-            final_df = final_df.dropna(how='all')  # Remove any remaining empty rows
-            final_df = final_df.reset_index(drop=True)  # Final reset of index to be continuous
-            logger.info(f"Total records scraped: {len(final_df)}")
-            return final_df
-        else:
-            return pd.DataFrame()
+def create_pooled_driver():
+    """Driver factory for WebDriverPool reusing the stealth setup of DynamicWebScraper"""
+    # Resource blocking is applied per request through DevTools, not at launch
+    scraper = DynamicWebScraper(page_load_strategy=os.getenv("SCRAPER_PAGE_LOAD_STRATEGY", "eager"))
+    scraper.setup_driver()
+    return scraper.driver
+
+def render_dynamic_snapshot(
+    url: str,
+    container_selector: str,
+    enable_scrolling: bool = False,
+    max_scrolls: int = 5,
+    pool=None,
+    fixed_delays: bool = False,
+    resource_policy=None
+):
+    """
+    Render and scroll the page, then return (page_source, final_url).
+    The browser goes back to the pool before any parsing happens; feed the
+    snapshot to extract_records_from_html, ideally in a process pool.
+    """
+    scraper = DynamicWebScraper(fixed_delays=fixed_delays, resource_policy=resource_policy)
+    with phase("driver_acquire"):
+        pooled = pool.acquire() if pool else None
+    try:
+        if pooled:
+            scraper.driver = pooled.driver
+        if not scraper._make_dynamic_request(url, enable_scrolling, max_scrolls, container_selector):
+            return "", url
+        with phase("snapshot"):
+            return scraper.driver.page_source, scraper.driver.current_url
+    finally:
+        if pooled:
+            pooled.navigations += scraper.navigations
+            pool.release(pooled)
+        elif scraper.driver:
+            scraper.driver.quit()
+        scraper.driver = None
+
+def scrape_dynamic_pagination_data(
+    url: str,
+    container_selector: str,
+    custom_fields: list,
+    start_page: int,
+    end_page: int,
+    pagination_type: str,
+    page_param: str = None,
+    next_button_selector: str = None,
+    enable_scrolling: bool = False,
+    max_scrolls: int = 5,
+    pool=None,
+    fixed_delays: bool = False,
+    extraction_mode: str = "script",
+    resource_policy=None
+):
+    """
+    Sequential pagination on one browser (required for "Next Button" pagination).
+    Returns a list of dicts across all pages.
+    """
+    scraper = DynamicWebScraper(
+        fixed_delays=fixed_delays, extraction_mode=extraction_mode, resource_policy=resource_policy
+    )
+    with phase("driver_acquire"):
+        pooled = pool.acquire() if pool else None
+    try:
+        if pooled:
+            scraper.driver = pooled.driver
+        table = scraper.scrape_dynamic_with_pagination(
+            url, container_selector, custom_fields, start_page, end_page, pagination_type,
+            page_param=page_param, enable_scrolling=enable_scrolling, max_scrolls=max_scrolls,
+            next_button_selector=next_button_selector, keep_driver=pooled is not None
+        )
+    finally:
+        if pooled:
+            scraper.driver = None
+            pooled.navigations += scraper.navigations
+            pool.release(pooled)
+    with phase("serialization"):
+        return table.records()
+
+def iter_dynamic_pagination_data(
+    url: str,
+    container_selector: str,
+    custom_fields: list,
+    start_page: int,
+    end_page: int,
+    pagination_type: str,
+    page_param: str = None,
+    next_button_selector: str = None,
+    enable_scrolling: bool = False,
+    max_scrolls: int = 5,
+    pool=None,
+    fixed_delays: bool = False,
+    extraction_mode: str = "script",
+    resource_policy=None
+):
+    """
+    Generator counterpart of scrape_dynamic_pagination_data yielding
+    (page_info, records) as every page is scraped, in the shape of
+    PaginationEngine.iter_pages. The browser is returned when the generator
+    finishes or is closed.
+    """
+    scraper = DynamicWebScraper(
+        fixed_delays=fixed_delays, extraction_mode=extraction_mode, resource_policy=resource_policy
+    )
+    with phase("driver_acquire"):
+        pooled = pool.acquire() if pool else None
+    try:
+        if pooled:
+            scraper.driver = pooled.driver
+        started = time.monotonic()
+        for page, table in scraper.iter_pagination_pages(
+            url, container_selector, custom_fields, start_page, end_page, pagination_type,
+            page_param=page_param, enable_scrolling=enable_scrolling, max_scrolls=max_scrolls,
+            next_button_selector=next_button_selector, keep_driver=pooled is not None
+        ):
+            info = {
+                "page": page,
+                "url": scraper.driver.current_url if scraper.driver else url,
+                "rows": len(table),
+                "strategy": "dynamic",
+                "error": None,
+                "seconds": round(time.monotonic() - started, 3),
+            }
+            with phase("serialization"):
+                records = table.records()
+            yield info, records
+            started = time.monotonic()
+    finally:
+        if pooled:
+            scraper.driver = None
+            pooled.navigations += scraper.navigations
+            pool.release(pooled)
+
+def iter_dynamic_data(
+    url: str,
+    container_selector: str,
+    custom_fields: list,
+    enable_scrolling: bool = False,
+    max_scrolls: int = 5,
+    pool=None,
+    fixed_delays: bool = False,
+    extraction_mode: str = "script",
+    chunk_size: int = 25,
+    resource_policy=None,
+    incremental=None
+):
+    """
+    Generator counterpart of scrape_dynamic_data yielding one dict per non-empty
+    container as soon as it is extracted. The browser is returned when the
+    generator finishes or is closed.
+    """
+    scraper = DynamicWebScraper(
+        fixed_delays=fixed_delays, extraction_mode=extraction_mode, resource_policy=resource_policy
+    )
+    with phase("driver_acquire"):
+        pooled = pool.acquire() if pool else None
+    try:
+        if pooled:
+            scraper.driver = pooled.driver
+        if enable_scrolling and incremental is not None:
+            # Rows are extracted (and streamed) after every scroll
+            if scraper._make_dynamic_request(url, False, max_scrolls, container_selector):
+                yield from scraper.iter_scroll_rows(container_selector, custom_fields, max_scrolls, **incremental)
+        elif scraper._make_dynamic_request(url, enable_scrolling, max_scrolls, container_selector):
+            yield from scraper.iter_dynamic_page_rows(container_selector, custom_fields, chunk_size)
+    finally:
+        if pooled:
+            pooled.navigations += scraper.navigations
+            pool.release(pooled)
+        elif scraper.driver:
+            scraper.driver.quit()
+        scraper.driver = None
 
 def scrape_dynamic_data(
     url: str,
     container_selector: str,
     custom_fields: list,
     enable_scrolling: bool = False,
-    max_scrolls: int = 5
+    max_scrolls: int = 5,
+    pool=None,
+    fixed_delays: bool = False,
+    extraction_mode: str = "script",
+    resource_policy=None,
+    incremental=None
 ):
     """
     Scrapes dynamic data from the given URL using the provided container selector and custom fields.
     Returns a list of dicts (one per container).
+    When a WebDriverPool is given the browser is borrowed from it instead of launched per call.
+    Pass incremental options (see DynamicWebScraper.iter_scroll_rows) to extract while scrolling.
     """
-    scraper = DynamicWebScraper()
-    df = scraper.scrape_dynamic_page(
-        url,
-        container_selector,
-        custom_fields,
-        enable_scrolling=enable_scrolling,
-        max_scrolls=max_scrolls
+    if extraction_mode == "snapshot" and not (enable_scrolling and incremental is not None):
+        html, final_url = render_dynamic_snapshot(
+            url, container_selector, enable_scrolling, max_scrolls, pool=pool, fixed_delays=fixed_delays,
+            resource_policy=resource_policy
+        )
+        return extract_records_from_html(html, container_selector, custom_fields, final_url)
+
+    scraper = DynamicWebScraper(
+        fixed_delays=fixed_delays, extraction_mode=extraction_mode, resource_policy=resource_policy
     )
-    # Convert DataFrame to list of dicts for JSON serialization
-    return df.to_dict(orient="records")
+    with phase("driver_acquire"):
+        pooled = pool.acquire() if pool else None
+    try:
+        if pooled:
+            scraper.driver = pooled.driver
+        table = scraper.scrape_dynamic_page(
+            url,
+            container_selector,
+            custom_fields,
+            enable_scrolling=enable_scrolling,
+            max_scrolls=max_scrolls,
+            incremental=incremental
+        )
+    finally:
+        if pooled:
+            pooled.navigations += scraper.navigations
+            pool.release(pooled)
+        elif scraper.driver:
+            # Without a pool the driver is ours, make sure Chrome does not leak
+            scraper.driver.quit()
+        scraper.driver = None
+    # List of dicts for JSON serialization
+    with phase("serialization"):
+        return table.records()
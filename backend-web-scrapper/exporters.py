@@ -0,0 +1,158 @@
+import csv
+import importlib.util
+import io
+import json
+import logging
+import zlib
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+# Whole-stream compression for the text formats; Parquet compresses its pages internally
+COMPRESSIONS = {
+    "none": (None, ""),
+    "gzip": ("application/gzip", ".gz"),
+    "zstd": ("application/zstd", ".zst"),
+}
+PARQUET_COMPRESSIONS = {"none": "none", "gzip": "gzip", "zstd": "zstd", "snappy": "snappy"}
+
+
+def default_compression(export_format: str):
+    return "snappy" if export_format == "parquet" else "none"
+
+
+def validate_export(export_format: str, compression: str):
+    """Raise ValueError for unknown formats/compressions or missing optional packages"""
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"format must be one of {', '.join(EXPORT_FORMATS)}")
+    if export_format == "parquet":
+        if compression not in PARQUET_COMPRESSIONS:
+            raise ValueError(f"compression for parquet must be one of {', '.join(PARQUET_COMPRESSIONS)}")
+        if importlib.util.find_spec("pyarrow") is None:
+            raise ValueError("Parquet export requires the pyarrow package")
+        return
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"compression must be one of {', '.join(COMPRESSIONS)}")
+    if compression == "zstd" and importlib.util.find_spec("zstandard") is None:
+        raise ValueError("zstd compression requires the zstandard package")
+
+
+def export_media_type(export_format: str, compression: str):
+    if export_format != "parquet" and COMPRESSIONS[compression][0]:
+        return COMPRESSIONS[compression][0]
+    return EXPORT_FORMATS[export_format]
+
+
+def export_filename(stem: str, export_format: str, compression: str):
+    suffix = "" if export_format == "parquet" else COMPRESSIONS[compression][1]
+    return f"{stem}.{export_format}{suffix}"
+
+
+async def _batches(rows, batch_size):
+    batch = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def csv_chunks(rows, columns, batch_size=500):
+    """CSV with a header row; one chunk per batch of rows"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    async for batch in _batches(rows, batch_size):
+        writer.writerows(batch)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def jsonl_chunks(rows, batch_size=500):
+    """One JSON object per line; one chunk per batch of rows"""
+    async for batch in _batches(rows, batch_size):
+        yield "".join(json.dumps(row, ensure_ascii=False, default=str) + "\n" for row in batch).encode("utf-8")
+
+
+class _DrainableSink(io.RawIOBase):
+    """Write-only file object whose contents are handed out (and dropped) after every row group"""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+async def parquet_chunks(rows, columns, compression="snappy", row_group_size=5000):
+    """Parquet with all-string columns, streamed one row group at a time (requires pyarrow)"""
+    import pyarrow as pa  # Optional dependency, only needed for Parquet exports
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(column, pa.string()) for column in columns])
+    sink = _DrainableSink()
+    writer = pq.ParquetWriter(sink, schema, compression=PARQUET_COMPRESSIONS[compression])
+    try:
+        async for batch in _batches(rows, row_group_size):
+            arrays = [
+                pa.array([None if row.get(column) is None else str(row.get(column)) for row in batch], pa.string())
+                for column in columns
+            ]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        writer.close()
+    # The footer is only written on close
+    data = sink.drain()
+    if data:
+        yield data
+
+
+async def compress_chunks(chunks, compression):
+    """Compress a byte stream incrementally with gzip or zstd"""
+    if compression == "gzip":
+        compressor = zlib.compressobj(wbits=31)  # 31 = gzip container
+    else:
+        import zstandard  # Optional dependency, only needed for zstd exports
+
+        compressor = zstandard.ZstdCompressor().compressobj()
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_chunks(rows, columns, export_format: str, compression: str = "none"):
+    """Async byte chunks of rows (an async iterator of dicts) in the requested file format"""
+    if export_format == "parquet":
+        return parquet_chunks(rows, columns, compression)
+    chunks = csv_chunks(rows, columns) if export_format == "csv" else jsonl_chunks(rows)
+    if compression == "none":
+        return chunks
+    return compress_chunks(chunks, compression)
@@ -0,0 +1,247 @@
+import contextvars
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Seconds; covers fast static fetches up to slow scrolling sessions
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+RATIO_BUCKETS = (0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 1.0)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labelnames, values, extra=()):
+    pairs = list(zip(labelnames, values)) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value):
+    return "+Inf" if value == float("inf") else repr(float(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._render_sample(key, value))
+        return lines
+
+    def _render_sample(self, key, value):
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """Value read from a callback at scrape time, returning a number or {label value: number}.
+
+    ``kind="counter"`` exposes lifetime totals kept elsewhere (e.g. by the driver pool).
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name, documentation, callback, labelnames=(), kind="gauge"):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+        self.kind = kind
+
+    def render(self):
+        try:
+            value = self.callback()
+        except Exception as e:
+            logger.warning(f"Could not read gauge {self.name}: {str(e)}")
+            value = {}
+        with self._lock:
+            self._values = {(str(label),): v for label, v in value.items()} if isinstance(value, dict) else {(): value}
+        return super().render()
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.setdefault(key, {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0})
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state["counts"][i] += 1
+                    break
+            state["sum"] += value
+            state["count"] += 1
+
+    def _render_sample(self, key, state):
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, state["counts"]):
+            cumulative += count
+            labels = _format_labels(self.labelnames, key, [("le", _format_value(bound))])
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(state['sum'])}")
+        lines.append(f"{self.name}_count{labels} {state['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """Minimal in-process metrics in the Prometheus text exposition format"""
+
+    def __init__(self):
+        self._metrics = {}
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(self, name, documentation, callback, labelnames=(), kind="gauge"):
+        return self._register(Gauge(name, documentation, callback, labelnames, kind))
+
+    def render(self):
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+REQUESTS = registry.counter("scraper_requests_total", "HTTP requests handled", ("route", "status"))
+REQUEST_FAILURES = registry.counter("scraper_request_failures_total", "HTTP requests answered with a 5xx", ("route",))
+REQUEST_DURATION = registry.histogram("scraper_request_duration_seconds", "Time to response start", ("route",))
+PHASE_DURATION = registry.histogram("scraper_phase_duration_seconds", "Duration of scraping phases", ("phase",))
+ROWS = registry.counter("scraper_rows_total", "Rows returned by scrapes", ("strategy",))
+MEMORY_REJECTIONS = registry.counter("scraper_memory_rejections_total", "Browser scrapes refused under memory pressure")
+FIELD_FILL_RATE = registry.histogram(
+    "scraper_field_fill_ratio", "Share of containers with a value, one observation per field and page",
+    ("strategy",), buckets=RATIO_BUCKETS
+)
+
+_current_timer = contextvars.ContextVar("phase_timer", default=None)
+
+
+class RequestMetricsMiddleware:
+    """Count and time every HTTP request by route template (time to response start for streams).
+
+    A plain ASGI middleware that only wraps ``send`` to read the status, so
+    streamed responses pass through untouched.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        response = {"status": 500, "seconds": None}
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                response["seconds"] = time.perf_counter() - started
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router stores the matched route in the shared scope
+            route = getattr(scope.get("route"), "path", "unmatched")
+            status = response["status"]
+            seconds = response["seconds"] if response["seconds"] is not None else time.perf_counter() - started
+            REQUESTS.inc(route=route, status=status)
+            REQUEST_DURATION.observe(seconds, route=route)
+            if status >= 500:
+                REQUEST_FAILURES.inc(route=route)
+
+
+class PhaseTimer:
+    """Per-request accumulator of phase durations, shared by every task/thread of the request"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._phases = {}
+        self._lock = threading.Lock()
+
+    def add(self, phase, seconds):
+        with self._lock:
+            entry = self._phases.setdefault(phase, {"seconds": 0.0, "count": 0})
+            entry["seconds"] += seconds
+            entry["count"] += 1
+
+    def breakdown(self):
+        with self._lock:
+            phases = {name: {"seconds": round(entry["seconds"], 4), "count": entry["count"]}
+                      for name, entry in self._phases.items()}
+        return {"total_seconds": round(time.perf_counter() - self.started, 4), "phases": phases}
+
+
+def start_request_timer():
+    """Attach a fresh PhaseTimer to the current context; executor work must run in a copy of it"""
+    timer = PhaseTimer()
+    _current_timer.set(timer)
+    return timer
+
+
+def record_phase(phase, seconds):
+    PHASE_DURATION.observe(seconds, phase=phase)
+    timer = _current_timer.get()
+    if timer is not None:
+        timer.add(phase, seconds)
+
+
+@contextmanager
+def phase(name):
+    """Time a block as one occurrence of a pipeline phase"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(name, time.perf_counter() - started)
+
+
+def observe_fill_rates(rates, strategy):
+    """Record per-field fill rates ({field: ratio}) of one page"""
+    for rate in rates.values():
+        FIELD_FILL_RATE.observe(rate, strategy=strategy)
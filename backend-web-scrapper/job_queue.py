@@ -0,0 +1,277 @@
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+from .data_paths import data_path
+from .scrape_strategy import domain_of
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class JobStore:
+    """SQLite-backed storage for jobs, their progress and their result rows"""
+
+    def __init__(self, path="scraper-jobs.sqlite3"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    priority INTEGER NOT NULL DEFAULT 0,
+                    domain TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL,
+                    pages_done INTEGER NOT NULL DEFAULT 0,
+                    rows_done INTEGER NOT NULL DEFAULT 0,
+                    error TEXT
+                )
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS job_results (
+                    job_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    page INTEGER,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (job_id, seq)
+                )
+                """
+            )
+
+    def create(self, kind, payload, priority=0):
+        job_id = uuid.uuid4().hex
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (id, kind, payload, priority, domain, status, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, kind, json.dumps(payload), int(priority), domain_of(payload["url"]), QUEUED, time.time()),
+            )
+        return job_id
+
+    def _job_dict(self, row):
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._job_dict(row) if row else None
+
+    def unfinished(self):
+        """Jobs that were queued or interrupted while running, oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM jobs WHERE status IN (?, ?) ORDER BY created_at", (QUEUED, RUNNING)
+            ).fetchall()
+        return [self._job_dict(row) for row in rows]
+
+    def mark_running(self, job_id):
+        with self._lock, self._conn:
+            # A restarted job starts over, drop partial results from the interrupted run
+            self._conn.execute("DELETE FROM job_results WHERE job_id = ?", (job_id,))
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, started_at = ?, pages_done = 0, rows_done = 0, error = NULL WHERE id = ?",
+                (RUNNING, time.time(), job_id),
+            )
+
+    def mark_finished(self, job_id, error=None):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, error = ? WHERE id = ?",
+                (FAILED if error else SUCCEEDED, time.time(), error, job_id),
+            )
+
+    def add_rows(self, job_id, page, rows):
+        """Append result rows and bump the job's progress counters"""
+        with self._lock, self._conn:
+            (next_seq,) = self._conn.execute(
+                "SELECT COALESCE(MAX(seq) + 1, 0) FROM job_results WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            self._conn.executemany(
+                "INSERT INTO job_results (job_id, seq, page, data) VALUES (?, ?, ?, ?)",
+                [(job_id, next_seq + i, page, json.dumps(row)) for i, row in enumerate(rows)],
+            )
+            self._conn.execute(
+                "UPDATE jobs SET pages_done = pages_done + 1, rows_done = rows_done + ? WHERE id = ?",
+                (len(rows), job_id),
+            )
+
+    def results(self, job_id, offset=0, limit=100):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT page, data FROM job_results WHERE job_id = ? ORDER BY seq LIMIT ? OFFSET ?",
+                (job_id, int(limit), int(offset)),
+            ).fetchall()
+        return [json.loads(row["data"]) for row in rows]
+
+    def counts(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        return {row["status"]: row["n"] for row in rows}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class JobProgress:
+    """Handed to the job runner to persist rows as pages complete"""
+
+    def __init__(self, store, job_id):
+        self.store = store
+        self.job_id = job_id
+
+    async def add_page(self, page, rows):
+        await asyncio.to_thread(self.store.add_rows, self.job_id, page, rows)
+
+
+class JobQueue:
+    """Local worker pool executing stored jobs by priority with per-domain fairness.
+
+    The highest priority wins; among equal priorities the domain with the
+    fewest running jobs (then the one served least recently) goes first, and
+    no domain runs more than ``max_per_domain`` jobs at once.
+    """
+
+    def __init__(self, store, runner, workers=2, max_per_domain=1, resume=True):
+        self.store = store
+        self.runner = runner
+        self.workers = max(1, int(workers))
+        self.max_per_domain = max(1, int(max_per_domain))
+        # With several processes on one database only one of them may resume unfinished jobs
+        self.resume = resume
+        self._pending = {}
+        self._running = {}
+        # Totals kept next to the dicts: metrics() runs in other threads (the /metrics
+        # gauges) and must not iterate dicts the event loop is changing
+        self._pending_total = 0
+        self._running_total = 0
+        self._last_served = {}
+        self._sequence = itertools.count()
+        self._condition = None
+        self._tasks = []
+
+    @classmethod
+    def from_env(cls, runner):
+        store = JobStore(os.getenv("SCRAPER_JOBS_DB") or data_path("scraper-jobs.sqlite3"))
+        return cls(
+            store,
+            runner,
+            workers=int(os.getenv("SCRAPER_JOB_WORKERS", "2")),
+            max_per_domain=int(os.getenv("SCRAPER_JOB_DOMAIN_CONCURRENCY", "1")),
+            resume=os.getenv("SCRAPER_JOB_RESUME", "1") != "0",
+        )
+
+    def _push(self, job_id, domain, priority):
+        heapq.heappush(self._pending.setdefault(domain, []), (-int(priority), next(self._sequence), job_id))
+        self._pending_total += 1
+
+    async def start(self):
+        self._condition = asyncio.Condition()
+        if self.resume:
+            for job in await asyncio.to_thread(self.store.unfinished):
+                self._push(job["id"], job["domain"], job["priority"])
+        self._tasks = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+        logger.info(f"Job queue started with {self.workers} workers")
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await asyncio.to_thread(self.store.close)
+
+    async def submit(self, kind, payload, priority=0):
+        job_id = await asyncio.to_thread(self.store.create, kind, payload, priority)
+        async with self._condition:
+            self._push(job_id, domain_of(payload["url"]), priority)
+            self._condition.notify()
+        return job_id
+
+    def _next_job(self):
+        """Pick (domain, job_id) to run next, or None when nothing is eligible"""
+        best = None
+        for domain, heap in self._pending.items():
+            if not heap or self._running.get(domain, 0) >= self.max_per_domain:
+                continue
+            key = (heap[0][0], self._running.get(domain, 0), self._last_served.get(domain, 0), heap[0][1])
+            if best is None or key < best[0]:
+                best = (key, domain)
+        if best is None:
+            return None
+        domain = best[1]
+        _, _, job_id = heapq.heappop(self._pending[domain])
+        self._pending_total -= 1
+        if not self._pending[domain]:
+            del self._pending[domain]
+        return domain, job_id
+
+    async def _worker(self, index):
+        while True:
+            async with self._condition:
+                picked = self._next_job()
+                while picked is None:
+                    await self._condition.wait()
+                    picked = self._next_job()
+                domain, job_id = picked
+                self._running[domain] = self._running.get(domain, 0) + 1
+                self._running_total += 1
+                self._last_served[domain] = time.monotonic()
+            try:
+                await self._run(job_id)
+            finally:
+                async with self._condition:
+                    self._running[domain] -= 1
+                    self._running_total -= 1
+                    self._condition.notify_all()
+
+    async def _run(self, job_id):
+        job = await asyncio.to_thread(self.store.get, job_id)
+        if job is None:
+            return
+        await asyncio.to_thread(self.store.mark_running, job_id)
+        logger.info(f"Running {job['kind']} job {job_id} for {job['payload'].get('url')}")
+        error = None
+        try:
+            await self.runner(job, JobProgress(self.store, job_id))
+        except asyncio.CancelledError:
+            # Shutting down: leave the job 'running' so it is picked up again on restart
+            raise
+        except Exception as e:
+            error = getattr(e, "detail", None) or str(e)
+            logger.error(f"Job {job_id} failed: {error}")
+        await asyncio.to_thread(self.store.mark_finished, job_id, error)
+
+    def status(self, job_id):
+        return self.store.get(job_id)
+
+    def metrics(self):
+        return {
+            "workers": self.workers,
+            "max_per_domain": self.max_per_domain,
+            "pending": self._pending_total,
+            "running": self._running_total,
+            "by_status": self.store.counts(),
+        }
@@ -1,8 +1,131 @@
+import asyncio
+import contextvars
+import functools
+import importlib.util
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+import httpx
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from .dynamic_web_scrapper import scrape_data, scrape_dynamic_data  # Fixed import for package context
+from fastapi.responses import JSONResponse, PlainTextResponse
+from .dynamic_web_scrapper import (  # Fixed import for package context
+    scrape_data_async,
+    scrape_data_conditional,
+    scrape_dynamic_data,
+    create_pooled_driver,
+    render_dynamic_snapshot,
+    extract_records_from_html,
+    scrape_dynamic_pagination_data,
+    iter_dynamic_pagination_data,
+    iter_dynamic_data,
+    resolve_resource_policy,
+    FIELD_TYPES,
+    EXTRACTION_MODES,
+)
+from .driver_pool import WebDriverPool, PoolExhaustedError
+from .scrape_strategy import StrategyMemory, evaluate_static_html, AUTO, STATIC, DYNAMIC, STRATEGIES
+from .pagination_engine import DomainLimiter, PaginationEngine, url_parameter_pages
+from .streaming import STREAM_FORMATS, encode_events, iterate_in_thread
+from .job_queue import JobQueue
+from .result_cache import ResultCache
+from .recipes import RecipeStore
+from .memory_guard import MemoryGuard
+from .browser_workers import BrowserWorkers, BrowserWorkerError
+from .instrumentation import (
+    registry,
+    RequestMetricsMiddleware,
+    ROWS,
+    MEMORY_REJECTIONS,
+    start_request_timer,
+    phase,
+    observe_fill_rates,
+)
+from .exporters import default_compression, validate_export, export_chunks, export_media_type, export_filename
+
+logger = logging.getLogger(__name__)
+
+driver_pool = WebDriverPool.from_env(create_pooled_driver)
+
+# Selenium work runs on a bounded executor, one thread per pooled browser,
+# while the semaphore caps how many dynamic requests may wait for a thread.
+dynamic_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("SCRAPER_DYNAMIC_WORKERS", str(driver_pool.size))),
+    thread_name_prefix="dynamic-scrape",
+)
+dynamic_slots = asyncio.Semaphore(int(os.getenv("SCRAPER_DYNAMIC_MAX_PENDING", str(driver_pool.size * 4))))
+DYNAMIC_QUEUE_TIMEOUT = float(os.getenv("SCRAPER_DYNAMIC_QUEUE_TIMEOUT", "30"))
+# CPU-bound parsing of rendered snapshots scales across cores in worker processes (started in lifespan)
+parse_executor = None
+parse_executor_lock = threading.Lock()
+PARSE_PROCESSES = int(os.getenv("SCRAPER_PARSE_PROCESSES", str(os.cpu_count() or 1)))
+http_client = None
+# SQLite-backed job queue, opened in lifespan
+job_queue = None
+# Per-domain memory of whether static HTML was enough, so later requests skip the probe
+strategy_memory = StrategyMemory.from_env()
+AUTO_MIN_FILL_RATE = float(os.getenv("SCRAPER_AUTO_MIN_FILL_RATE", "0.5"))
+# Shared by every paginated scrape so one target domain is never hammered
+domain_limiter = DomainLimiter.from_env()
+result_cache = ResultCache.from_env()
+# Named, pre-validated extraction specs referenced by {"recipe": id}, opened in lifespan
+recipe_store = None
+# Batch fetches only need a per-host concurrency cap, no start-rate limit
+batch_host_limiter = DomainLimiter(max_concurrency=int(os.getenv("SCRAPER_BATCH_PER_HOST", "6")), rate=0)
+BATCH_MAX_URLS = int(os.getenv("SCRAPER_BATCH_MAX_URLS", "1000"))
+# Images, fonts and media are not needed to read the DOM; see RESOURCE_POLICIES
+DEFAULT_RESOURCE_POLICY = os.getenv("SCRAPER_RESOURCE_POLICY", "lean")
+# Browser work waits (up to SCRAPER_MEMORY_WAIT seconds) while memory is short, then gets a 503
+memory_guard = MemoryGuard.from_env()
+MEMORY_WAIT = float(os.getenv("SCRAPER_MEMORY_WAIT", str(DYNAMIC_QUEUE_TIMEOUT)))
+# In an API process of a supervised deployment (see supervisor.py) Chrome only runs in the
+# browser-worker processes listed in SCRAPER_BROWSER_WORKERS; browser work is forwarded there
+browser_workers = BrowserWorkers.from_env()
+PROCESS_ROLE = os.getenv("SCRAPER_ROLE", "api" if browser_workers else "standalone")
+# Seconds to wait for borrowed browsers to come back on shutdown
+DRAIN_TIMEOUT = float(os.getenv("SCRAPER_DRAIN_TIMEOUT", "30"))
+draining = False
+
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global http_client, parse_executor, job_queue, recipe_store, draining
+    # One keep-alive pool for every static fetch; HTTP/2 when the h2 package is installed
+    http_client = httpx.AsyncClient(
+        headers={"User-Agent": "Mozilla/5.0 (compatible; web-scrapper)"},
+        limits=httpx.Limits(
+            max_connections=int(os.getenv("SCRAPER_HTTP_MAX_CONNECTIONS", "100")),
+            max_keepalive_connections=int(os.getenv("SCRAPER_HTTP_MAX_KEEPALIVE", "20")),
+        ),
+        http2=importlib.util.find_spec("h2") is not None,
+    )
+    recipe_store = await asyncio.to_thread(RecipeStore.from_env)
+    parse_executor = new_parse_executor()
+    # Warm up browsers in a thread so startup does not block the event loop;
+    # the server only accepts requests (and /health answers) once this is done
+    warmup_count = 0 if browser_workers else int(os.getenv("SCRAPER_POOL_WARMUP", str(driver_pool.size)))
+    if warmup_count > 0:
+        await asyncio.to_thread(driver_pool.warm_up, warmup_count)
+    job_queue = JobQueue.from_env(run_job)
+    await job_queue.start()
+    yield
+    # Drain: refuse new browser work, let borrowed browsers finish, then close everything
+    draining = True
+    await job_queue.stop()
+    await asyncio.to_thread(driver_pool.drain, DRAIN_TIMEOUT)
+    dynamic_executor.shutdown(wait=True)
+    parse_executor.shutdown(wait=True)
+    await http_client.aclose()
+    result_cache.close()
+    recipe_store.close()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Configure CORS
 origins = [
@@ -12,6 +135,7 @@ origins = [
     "*",
 ]
 
+app.add_middleware(RequestMetricsMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -21,50 +145,984 @@ app.add_middleware(
 )
 
 
+async def wait_for_memory():
+    """Memory back-pressure: hold browser work while memory is short; 503 when it does not recover in time"""
+    if not memory_guard.enabled:
+        return
+    deadline = time.monotonic() + MEMORY_WAIT
+    while True:
+        pressure = await asyncio.to_thread(memory_guard.pressure)
+        if pressure is None:
+            return
+        if time.monotonic() >= deadline:
+            MEMORY_REJECTIONS.inc()
+            raise HTTPException(
+                status_code=503,
+                detail=f"Not enough memory for another browser scrape ({pressure}), try again later",
+                headers={"Retry-After": str(max(1, int(memory_guard.check_interval * 5)))},
+            )
+        await asyncio.sleep(memory_guard.check_interval)
+
+
+async def acquire_dynamic_slot():
+    """Admission control for Selenium work; 503 when draining, short of memory or the backlog does not drain in time"""
+    if draining:
+        raise HTTPException(status_code=503, detail="Shutting down, not accepting browser work")
+    await wait_for_memory()
+    try:
+        await asyncio.wait_for(dynamic_slots.acquire(), timeout=DYNAMIC_QUEUE_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=503, detail="Too many dynamic scrapes in progress, try again later")
+
+
+async def run_dynamic(func, *args, **kwargs):
+    """Run blocking Selenium work on the dynamic executor without stalling the event loop"""
+    await acquire_dynamic_slot()
+    try:
+        loop = asyncio.get_running_loop()
+        # Run in a copy of the request context so phase timings reach the request's timer
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(dynamic_executor, context.run, functools.partial(func, *args, **kwargs))
+    except PoolExhaustedError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    finally:
+        dynamic_slots.release()
+
+
+def new_parse_executor():
+    # Spawned, not forked: this process already runs executor and httpx threads
+    return ProcessPoolExecutor(max_workers=PARSE_PROCESSES, mp_context=multiprocessing.get_context("spawn"))
+
+
+def replace_parse_executor(broken):
+    """Swap a broken parse pool for a fresh one; callers that saw the same broken pool share the replacement"""
+    global parse_executor
+    with parse_executor_lock:
+        if parse_executor is broken:
+            parse_executor = new_parse_executor()
+            broken.shutdown(wait=False, cancel_futures=True)
+        return parse_executor
+
+
+async def run_parse(func, *args):
+    """Run CPU-bound HTML parsing in the process pool.
+
+    A worker that dies (OOM kill, segfault in lxml) breaks the whole pool, so the pool is
+    rebuilt and the parse retried once; if the new pool breaks too the parse runs in a thread.
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(func, *args)
+    executor = parse_executor
+    try:
+        return await loop.run_in_executor(executor, call)
+    except BrokenProcessPool:
+        logger.warning("Parse pool is broken, starting a new one")
+        executor = replace_parse_executor(executor)
+    try:
+        return await loop.run_in_executor(executor, call)
+    except BrokenProcessPool:
+        logger.warning("Parse pool broke again, parsing in a thread")
+        replace_parse_executor(executor)
+        return await asyncio.to_thread(call)
+
+
+async def cached_static_scrape(url: str):
+    """Static scrape served from the cache, revalidating expired copies with ETag/Last-Modified"""
+    key = result_cache.make_key("static", url)
+    entry = result_cache.get(key, allow_stale=True)
+    if entry is not None and entry["expires_at"] > time.time():
+        return entry["value"]
+
+    async def fetch():
+        stale = entry
+        while True:
+            try:
+                result, validators = await scrape_data_conditional(
+                    url,
+                    http_client,
+                    etag=stale.get("etag") if stale else None,
+                    last_modified=stale.get("last_modified") if stale else None,
+                )
+            except Exception as e:
+                return {"error": str(e)}
+            if result is not None:
+                break
+            # 304 Not Modified: the cached copy is still good...
+            refreshed = result_cache.refresh(key, url)
+            if refreshed is not None:
+                return refreshed["value"]
+            # ...unless it was evicted while the request was in flight: fetch it again unconditionally
+            stale = None
+        if validators["etag"] or validators["last_modified"]:
+            result_cache.set(key, url, result, validators["etag"], validators["last_modified"])
+        else:
+            result_cache.set(key, url, result)
+        return result
+
+    return await result_cache.get_or_compute(key, url, fetch, should_store=lambda _: False)
+
+
 @app.get("/scrape")
-async def scrape(url: str):
+async def scrape(url: str, cache: bool = True):
     print(f"Received scrape request for URL: {url}")
     try:
-        data = scrape_data(url)
+        if not cache:
+            return await scrape_data_async(url, http_client)
+        data = await cached_static_scrape(url)
         return data
     except Exception as e:
         print(f"Error during scraping: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 from fastapi import Body
+from fastapi.responses import StreamingResponse
 
-@app.post("/scrape-dynamic")
-async def scrape_dynamic(
+
+@app.post("/scrape-batch")
+async def scrape_batch(
     payload: dict = Body(...)
 ):
     """
     Expects JSON with:
     {
-        "url": str,
-        "container_selector": str,
-        "custom_fields": list of {"name": str, "selector": str},
-        "enable_scrolling": bool (optional),
-        "max_scrolls": int (optional)
+        "urls": list of str,
+        "cache": bool (optional, defaults to true)
+    }
+    Fetches every URL concurrently over the shared connection pool (at most
+    SCRAPER_BATCH_PER_HOST at once per host) and returns per-URL title/snippet or error.
+    """
+    urls = payload.get("urls")
+    if not isinstance(urls, list) or not urls:
+        raise HTTPException(status_code=400, detail="urls must be a non-empty list")
+    if len(urls) > BATCH_MAX_URLS:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_MAX_URLS} urls per batch")
+    use_cache = payload.get("cache", True)
+
+    async def fetch(url):
+        try:
+            async with batch_host_limiter.slot(url):
+                if use_cache:
+                    data = await cached_static_scrape(url)
+                else:
+                    data = await scrape_data_async(url, http_client)
+        except Exception as e:
+            data = {"error": str(e)}
+        return {"url": url, **data}
+
+    started = time.monotonic()
+    results = await asyncio.gather(*(fetch(url) for url in urls))
+    elapsed = time.monotonic() - started
+    return {
+        "results": results,
+        "succeeded": sum(1 for result in results if "error" not in result),
+        "failed": sum(1 for result in results if "error" in result),
+        "elapsed_seconds": round(elapsed, 3),
+        "urls_per_second": round(len(urls) / elapsed, 2) if elapsed else None,
     }
+
+async def probe_static(url, container_selector, custom_fields):
+    """
+    Fetch url over plain HTTP and extract from the static HTML. Returns (records, sufficient),
+    or None when the page could not be fetched or parsed.
     """
     try:
-        url = payload["url"]
-        container_selector = payload["container_selector"]
-        custom_fields = payload["custom_fields"]
-        enable_scrolling = payload.get("enable_scrolling", False)
-        max_scrolls = payload.get("max_scrolls", 5)
-        data = scrape_dynamic_data(
+        with phase("static_fetch"):
+            response = await http_client.get(url, timeout=10, follow_redirects=True)
+            response.raise_for_status()
+        with phase("static_extraction"):
+            sufficient, records, rates = await run_parse(
+                evaluate_static_html, response.text, container_selector, custom_fields, str(response.url), AUTO_MIN_FILL_RATE
+            )
+    except Exception as e:
+        # A bad selector or unparseable HTML is no reason to fail the request: the browser path may cope
+        logger.warning(f"Static probe failed for {url}: {e}")
+        return None
+    observe_fill_rates(rates, "static")
+    return records, sufficient
+
+
+async def resolve_static(payload: dict):
+    """
+    Static-first part of the strategy. Returns (records, STATIC) when plain HTTP
+    was enough (or forced) and (None, DYNAMIC) when a browser is needed.
+    """
+    url = payload["url"]
+    strategy = payload.get("strategy", AUTO)
+    if strategy not in STRATEGIES:
+        raise HTTPException(status_code=400, detail=f"strategy must be one of {', '.join(STRATEGIES)}")
+
+    # Scrolling only makes sense in a browser, so it always takes the dynamic path
+    if strategy == AUTO and payload.get("enable_scrolling", False):
+        strategy = DYNAMIC
+    if strategy == AUTO and strategy_memory.get(url) == DYNAMIC:
+        strategy = DYNAMIC
+
+    if strategy in (AUTO, STATIC):
+        probe = await probe_static(url, payload["container_selector"], payload["custom_fields"])
+        records, sufficient = probe or ([], False)
+        if sufficient:
+            strategy_memory.remember(url, STATIC)
+            return records, STATIC
+        # The fill-rate threshold only decides escalation; a forced static scrape gets what the HTML has
+        if strategy == STATIC:
+            return records, STATIC
+    return None, DYNAMIC
+
+
+def remember_dynamic(payload: dict, found_rows: bool):
+    """Only a browser that found what the static probe missed proves the domain needs one"""
+    if found_rows and payload.get("strategy", AUTO) == AUTO and not payload.get("enable_scrolling", False):
+        strategy_memory.remember(payload["url"], DYNAMIC)
+
+
+def resource_policy_of(payload: dict):
+    """Resource policy requested by a payload, validated up front (400 on unknown names)"""
+    policy = payload.get("resource_policy", DEFAULT_RESOURCE_POLICY)
+    try:
+        resolve_resource_policy(policy)
+    except (ValueError, AttributeError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid resource_policy: {e}")
+    return policy
+
+
+def extraction_mode_of(payload: dict):
+    """Extraction mode requested by a payload, validated up front (400 on unknown modes)"""
+    extraction_mode = payload.get("extraction_mode", "script")
+    if extraction_mode not in EXTRACTION_MODES:
+        raise HTTPException(status_code=400, detail=f"extraction_mode must be one of {', '.join(EXTRACTION_MODES)}")
+    return extraction_mode
+
+
+def incremental_options(payload: dict):
+    """
+    Options of an incremental infinite-scroll scrape ("incremental_scroll": true),
+    validated up front (400 on bad values); None when the payload does not ask for one.
+    """
+    if not payload.get("incremental_scroll", False):
+        return None
+    target_rows = payload.get("target_rows")
+    time_budget = payload.get("time_budget")
+    dedupe_fields = payload.get("dedupe_fields")
+    if target_rows is not None and (not isinstance(target_rows, int) or target_rows < 1):
+        raise HTTPException(status_code=400, detail="target_rows must be a positive integer")
+    if time_budget is not None and (not isinstance(time_budget, (int, float)) or time_budget <= 0):
+        raise HTTPException(status_code=400, detail="time_budget must be a positive number of seconds")
+    if dedupe_fields is not None:
+        names = {field.get("name") for field in payload.get("custom_fields", [])}
+        if not isinstance(dedupe_fields, list) or not dedupe_fields or not set(dedupe_fields) <= names:
+            raise HTTPException(status_code=400, detail="dedupe_fields must be a list of custom field names")
+    return {
+        "target_rows": target_rows,
+        "time_budget": time_budget,
+        "prune_dom": bool(payload.get("prune_dom", False)),
+        "dedupe_fields": dedupe_fields,
+    }
+
+
+def browser_worker_payload(payload: dict):
+    """Payload forwarded to a browser worker: already validated and expanded, browser-only, uncached"""
+    forwarded = {key: value for key, value in payload.items() if key not in ("recipe", "timings")}
+    return {**forwarded, "strategy": DYNAMIC, "cache": False}
+
+
+async def forward_to_browser_worker(path: str, payload: dict):
+    """Run a browser scrape on one of the browser-worker processes"""
+    try:
+        return await browser_workers.post(http_client, path, browser_worker_payload(payload))
+    except BrowserWorkerError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+
+async def scrape_page(payload: dict):
+    """
+    Scrape a single page described by a /scrape-dynamic payload.
+    Returns (results, strategy) where strategy is the one that produced the results.
+    """
+    url = payload["url"]
+    container_selector = payload["container_selector"]
+    custom_fields = payload["custom_fields"]
+    enable_scrolling = payload.get("enable_scrolling", False)
+    max_scrolls = payload.get("max_scrolls", 5)
+    fixed_delays = payload.get("fixed_delays", False)
+    extraction_mode = extraction_mode_of(payload)
+    resource_policy = resource_policy_of(payload)
+    incremental = incremental_options(payload) if enable_scrolling else None
+
+    records, strategy = await resolve_static(payload)
+    if records is not None:
+        ROWS.inc(len(records), strategy=strategy)
+        return records, strategy
+
+    if browser_workers is not None:
+        # API process: Chrome runs in the browser workers
+        data = (await forward_to_browser_worker("/scrape-dynamic", payload))["results"]
+    elif extraction_mode == "snapshot" and incremental is None:
+        # The browser is released as soon as the HTML is captured
+        html, final_url = await run_dynamic(
+            render_dynamic_snapshot,
+            url,
+            container_selector,
+            enable_scrolling=enable_scrolling,
+            max_scrolls=max_scrolls,
+            pool=driver_pool,
+            fixed_delays=fixed_delays,
+            resource_policy=resource_policy
+        )
+        with phase("extraction"):
+            data = await run_parse(extract_records_from_html, html, container_selector, custom_fields, final_url)
+    else:
+        data = await run_dynamic(
+            scrape_dynamic_data,
             url,
             container_selector,
             custom_fields,
             enable_scrolling=enable_scrolling,
-            max_scrolls=max_scrolls
+            max_scrolls=max_scrolls,
+            pool=driver_pool,
+            fixed_delays=fixed_delays,
+            extraction_mode=extraction_mode,
+            resource_policy=resource_policy,
+            incremental=incremental
         )
-        return {"results": data}
+    remember_dynamic(payload, bool(data))
+    ROWS.inc(len(data), strategy=DYNAMIC)
+    return data, DYNAMIC
+
+
+async def cached_scrape_page(payload: dict):
+    """
+    scrape_page behind the result cache, keyed on the normalized URL plus the
+    extraction spec. Concurrent identical requests share one in-flight scrape.
+    Pass "cache": false in the payload to bypass it.
+    """
+    if not payload.get("cache", True):
+        return await scrape_page(payload)
+    url = payload["url"]
+
+    async def compute():
+        results, strategy = await scrape_page(payload)
+        return {"results": results, "strategy": strategy}
+
+    value = await result_cache.get_or_compute(
+        result_cache.make_key("page", url, payload), url, compute,
+        should_store=lambda value: bool(value["results"])
+    )
+    return value["results"], value["strategy"]
+
+
+@app.post("/scrape-dynamic")
+async def scrape_dynamic(
+    payload: dict = Body(...),
+    format: str = None,
+    compression: str = None
+):
+    """
+    Expects JSON with:
+    {
+        "url": str,
+        "container_selector": str,
+        "custom_fields": list of {"name": str, "selector": str},
+        "enable_scrolling": bool (optional),
+        "max_scrolls": int (optional),
+        "fixed_delays": bool (optional, keep the old fixed sleeps for politeness/stealth),
+        "extraction_mode": "script" | "snapshot" | "webdriver" (optional, defaults to "script"),
+        "resource_policy": "none" | "lean" | "strict" | {"block": [...], "block_domains": [...]}
+                           (optional, defaults to SCRAPER_RESOURCE_POLICY, "lean"),
+        "strategy": "auto" | "static" | "dynamic" (optional, defaults to "auto": try plain HTTP
+                    first and only launch a browser when the static HTML is not enough),
+        "cache": bool (optional, defaults to true: serve identical recent scrapes from the cache),
+        "timings": bool (optional, add a per-phase timing breakdown to the response),
+        "recipe": str (optional, id of a registered recipe replacing container_selector and custom_fields),
+        "incremental_scroll": bool (optional, with enable_scrolling: extract new containers after
+                              every scroll and de-duplicate rows across scrolls),
+        "target_rows": int (optional, incremental: stop once this many rows were extracted),
+        "time_budget": float (optional, incremental: stop scrolling after this many seconds),
+        "prune_dom": bool (optional, incremental: remove extracted containers from the page
+                     to keep the browser's memory flat),
+        "dedupe_fields": list of field names (optional, incremental: row key, defaults to all fields)
+    }
+    ?format=csv|jsonl|parquet downloads the rows as a file streamed while they are
+    extracted; ?compression=gzip|zstd (csv/jsonl) or snappy|gzip|zstd|none (parquet).
+    """
+    timer = start_request_timer()
+    try:
+        payload = await extraction_spec(payload)
+        if format and format != "json":
+            require_scrape_fields(payload)
+            return await export_response(payload, scrape_page_events(payload), format, compression)
+        data, strategy = await cached_scrape_page(payload)
+        if payload.get("timings"):
+            return {"results": data, "strategy": strategy, "timings": timer.breakdown()}
+        return {"results": data, "strategy": strategy}
+    except HTTPException:
+        raise
+    except KeyError as e:
+        raise HTTPException(status_code=400, detail=f"Missing field: {e}")
     except Exception as e:
         print(f"Error during dynamic scraping: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+async def extraction_spec(payload: dict):
+    """
+    Expand a {"recipe": id} reference into the stored container_selector and
+    custom_fields (keys given in the payload take precedence). 404 for unknown
+    recipes, 400 for unknown field types or extraction modes.
+    """
+    recipe_id = payload.get("recipe")
+    if recipe_id is not None:
+        recipe = await asyncio.to_thread(recipe_store.get, recipe_id)
+        if recipe is None:
+            raise HTTPException(status_code=404, detail=f"Recipe '{recipe_id}' not found")
+        payload = {**recipe, **payload}
+    for field in payload.get("custom_fields") or []:
+        if field.get("type") is not None and field["type"] not in FIELD_TYPES:
+            raise HTTPException(status_code=400, detail=f"Field type must be one of {', '.join(FIELD_TYPES)}")
+    extraction_mode_of(payload)
+    return payload
+
+
+def require_scrape_fields(payload: dict):
+    for key in ("url", "container_selector", "custom_fields"):
+        if key not in payload:
+            raise HTTPException(status_code=400, detail=f"Missing field: '{key}'")
+
+
+def pagination_plan(payload: dict):
+    """Validate pagination fields of a payload; returns (start_page, end_page, pagination_type)"""
+    require_scrape_fields(payload)
+    start_page = int(payload.get("start_page", 1))
+    end_page = int(payload.get("end_page", start_page))
+    pagination_type = payload.get("pagination_type", "URL Parameter")
+    if end_page < start_page:
+        raise HTTPException(status_code=400, detail="end_page must be greater than or equal to start_page")
+    if pagination_type not in ("URL Parameter", "Next Button"):
+        raise HTTPException(status_code=400, detail="pagination_type must be 'URL Parameter' or 'Next Button'")
+    if pagination_type == "URL Parameter" and not payload.get("page_param"):
+        raise HTTPException(status_code=400, detail="page_param is required for 'URL Parameter' pagination")
+    return start_page, end_page, pagination_type
+
+
+def pagination_engine_for(payload: dict):
+    """PaginationEngine scraping every page like /scrape-dynamic would"""
+    async def fetch_page(page_url):
+        return await cached_scrape_page({**payload, "url": page_url})
+
+    window = min(int(payload.get("max_concurrency", domain_limiter.max_concurrency)), domain_limiter.max_concurrency)
+    return PaginationEngine(fetch_page, domain_limiter, window=window)
+
+
+async def scrape_next_button_pages(payload: dict, start_page: int, end_page: int):
+    """Next Button pagination has to click through pages one by one on a single browser"""
+    extraction_mode = extraction_mode_of(payload)
+    if browser_workers is not None:
+        data = (await forward_to_browser_worker("/scrape-dynamic-paginated", payload))["results"]
+        ROWS.inc(len(data), strategy=DYNAMIC)
+        return data
+    data = await run_dynamic(
+        scrape_dynamic_pagination_data,
+        payload["url"],
+        payload["container_selector"],
+        payload["custom_fields"],
+        start_page,
+        end_page,
+        "Next Button",
+        next_button_selector=payload.get("next_button_selector"),
+        enable_scrolling=payload.get("enable_scrolling", False),
+        max_scrolls=payload.get("max_scrolls", 5),
+        pool=driver_pool,
+        fixed_delays=payload.get("fixed_delays", False),
+        extraction_mode=extraction_mode,
+        resource_policy=resource_policy_of(payload)
+    )
+    ROWS.inc(len(data), strategy=DYNAMIC)
+    return data
+
+
+async def iter_next_button_pages(payload: dict, start_page: int, end_page: int):
+    """Next Button pagination page by page: async generator of (page_info, records) as pages complete"""
+    extraction_mode = extraction_mode_of(payload)
+    resource_policy = resource_policy_of(payload)
+    if browser_workers is not None:
+        info, records = None, []
+        try:
+            async for event in browser_workers.stream(
+                http_client, "/scrape-dynamic-paginated/stream", browser_worker_payload(payload)
+            ):
+                if event["type"] == "row":
+                    records.append(event["data"])
+                    continue
+                # A page's rows end where the next page (or the end of the stream) starts
+                if info is not None:
+                    ROWS.inc(len(records), strategy=DYNAMIC)
+                    yield info, records
+                    info, records = None, []
+                if event["type"] == "page":
+                    info = {key: value for key, value in event.items() if key != "type"}
+                elif event["type"] == "error":
+                    raise RuntimeError(event["detail"])
+        except BrowserWorkerError as e:
+            raise HTTPException(status_code=e.status_code, detail=e.detail)
+        return
+    await acquire_dynamic_slot()
+    async for info, records in iterate_in_thread(
+        dynamic_executor,
+        iter_dynamic_pagination_data,
+        payload["url"],
+        payload["container_selector"],
+        payload["custom_fields"],
+        start_page,
+        end_page,
+        "Next Button",
+        next_button_selector=payload.get("next_button_selector"),
+        enable_scrolling=payload.get("enable_scrolling", False),
+        max_scrolls=payload.get("max_scrolls", 5),
+        pool=driver_pool,
+        fixed_delays=payload.get("fixed_delays", False),
+        extraction_mode=extraction_mode,
+        resource_policy=resource_policy,
+        on_done=dynamic_slots.release,
+    ):
+        ROWS.inc(len(records), strategy=DYNAMIC)
+        yield info, records
+
+
+@app.post("/scrape-dynamic-paginated")
+async def scrape_dynamic_paginated(
+    payload: dict = Body(...),
+    format: str = None,
+    compression: str = None
+):
+    """
+    Expects the /scrape-dynamic JSON plus:
+    {
+        "start_page": int (optional, defaults to 1),
+        "end_page": int (optional, defaults to start_page),
+        "pagination_type": "URL Parameter" | "Next Button" (optional, defaults to "URL Parameter"),
+        "page_param": str (required for "URL Parameter"),
+        "next_button_selector": str (optional XPath for "Next Button"),
+        "max_concurrency": int (optional, capped by SCRAPER_DOMAIN_CONCURRENCY)
+    }
+    "URL Parameter" pages are fetched concurrently and merged in page order,
+    stopping at the first empty page. ?format= and ?compression= work as on /scrape-dynamic.
+    """
+    timer = start_request_timer()
+    try:
+        payload = await extraction_spec(payload)
+        start_page, end_page, pagination_type = pagination_plan(payload)
+        if format and format != "json":
+            return await export_response(payload, scrape_pages_events(payload), format, compression)
+        if pagination_type == "Next Button":
+            response = {"results": await scrape_next_button_pages(payload, start_page, end_page), "pages": None}
+        else:
+            pages = url_parameter_pages(payload["url"], payload["page_param"], start_page, end_page)
+            data, page_infos = await pagination_engine_for(payload).collect(pages)
+            response = {"results": data, "pages": page_infos}
+        if payload.get("timings"):
+            response["timings"] = timer.breakdown()
+        return response
+    except HTTPException:
+        raise
+    except KeyError as e:
+        raise HTTPException(status_code=400, detail=f"Missing field: {e}")
+    except Exception as e:
+        print(f"Error during paginated scraping: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+async def stream_dynamic_rows(payload: dict):
+    """Yield rows of a dynamic scrape as the browser extracts them"""
+    extraction_mode = extraction_mode_of(payload)
+    enable_scrolling = payload.get("enable_scrolling", False)
+    incremental = incremental_options(payload) if enable_scrolling else None
+    if browser_workers is not None:
+        resource_policy_of(payload)
+        try:
+            async for event in browser_workers.stream(
+                http_client, "/scrape-dynamic/stream", browser_worker_payload(payload)
+            ):
+                if event["type"] == "row":
+                    yield event["data"]
+                elif event["type"] == "error":
+                    raise RuntimeError(event["detail"])
+        except BrowserWorkerError as e:
+            raise HTTPException(status_code=e.status_code, detail=e.detail)
+        return
+    if extraction_mode == "snapshot" and incremental is None:
+        data, _ = await scrape_page({**payload, "strategy": DYNAMIC})
+        for row in data:
+            yield row
+        return
+    resource_policy = resource_policy_of(payload)
+    await acquire_dynamic_slot()
+    async for row in iterate_in_thread(
+        dynamic_executor,
+        iter_dynamic_data,
+        payload["url"],
+        payload["container_selector"],
+        payload["custom_fields"],
+        enable_scrolling=enable_scrolling,
+        max_scrolls=payload.get("max_scrolls", 5),
+        pool=driver_pool,
+        fixed_delays=payload.get("fixed_delays", False),
+        extraction_mode=extraction_mode,
+        resource_policy=resource_policy,
+        incremental=incremental,
+        on_done=dynamic_slots.release,
+    ):
+        yield row
+
+
+def error_event(e, rows):
+    """
+    Final event of a failed stream. The response is already 200 by then, so "status" carries
+    the HTTP status the failure stands for; 503 (no browser or memory to spare) lets an API
+    process retry on another browser worker when no row was sent yet.
+    """
+    status = 503 if isinstance(e, PoolExhaustedError) else getattr(e, "status_code", 500)
+    return {"type": "error", "detail": getattr(e, "detail", None) or str(e), "status": status, "rows": rows}
+
+
+async def scrape_page_events(payload: dict):
+    """Events of a single-page scrape: one "row" per container, then "done" (or "error")"""
+    count = 0
+    try:
+        cached = result_cache.get(result_cache.make_key("page", payload["url"], payload)) if payload.get("cache", True) else None
+        if cached is not None:
+            records, strategy = cached["value"]["results"], cached["value"]["strategy"]
+        else:
+            records, strategy = await resolve_static(payload)
+        rows = stream_dynamic_rows(payload) if records is None else None
+        yield {"type": "start", "url": payload["url"], "strategy": strategy}
+        if rows is None:
+            for row in records:
+                count += 1
+                yield {"type": "row", "data": row}
+        else:
+            async for row in rows:
+                count += 1
+                yield {"type": "row", "data": row}
+            remember_dynamic(payload, count > 0)
+            ROWS.inc(count, strategy=DYNAMIC)
+        yield {"type": "done", "rows": count, "strategy": strategy}
+    except Exception as e:
+        print(f"Error during streaming scrape: {e}")
+        yield error_event(e, count)
+
+
+async def scrape_pages_events(payload: dict):
+    """Events of a paginated scrape: "page" then its "row"s, in page order, then "done" (or "error")"""
+    count = 0
+    try:
+        start_page, end_page, pagination_type = pagination_plan(payload)
+        yield {"type": "start", "url": payload["url"], "pagination_type": pagination_type}
+        if pagination_type == "Next Button":
+            page_results = iter_next_button_pages(payload, start_page, end_page)
+        else:
+            pages = url_parameter_pages(payload["url"], payload["page_param"], start_page, end_page)
+            page_results = pagination_engine_for(payload).iter_pages(pages)
+        async for info, records in page_results:
+            yield {"type": "page", **info}
+            for row in records:
+                count += 1
+                yield {"type": "row", "data": row}
+        yield {"type": "done", "rows": count}
+    except Exception as e:
+        print(f"Error during streaming paginated scrape: {e}")
+        yield error_event(e, count)
+
+
+def streaming_response(events, stream_format: str):
+    if stream_format not in STREAM_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {', '.join(STREAM_FORMATS)}")
+    return StreamingResponse(
+        encode_events(events, stream_format),
+        media_type=STREAM_FORMATS[stream_format],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def rows_from_events(events):
+    """Row data out of scrape events; an "error" event aborts the export"""
+    async for event in events:
+        if event["type"] == "row":
+            yield event["data"]
+        elif event["type"] == "error":
+            raise RuntimeError(event["detail"])
+
+
+async def export_response(payload: dict, events, export_format: str, compression: str = None):
+    """Stream scrape events as a CSV/JSONL/Parquet download without holding all rows"""
+    compression = compression or default_compression(export_format)
+    try:
+        validate_export(export_format, compression)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    columns = [field["name"] for field in payload["custom_fields"]]
+    chunks = export_chunks(rows_from_events(events), columns, export_format, compression)
+    # Failures before the first chunk still get a proper HTTP error; later ones abort the download
+    try:
+        first_chunk = await chunks.__anext__()
+    except StopAsyncIteration:
+        first_chunk = None
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def body():
+        if first_chunk is not None:
+            yield first_chunk
+        async for chunk in chunks:
+            yield chunk
+
+    filename = export_filename("scrape-results", export_format, compression)
+    return StreamingResponse(
+        body(),
+        media_type=export_media_type(export_format, compression),
+        headers={"Content-Disposition": f'attachment; filename="{filename}"', "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/scrape-dynamic/stream")
+async def scrape_dynamic_stream(
+    payload: dict = Body(...),
+    format: str = "ndjson"
+):
+    """
+    Same payload as /scrape-dynamic; streams events as NDJSON (default) or SSE (?format=sse):
+    {"type": "start"}, one {"type": "row", "data": {...}} per container, then {"type": "done"}.
+    """
+    payload = await extraction_spec(payload)
+    require_scrape_fields(payload)
+    return streaming_response(scrape_page_events(payload), format)
+
+
+@app.post("/scrape-dynamic-paginated/stream")
+async def scrape_dynamic_paginated_stream(
+    payload: dict = Body(...),
+    format: str = "ndjson"
+):
+    """Same payload as /scrape-dynamic-paginated; streams page and row events in page order"""
+    payload = await extraction_spec(payload)
+    pagination_plan(payload)
+    return streaming_response(scrape_pages_events(payload), format)
+
+async def run_job(job: dict, progress):
+    """Job runner: single pages are stored in one go, paginated jobs page by page"""
+    payload = job["payload"]
+    if job["kind"] == "pagination":
+        start_page, end_page, pagination_type = pagination_plan(payload)
+        if pagination_type == "Next Button":
+            page_results = iter_next_button_pages(payload, start_page, end_page)
+        else:
+            pages = url_parameter_pages(payload["url"], payload["page_param"], start_page, end_page)
+            page_results = pagination_engine_for(payload).iter_pages(pages)
+        async for info, records in page_results:
+            if info["error"]:
+                raise RuntimeError(f"Page {info['page']} failed: {info['error']}")
+            await progress.add_page(info["page"], records)
+    else:
+        data, _ = await cached_scrape_page(payload)
+        await progress.add_page(None, data)
+
+
+
+@app.post("/jobs")
+async def create_jobs(
+    payload: dict = Body(...)
+):
+    """
+    Enqueue a scrape and return its id right away. Expects a /scrape-dynamic or
+    /scrape-dynamic-paginated payload plus:
+    {
+        "kind": "page" | "pagination" (optional, "pagination" when pagination fields are present),
+        "priority": int (optional, higher runs first, defaults to 0),
+        "urls": list of str (optional, enqueue one job per URL instead of "url")
+    }
+    """
+    priority = payload.pop("priority", 0)
+    urls = payload.pop("urls", None)
+    kind = payload.pop("kind", None)
+    if not isinstance(priority, int) or isinstance(priority, bool):
+        raise HTTPException(status_code=400, detail="priority must be an integer")
+    if urls is not None and (not isinstance(urls, list) or not urls or not all(isinstance(url, str) for url in urls)):
+        raise HTTPException(status_code=400, detail="urls must be a non-empty list of strings")
+    if kind is None:
+        kind = "pagination" if "end_page" in payload or "pagination_type" in payload else "page"
+    if kind not in ("page", "pagination"):
+        raise HTTPException(status_code=400, detail="kind must be 'page' or 'pagination'")
+    # Recipes are expanded at submit time so queued jobs do not depend on them
+    spec = await extraction_spec(payload)
+    specs = [{**spec, "url": url} for url in urls] if urls else [spec]
+    for spec in specs:
+        if kind == "pagination":
+            pagination_plan(spec)
+        else:
+            require_scrape_fields(spec)
+    job_ids = [await job_queue.submit(kind, spec, priority) for spec in specs]
+    if urls:
+        return {"job_ids": job_ids}
+    return {"job_id": job_ids[0]}
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Status and progress (pages done, rows so far) of a job"""
+    job = await asyncio.to_thread(job_queue.store.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@app.get("/jobs/{job_id}/results")
+async def get_job_results(job_id: str, offset: int = 0, limit: int = 100):
+    """Page through the rows a job has stored so far"""
+    job = await asyncio.to_thread(job_queue.store.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    limit = max(1, min(limit, 1000))
+    results = await asyncio.to_thread(job_queue.store.results, job_id, max(0, offset), limit)
+    return {
+        "job_id": job_id,
+        "status": job["status"],
+        "offset": offset,
+        "limit": limit,
+        "total": job["rows_done"],
+        "results": results,
+    }
+
+
+@app.post("/recipes")
+async def create_recipe(
+    payload: dict = Body(...)
+):
+    """
+    Register (or replace) a named extraction recipe:
+    {
+        "id": str (letters, digits, ".", "_" or "-"),
+        "container_selector": str,
+        "custom_fields": list of {"name": str, "selector": str,
+                          "type": "auto" | "text" | "href" | "src" | "price" (optional, defaults to "auto":
+                          decided from the first container that has the field)}
+    }
+    Selectors are validated and compiled once; scrape payloads then send {"recipe": id}
+    instead of container_selector and custom_fields.
+    """
+    recipe_id = payload.pop("id", None)
+    try:
+        recipe = await asyncio.to_thread(recipe_store.put, recipe_id, payload)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"id": recipe_id, **recipe}
+
+
+@app.get("/recipes")
+async def list_recipes():
+    """All registered recipes by id"""
+    return await asyncio.to_thread(recipe_store.list)
+
+
+@app.get("/recipes/{recipe_id}")
+async def get_recipe(recipe_id: str):
+    recipe = await asyncio.to_thread(recipe_store.get, recipe_id)
+    if recipe is None:
+        raise HTTPException(status_code=404, detail="Recipe not found")
+    return {"id": recipe_id, **recipe}
+
+
+@app.delete("/recipes/{recipe_id}")
+async def delete_recipe(recipe_id: str):
+    if not await asyncio.to_thread(recipe_store.delete, recipe_id):
+        raise HTTPException(status_code=404, detail="Recipe not found")
+    return {"id": recipe_id, "deleted": True}
+
+
+@app.get("/job-metrics")
+async def job_metrics():
+    """Queue depth, running jobs and job counts by status"""
+    return await asyncio.to_thread(job_queue.metrics)
+
+@app.get("/cache-metrics")
+async def cache_metrics():
+    """Hit/miss/coalescing/revalidation counters of the result cache"""
+    return result_cache.metrics()
+
+def snapshot_fields(snapshot, keys):
+    """Callback for a labelled gauge: the given keys of one snapshot() call (unknown values are skipped)"""
+    def read():
+        values = snapshot()
+        return {key: values[key] for key in keys if values[key] is not None}
+    return read
+
+
+registry.gauge(
+    "scraper_browsers", "Pooled Chrome instances by state",
+    snapshot_fields(driver_pool.metrics, ("alive", "in_use", "idle", "starting")), ("state",),
+)
+registry.gauge(
+    "scraper_browser_events_total", "Browser pool lifetime events",
+    snapshot_fields(driver_pool.metrics, ("created", "recycled", "health_check_failures", "borrows", "borrow_timeouts")),
+    ("event",), kind="counter",
+)
+registry.gauge(
+    "scraper_cache_events_total", "Result cache lookups and stores",
+    snapshot_fields(result_cache.metrics, ("hits", "disk_hits", "misses", "coalesced", "revalidated", "stores", "evictions")),
+    ("event",), kind="counter",
+)
+registry.gauge(
+    "scraper_process_tree_rss_megabytes", "Resident memory of this process and its Chrome children",
+    lambda: memory_guard.reading()["rss_mb"] or 0,
+)
+if driver_pool.budget is not None:
+    registry.gauge(
+        "scraper_browser_budget", "Machine-wide Chrome slots shared by all processes",
+        snapshot_fields(driver_pool.budget.metrics, ("in_use", "free")), ("state",),
+    )
+registry.gauge("scraper_cache_entries", "Entries in the in-memory result cache", lambda: result_cache.metrics()["entries"])
+registry.gauge(
+    "scraper_jobs", "Jobs waiting for or running on a worker of this process",
+    snapshot_fields(lambda: job_queue.metrics(), ("pending", "running")), ("state",),
+)
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus text exposition of request, phase, row, fill-rate, browser, cache and job metrics"""
+    body = await asyncio.to_thread(registry.render)
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
+
+
+@app.get("/health")
+async def health():
+    """
+    Readiness probe for the supervisor and load balancers: answers once startup
+    (browser warm-up included) is done and 503 while draining. Reports memory,
+    browser budget and pool occupancy of this process.
+    """
+    memory = await asyncio.to_thread(memory_guard.reading)
+    # With a browser budget this reads the kernel lock table
+    pool = await asyncio.to_thread(driver_pool.metrics)
+    body = {
+        "status": "draining" if draining else ("memory_pressure" if memory["pressure"] else "ok"),
+        "role": PROCESS_ROLE,
+        "pid": os.getpid(),
+        "memory": memory,
+        "browsers": {key: pool[key] for key in ("alive", "in_use", "idle", "size")},
+    }
+    if "budget" in pool:
+        body["browser_budget"] = pool["budget"]
+    if browser_workers is not None:
+        body["browser_workers"] = browser_workers.metrics()
+    return JSONResponse(body, status_code=503 if draining else 200)
+
+
+@app.get("/pool-metrics")
+async def pool_metrics():
+    """Occupancy and lifetime counters of the shared WebDriver pool"""
+    return await asyncio.to_thread(driver_pool.metrics)
+
+@app.get("/strategy-memory")
+async def strategy_memory_snapshot():
+    """Per-domain strategy learned by the auto mode of /scrape-dynamic"""
+    return strategy_memory.snapshot()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
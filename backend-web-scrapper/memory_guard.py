@@ -0,0 +1,111 @@
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def process_tree_rss_mb(root=None):
+    """Resident memory of a process (this one by default) and its descendants, Chrome included; Linux only"""
+    try:
+        children = {}
+        for pid in os.listdir("/proc"):
+            if pid.isdigit():
+                try:
+                    with open(f"/proc/{pid}/stat") as stat:
+                        ppid = int(stat.read().rsplit(")", 1)[1].split()[1])
+                except (OSError, IndexError, ValueError):
+                    continue
+                children.setdefault(ppid, []).append(int(pid))
+        total, pending = 0, [root or os.getpid()]
+        while pending:
+            pid = pending.pop()
+            try:
+                with open(f"/proc/{pid}/statm") as statm:
+                    total += int(statm.read().split()[1]) * PAGE_SIZE
+            except OSError:
+                continue
+            pending.extend(children.get(pid, []))
+        return round(total / 1024 / 1024, 1)
+    except OSError:
+        return None
+
+
+def available_memory_mb():
+    """MemAvailable of the machine (or container) from /proc/meminfo; None when unknown"""
+    try:
+        with open("/proc/meminfo") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+class MemoryGuard:
+    """Back-pressure for browser work based on memory use.
+
+    Reports pressure when this process tree (the API or browser worker plus
+    its Chrome children) exceeds ``max_rss_mb`` or the machine has less than
+    ``min_available_mb`` left. Readings are cached for ``check_interval``
+    seconds since walking /proc is not free. A limit of 0 disables that check.
+    """
+
+    def __init__(self, max_rss_mb=0, min_available_mb=0, check_interval=1.0):
+        self.max_rss_mb = max_rss_mb
+        self.min_available_mb = min_available_mb
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._checked_at = 0.0
+        self._reading = {"rss_mb": None, "available_mb": None, "pressure": None}
+        self._metrics = {"checks": 0, "pressure_checks": 0}
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            max_rss_mb=float(os.getenv("SCRAPER_MAX_RSS_MB", "0")),
+            min_available_mb=float(os.getenv("SCRAPER_MIN_AVAILABLE_MB", "0")),
+        )
+
+    @property
+    def enabled(self):
+        return self.max_rss_mb > 0 or self.min_available_mb > 0
+
+    def reading(self):
+        """Cached {"rss_mb", "available_mb", "pressure"} where pressure is None or the reason"""
+        with self._lock:
+            if time.monotonic() - self._checked_at < self.check_interval:
+                return dict(self._reading)
+        rss = process_tree_rss_mb()
+        available = available_memory_mb()
+        pressure = None
+        if self.max_rss_mb > 0 and rss is not None and rss > self.max_rss_mb:
+            pressure = f"process tree uses {rss:.0f} MB (limit {self.max_rss_mb:.0f} MB)"
+        elif self.min_available_mb > 0 and available is not None and available < self.min_available_mb:
+            pressure = f"only {available:.0f} MB available (minimum {self.min_available_mb:.0f} MB)"
+        with self._lock:
+            self._checked_at = time.monotonic()
+            self._reading = {"rss_mb": rss, "available_mb": available, "pressure": pressure}
+            self._metrics["checks"] += 1
+            if pressure:
+                self._metrics["pressure_checks"] += 1
+        if pressure:
+            logger.warning(f"Memory pressure: {pressure}")
+        return {"rss_mb": rss, "available_mb": available, "pressure": pressure}
+
+    def pressure(self):
+        """None when there is room for more browser work, else the reason there is not"""
+        if not self.enabled:
+            return None
+        return self.reading()["pressure"]
+
+    def metrics(self):
+        with self._lock:
+            snapshot = dict(self._metrics)
+        snapshot.update(self.reading())
+        snapshot.update({"max_rss_mb": self.max_rss_mb, "min_available_mb": self.min_available_mb})
+        return snapshot
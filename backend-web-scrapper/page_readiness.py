@@ -0,0 +1,193 @@
+import json
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+NETWORK_REQUEST_STARTED = "Network.requestWillBeSent"
+NETWORK_REQUEST_DONE = ("Network.loadingFinished", "Network.loadingFailed")
+
+
+class PageReadiness:
+    """Wait on real page-readiness signals instead of fixed sleeps.
+
+    Every wait polls with a short interval and returns as soon as its signal
+    is satisfied; ``timeout`` only bounds the worst case.
+    """
+
+    def __init__(self, driver, timeout=20, poll_interval=0.2, stable_polls=2,
+                 network_idle_time=0.5, max_inflight_requests=2, accept_interactive=False):
+        self.driver = driver
+        # With the "eager" page-load strategy the DOM is usable at 'interactive';
+        # waiting for 'complete' would reintroduce the wait on subresources.
+        self.ready_states = ("interactive", "complete") if accept_interactive else ("complete",)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.stable_polls = stable_polls
+        self.network_idle_time = network_idle_time
+        self.max_inflight_requests = max_inflight_requests
+        self._inflight = set()
+        self._performance_log_available = True
+
+    def begin_navigation(self):
+        """Forget network activity from the previous page; call right before driver.get"""
+        self._inflight.clear()
+        self._read_performance_log()
+
+    def _read_performance_log(self):
+        """Drain the DevTools performance log, returning False when it is not enabled"""
+        if not self._performance_log_available:
+            return False
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception:
+            logger.debug("DevTools performance log not available, using resource timing instead")
+            self._performance_log_available = False
+            return False
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError, TypeError):
+                continue
+            method = message.get("method")
+            request_id = message.get("params", {}).get("requestId")
+            if method == NETWORK_REQUEST_STARTED:
+                self._inflight.add(request_id)
+            elif method in NETWORK_REQUEST_DONE:
+                self._inflight.discard(request_id)
+        return True
+
+    def _poll(self, probe, timeout=None):
+        """Call probe every poll_interval until it returns a truthy value or timeout expires"""
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        while True:
+            result = probe()
+            if result:
+                return result
+            if time.monotonic() >= deadline:
+                return result
+            time.sleep(self.poll_interval)
+
+    def wait_for_document_ready(self, timeout=None):
+        """Wait until document.readyState is 'complete' (or 'interactive' when accepted)"""
+        timeout = self.timeout if timeout is None else timeout
+        ready = self._poll(
+            lambda: self.driver.execute_script("return document.readyState") in self.ready_states, timeout
+        )
+        if not ready:
+            logger.warning(f"document.readyState not {' or '.join(self.ready_states)} after {timeout:.1f} seconds")
+        return ready
+
+    def wait_for_network_idle(self, timeout=None, unless=None):
+        """
+        Wait until no more than max_inflight_requests are pending for network_idle_time.
+        The wait also ends as soon as the optional ``unless`` probe returns True.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        state = {"idle_since": None, "resource_count": None}
+
+        def probe():
+            now = time.monotonic()
+            if self._read_performance_log():
+                idle = len(self._inflight) <= self.max_inflight_requests
+            else:
+                # Without DevTools logging treat a stable resource-timing count as idle
+                count = self.driver.execute_script(
+                    "return performance.getEntriesByType('resource').length;"
+                )
+                idle = count == state["resource_count"]
+                state["resource_count"] = count
+            if not idle:
+                state["idle_since"] = None
+                return bool(unless and unless())
+            if state["idle_since"] is None:
+                state["idle_since"] = now
+            return now - state["idle_since"] >= self.network_idle_time or bool(unless and unless())
+
+        idle = self._poll(probe, timeout)
+        if not idle:
+            logger.warning(f"Network did not become idle within {timeout:.1f} seconds")
+        return idle
+
+    def _containers_settled(self, container_selector):
+        """Probe returning True once containers are present and their count is stable across polls"""
+        state = {"count": -1, "stable": 0}
+
+        def probe():
+            count = self.driver.execute_script(
+                "return document.querySelectorAll(arguments[0]).length;", container_selector
+            )
+            if count and count == state["count"]:
+                state["stable"] += 1
+            else:
+                state["stable"] = 0
+            state["count"] = count
+            return state["stable"] >= self.stable_polls
+
+        probe.state = state
+        return probe
+
+    def wait_for_containers(self, container_selector, timeout=None):
+        """Wait until containers are present and their count is stable across polls"""
+        settled = self._containers_settled(container_selector)
+        stable = self._poll(settled, self.timeout if timeout is None else timeout)
+        logger.info(f"Container count settled at {settled.state['count']} (stable={bool(stable)})")
+        return settled.state["count"]
+
+    def wait_for_scroll_height_change(self, previous_height, max_wait):
+        """Wait up to max_wait for scrollHeight to grow and settle; returns the new height"""
+        state = {"height": previous_height, "stable": 0}
+
+        def probe():
+            height = self.driver.execute_script("return document.body.scrollHeight")
+            if height != previous_height and height == state["height"]:
+                state["stable"] += 1
+            else:
+                state["stable"] = 0
+            state["height"] = height
+            return state["stable"] >= 1
+
+        self._poll(probe, timeout=max_wait)
+        return state["height"]
+
+    def wait_for_new_containers(self, container_selector, mark, max_wait):
+        """Wait up to max_wait for containers without the mark attribute to appear and settle; returns their count"""
+        state = {"count": 0, "stable": 0}
+
+        def probe():
+            count = self.driver.execute_script(
+                "return Array.from(document.querySelectorAll(arguments[0]))"
+                ".filter(el => !el.hasAttribute(arguments[1])).length;",
+                container_selector, mark
+            )
+            if count and count == state["count"]:
+                state["stable"] += 1
+            else:
+                state["stable"] = 0
+            state["count"] = count
+            return state["stable"] >= 1
+
+        self._poll(probe, timeout=max_wait)
+        return state["count"]
+
+    def wait_until_ready(self, container_selector=None):
+        """
+        Wait for the document, the network and (optionally) the containers to settle,
+        all within one ``timeout``. Pages with analytics or long polling never go
+        idle, so once the container count is stable the network wait ends early.
+        """
+        started = time.monotonic()
+        deadline = started + self.timeout
+
+        def remaining():
+            return max(0.0, deadline - time.monotonic())
+
+        self.wait_for_document_ready(remaining())
+        settled = self._containers_settled(container_selector) if container_selector else None
+        self.wait_for_network_idle(remaining(), unless=settled)
+        if settled is not None:
+            if settled.state["stable"] >= self.stable_polls:
+                logger.info(f"Container count settled at {settled.state['count']} (stable=True)")
+            else:
+                self.wait_for_containers(container_selector, remaining())
+        logger.info(f"Page ready after {time.monotonic() - started:.2f} seconds")
@@ -0,0 +1,117 @@
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+
+from .dynamic_web_scrapper import build_page_url
+from .scrape_strategy import domain_of
+
+logger = logging.getLogger(__name__)
+
+
+class DomainLimiter:
+    """Per-domain concurrency cap and request-start rate limit, shared across requests"""
+
+    def __init__(self, max_concurrency=2, rate=2.0):
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.rate = rate
+        self._semaphores = {}
+        self._next_start = {}
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            max_concurrency=int(os.getenv("SCRAPER_DOMAIN_CONCURRENCY", "2")),
+            rate=float(os.getenv("SCRAPER_DOMAIN_RATE", "2")),
+        )
+
+    async def _throttle(self, domain):
+        if not self.rate or self.rate <= 0:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start.get(domain, now))
+            self._next_start[domain] = start_at + 1.0 / self.rate
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+
+    @asynccontextmanager
+    async def slot(self, url):
+        """Hold one of the domain's concurrency slots, respecting its rate limit"""
+        domain = domain_of(url)
+        semaphore = self._semaphores.setdefault(domain, asyncio.Semaphore(self.max_concurrency))
+        async with semaphore:
+            await self._throttle(domain)
+            yield
+
+
+def url_parameter_pages(url, page_param, start_page, end_page):
+    """(page, url) pairs for "URL Parameter" pagination, known up front"""
+    return [(page, build_page_url(url, page_param, page)) for page in range(start_page, end_page + 1)]
+
+
+class PaginationEngine:
+    """Fan pages out concurrently and yield their results strictly in page order.
+
+    ``fetch_page`` is a coroutine ``(url) -> (records, strategy)``. At most
+    ``window`` pages are in flight ahead of the consumer, so stopping on the
+    first empty page wastes little work.
+    """
+
+    def __init__(self, fetch_page, limiter, window=None):
+        self.fetch_page = fetch_page
+        self.limiter = limiter
+        self.window = max(1, window or limiter.max_concurrency)
+
+    async def _fetch(self, page, url):
+        started = time.monotonic()
+        info = {"page": page, "url": url, "rows": 0, "strategy": None, "error": None}
+        records = []
+        try:
+            async with self.limiter.slot(url):
+                records, info["strategy"] = await self.fetch_page(url)
+            info["rows"] = len(records)
+        except Exception as e:
+            logger.error(f"Error scraping page {page} ({url}): {str(e)}")
+            info["error"] = getattr(e, "detail", None) or str(e)
+        info["seconds"] = round(time.monotonic() - started, 3)
+        return info, records
+
+    async def iter_pages(self, pages):
+        """Async generator of (page_info, records) in page order; stops after the first empty page"""
+        remaining = iter(pages)
+        in_flight = deque()
+
+        def schedule():
+            while len(in_flight) < self.window:
+                try:
+                    page, url = next(remaining)
+                except StopIteration:
+                    return
+                in_flight.append(asyncio.create_task(self._fetch(page, url)))
+
+        try:
+            schedule()
+            while in_flight:
+                info, records = await in_flight.popleft()
+                yield info, records
+                if not records:
+                    logger.info(f"Page {info['page']} returned no data, stopping pagination")
+                    break
+                schedule()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def collect(self, pages):
+        """Run iter_pages to completion, merging rows with a single list extend per page"""
+        results, page_infos = [], []
+        async for info, records in self.iter_pages(pages):
+            page_infos.append(info)
+            results.extend(records)
+        return results, page_infos
@@ -0,0 +1,130 @@
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from cssselect import HTMLTranslator, SelectorError
+
+from .data_paths import data_path
+from .dynamic_web_scrapper import FIELD_TYPES, compile_field_plans
+
+logger = logging.getLogger(__name__)
+
+RECIPE_ID_PATTERN = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+
+
+def validate_selector(selector, label):
+    """Raise ValueError when a CSS selector cannot be compiled"""
+    if not isinstance(selector, str) or not selector.strip():
+        raise ValueError(f"{label} must be a non-empty CSS selector")
+    try:
+        HTMLTranslator().css_to_xpath(selector)
+    except SelectorError as e:
+        raise ValueError(f"Invalid CSS selector for {label} '{selector}': {e}")
+
+
+def validate_recipe(spec: dict):
+    """
+    Validate an extraction recipe {"container_selector", "custom_fields": [{"name", "selector",
+    "type" (optional)}]} and return its normalized form: field types default to "auto".
+    Raises ValueError with a message suitable for a 400 response.
+    """
+    if not isinstance(spec, dict):
+        raise ValueError("A recipe must be a JSON object")
+    validate_selector(spec.get("container_selector"), "container_selector")
+    fields = spec.get("custom_fields")
+    if not isinstance(fields, list) or not fields:
+        raise ValueError("custom_fields must be a non-empty list")
+    normalized = []
+    names = set()
+    for field in fields:
+        if not isinstance(field, dict) or not isinstance(field.get("name"), str) or not field["name"]:
+            raise ValueError("Every custom field needs a name")
+        if field["name"] in names:
+            raise ValueError(f"Duplicate field name '{field['name']}'")
+        names.add(field["name"])
+        validate_selector(field.get("selector"), f"field '{field['name']}'")
+        field_type = field.get("type", "auto")
+        if field_type not in FIELD_TYPES:
+            raise ValueError(f"Unknown type '{field_type}' for field '{field['name']}', expected one of {', '.join(FIELD_TYPES)}")
+        normalized.append({"name": field["name"], "selector": field["selector"], "type": field_type})
+    # Compile once now so the first scrape using the recipe finds the plans cached
+    compile_field_plans(normalized)
+    return {"container_selector": spec["container_selector"], "custom_fields": normalized}
+
+
+class RecipeStore:
+    """Named extraction recipes persisted to SQLite.
+
+    Several API processes may share the database, so lookups always check the
+    stored version; a recipe is only parsed and validated again after it changed.
+    """
+
+    def __init__(self, path="scraper-recipes.sqlite3"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS recipes (id TEXT PRIMARY KEY, recipe TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+        # id -> (updated_at, validated recipe)
+        self._recipes = {}
+
+    @classmethod
+    def from_env(cls):
+        return cls(os.getenv("SCRAPER_RECIPES_DB") or data_path("scraper-recipes.sqlite3"))
+
+    def _load(self, recipe_id, recipe, updated_at):
+        cached = self._recipes.get(recipe_id)
+        if cached is not None and cached[0] == updated_at:
+            return cached[1]
+        try:
+            validated = validate_recipe(json.loads(recipe))
+        except ValueError as e:
+            logger.warning(f"Skipping stored recipe '{recipe_id}': {str(e)}")
+            return None
+        self._recipes[recipe_id] = (updated_at, validated)
+        return validated
+
+    def put(self, recipe_id, spec):
+        """Validate, compile and store a recipe under recipe_id (replacing any previous one)"""
+        if not isinstance(recipe_id, str) or not RECIPE_ID_PATTERN.match(recipe_id):
+            raise ValueError("Recipe id must be 1-64 letters, digits, '.', '_' or '-'")
+        recipe = validate_recipe(spec)
+        updated_at = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO recipes (id, recipe, updated_at) VALUES (?, ?, ?)",
+                (recipe_id, json.dumps(recipe), updated_at),
+            )
+            self._recipes[recipe_id] = (updated_at, recipe)
+        return recipe
+
+    def get(self, recipe_id):
+        with self._lock:
+            row = self._conn.execute("SELECT recipe, updated_at FROM recipes WHERE id = ?", (recipe_id,)).fetchone()
+            if row is None:
+                self._recipes.pop(recipe_id, None)
+                return None
+            return self._load(recipe_id, *row)
+
+    def delete(self, recipe_id):
+        with self._lock, self._conn:
+            deleted = self._conn.execute("DELETE FROM recipes WHERE id = ?", (recipe_id,)).rowcount
+            self._recipes.pop(recipe_id, None)
+        return deleted > 0
+
+    def list(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT id, recipe, updated_at FROM recipes ORDER BY id").fetchall()
+            recipes = {recipe_id: self._load(recipe_id, recipe, updated_at) for recipe_id, recipe, updated_at in rows}
+        return {recipe_id: recipe for recipe_id, recipe in recipes.items() if recipe is not None}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
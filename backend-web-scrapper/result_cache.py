@@ -0,0 +1,235 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from .scrape_strategy import domain_of
+
+logger = logging.getLogger(__name__)
+
+# Payload keys that change what a scrape returns; everything else is ignored for the key
+SPEC_KEYS = (
+    "container_selector", "custom_fields", "enable_scrolling", "max_scrolls", "extraction_mode", "strategy",
+    "incremental_scroll", "target_rows", "time_budget", "dedupe_fields", "prune_dom",
+    # Blocking stylesheets changes innerText, and fixed delays change what has rendered
+    "resource_policy", "fixed_delays",
+)
+DEFAULT_PORTS = {"http": 80, "https": 443}
+# Result of an in-flight computation whose caller was cancelled before it finished
+_ABANDONED = object()
+
+
+def normalize_url(url: str):
+    """Canonical form of a URL: lower-cased scheme/host, no default port or fragment, sorted query"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+def spec_hash(payload: dict):
+    """Stable hash of the extraction spec of a scrape payload"""
+    spec = {key: payload.get(key) for key in SPEC_KEYS}
+    return hashlib.sha256(json.dumps(spec, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+
+
+def parse_domain_ttls(value: str):
+    """Parse "example.com=60,shop.example=3600" into {domain: seconds}"""
+    ttls = {}
+    for item in (value or "").split(","):
+        if "=" in item:
+            domain, seconds = item.split("=", 1)
+            ttls[domain.strip().lower()] = float(seconds)
+    return ttls
+
+
+class ResultCache:
+    """LRU result cache with per-domain TTLs, an optional SQLite tier and request coalescing.
+
+    Expired entries are kept (until evicted) so callers can revalidate them
+    with ETag/Last-Modified instead of refetching.
+    """
+
+    def __init__(self, max_entries=1000, default_ttl=300, domain_ttls=None, disk_path=None):
+        self.max_entries = max(1, int(max_entries))
+        self.default_ttl = default_ttl
+        self.domain_ttls = domain_ttls or {}
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._disk = None
+        if disk_path:
+            self._disk = sqlite3.connect(disk_path, check_same_thread=False)
+            with self._disk:
+                self._disk.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS cache (
+                        key TEXT PRIMARY KEY,
+                        entry TEXT NOT NULL,
+                        expires_at REAL NOT NULL
+                    )
+                    """
+                )
+        self._metrics = {
+            "hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "revalidated": 0,
+            "stores": 0,
+            "evictions": 0,
+        }
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            max_entries=int(os.getenv("SCRAPER_CACHE_MAX_ENTRIES", "1000")),
+            default_ttl=float(os.getenv("SCRAPER_CACHE_TTL", "300")),
+            domain_ttls=parse_domain_ttls(os.getenv("SCRAPER_CACHE_DOMAIN_TTLS", "")),
+            disk_path=os.getenv("SCRAPER_CACHE_DB") or None,
+        )
+
+    def make_key(self, namespace, url, payload=None):
+        key = f"{namespace}:{normalize_url(url)}"
+        return f"{key}#{spec_hash(payload)}" if payload is not None else key
+
+    def ttl_for(self, url):
+        domain = domain_of(url)
+        # Most specific configured suffix wins, e.g. shop.example.com before example.com
+        for candidate, ttl in sorted(self.domain_ttls.items(), key=lambda item: -len(item[0])):
+            if domain == candidate or domain.endswith("." + candidate):
+                return ttl
+        return self.default_ttl
+
+    def _count(self, name):
+        with self._lock:
+            self._metrics[name] += 1
+
+    def _load_disk(self, key):
+        if self._disk is None:
+            return None
+        with self._lock:
+            row = self._disk.execute("SELECT entry FROM cache WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _store_disk(self, key, entry):
+        if self._disk is None:
+            return
+        with self._lock, self._disk:
+            self._disk.execute(
+                "INSERT OR REPLACE INTO cache (key, entry, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(entry, default=str), entry["expires_at"]),
+            )
+            if self._metrics["stores"] % 100 == 0:
+                self._disk.execute("DELETE FROM cache WHERE expires_at < ?", (time.time(),))
+
+    def get(self, key, allow_stale=False):
+        """Return the cached entry dict, or None; stale entries only with allow_stale"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        from_disk = False
+        if entry is None:
+            entry = self._load_disk(key)
+            from_disk = entry is not None
+        if entry is None:
+            return None
+        fresh = entry["expires_at"] > time.time()
+        if not fresh and not allow_stale:
+            return None
+        if from_disk:
+            self._remember(key, entry)
+        if fresh:
+            self._count("disk_hits" if from_disk else "hits")
+        return entry
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._metrics["evictions"] += 1
+
+    def set(self, key, url, value, etag=None, last_modified=None):
+        entry = {
+            "value": value,
+            "expires_at": time.time() + self.ttl_for(url),
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        self._remember(key, entry)
+        self._count("stores")
+        self._store_disk(key, entry)
+        return entry
+
+    def refresh(self, key, url):
+        """Extend the TTL of an entry the origin confirmed as unchanged (304)"""
+        entry = self.get(key, allow_stale=True)
+        if entry is None:
+            return None
+        self._count("revalidated")
+        return self.set(key, url, entry["value"], entry.get("etag"), entry.get("last_modified"))
+
+    async def get_or_compute(self, key, url, compute, should_store=bool):
+        """Return a fresh cached value or run compute(); concurrent callers share one computation"""
+        while True:
+            entry = self.get(key)
+            if entry is not None:
+                return entry["value"]
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            self._count("coalesced")
+            value = await asyncio.shield(inflight)
+            if value is not _ABANDONED:
+                return value
+            # The request computing the value was cancelled; the first follower takes over
+        self._count("misses")
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await compute()
+            if should_store(value):
+                self.set(key, url, value)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            # Only this caller went away (e.g. client disconnected): followers compute it themselves
+            future.set_result(_ABANDONED)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else was waiting
+            future.exception()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def metrics(self):
+        with self._lock:
+            snapshot = dict(self._metrics)
+            snapshot["entries"] = len(self._entries)
+        snapshot["max_entries"] = self.max_entries
+        snapshot["inflight"] = len(self._inflight)
+        snapshot["disk_enabled"] = self._disk is not None
+        lookups = snapshot["hits"] + snapshot["disk_hits"] + snapshot["misses"] + snapshot["coalesced"]
+        snapshot["hit_ratio"] = (snapshot["hits"] + snapshot["disk_hits"] + snapshot["coalesced"]) / lookups if lookups else 0.0
+        return snapshot
+
+    def close(self):
+        if self._disk is not None:
+            with self._lock:
+                self._disk.close()
+            self._disk = None
@@ -0,0 +1,69 @@
+import json
+
+
+def is_empty_row(values):
+    """True when every value of a row is None or blank"""
+    return not any(value is not None and str(value).strip() for value in values)
+
+
+class ResultTable:
+    """Lean row store for scrape results: a column list plus one tuple per row.
+
+    Replaces the per-page pandas DataFrame; rows are filtered once on the way
+    in and serialized straight to dicts/JSON. File exports are streamed by
+    the exporters module instead.
+    """
+
+    __slots__ = ("columns", "rows")
+
+    def __init__(self, columns, rows=None):
+        self.columns = list(columns)
+        self.rows = rows if rows is not None else []
+
+    @classmethod
+    def from_columns(cls, data):
+        """Build a table from a dict of equal-length column lists, dropping empty rows in one pass"""
+        columns = list(data)
+        rows = [values for values in zip(*data.values()) if not is_empty_row(values)]
+        return cls(columns, rows)
+
+    def append(self, values):
+        """Add a row unless it is empty; returns whether it was kept"""
+        values = tuple(values)
+        if is_empty_row(values):
+            return False
+        self.rows.append(values)
+        return True
+
+    def extend(self, other):
+        """Append the (already filtered) rows of another table with the same columns"""
+        if other.columns != self.columns:
+            raise ValueError(f"Column mismatch: {other.columns} != {self.columns}")
+        self.rows.extend(other.rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def empty(self):
+        return not self.rows
+
+    def iter_records(self):
+        columns = self.columns
+        for values in self.rows:
+            yield dict(zip(columns, values))
+
+    def records(self):
+        """List of row dicts, the shape returned by the API"""
+        return list(self.iter_records())
+
+    def iter_json_chunks(self, chunk_size=1000):
+        """Comma-separated JSON objects, chunk_size rows per json.dumps call"""
+        columns = self.columns
+        for start in range(0, len(self.rows), chunk_size):
+            chunk = [dict(zip(columns, values)) for values in self.rows[start:start + chunk_size]]
+            yield json.dumps(chunk, ensure_ascii=False, default=str)[1:-1]
+
+    def to_json(self, chunk_size=1000):
+        """JSON array of row dicts; encoding in chunks bounds the intermediate dicts held at once"""
+        return "[" + ",".join(self.iter_json_chunks(chunk_size)) + "]"
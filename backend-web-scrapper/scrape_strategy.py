@@ -0,0 +1,89 @@
+import logging
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+from .dynamic_web_scrapper import extract_columns_from_html, records_from_columns
+
+logger = logging.getLogger(__name__)
+
+STATIC = "static"
+DYNAMIC = "dynamic"
+AUTO = "auto"
+STRATEGIES = (AUTO, STATIC, DYNAMIC)
+
+
+def domain_of(url: str):
+    """Lower-cased host of a URL, used as the key for per-domain decisions"""
+    return (urlsplit(url).hostname or "").lower()
+
+
+class StrategyMemory:
+    """Remembers per domain whether static HTML was enough or a browser was needed.
+
+    Entries expire after ``ttl`` seconds so sites that change rendering get re-probed.
+    """
+
+    def __init__(self, ttl=3600):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        return cls(ttl=float(os.getenv("SCRAPER_STRATEGY_TTL", "3600")))
+
+    def get(self, url):
+        domain = domain_of(url)
+        with self._lock:
+            entry = self._entries.get(domain)
+            if entry is None:
+                return None
+            strategy, stored_at = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[domain]
+                return None
+            return strategy
+
+    def remember(self, url, strategy):
+        domain = domain_of(url)
+        with self._lock:
+            previous = self._entries.get(domain, (None, 0))[0]
+            self._entries[domain] = (strategy, time.monotonic())
+        if previous != strategy:
+            logger.info(f"Remembering '{strategy}' strategy for {domain}")
+
+    def snapshot(self):
+        with self._lock:
+            return {domain: strategy for domain, (strategy, _) in self._entries.items()}
+
+
+def field_fill_rates(data, custom_fields):
+    """Share of containers with a non-empty value, per field"""
+    rates = {}
+    for field in custom_fields:
+        values = data.get(field["name"], [])
+        filled = sum(1 for value in values if str(value).strip())
+        rates[field["name"]] = filled / len(values) if values else 0.0
+    return rates
+
+
+def evaluate_static_html(html: str, container_selector: str, custom_fields: list, base_url: str, min_fill_rate: float):
+    """
+    Apply the extraction spec to server-rendered HTML and decide whether it is good enough.
+    Returns (sufficient, records, fill_rates); records are returned either way, sufficient only
+    decides whether auto mode escalates to a browser. Pure function, safe to run in a process pool.
+    """
+    data = extract_columns_from_html(html, container_selector, custom_fields, base_url)
+    containers = len(next(iter(data.values()), []))
+    rates = field_fill_rates(data, custom_fields)
+    # Every field has to meet the threshold: a column the page fills in with JavaScript
+    # (e.g. prices) is empty in the static HTML however complete the other fields are
+    min_rate = min(rates.values()) if rates else 0.0
+    sufficient = containers > 0 and min_rate >= min_fill_rate
+    logger.info(
+        f"Static probe found {containers} containers with lowest field fill rate {min_rate:.2f} "
+        f"(threshold {min_fill_rate:.2f}, sufficient={sufficient})"
+    )
+    return sufficient, records_from_columns(data), rates
@@ -0,0 +1,96 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+STREAM_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+_DONE = object()
+
+
+def encode_event(event: dict, stream_format: str = "ndjson"):
+    """Serialize one event as an NDJSON line or a Server-Sent Event"""
+    data = json.dumps(event, ensure_ascii=False, default=str)
+    if stream_format == "sse":
+        return f"event: {event.get('type', 'message')}\ndata: {data}\n\n"
+    return data + "\n"
+
+
+async def encode_events(events, stream_format: str = "ndjson"):
+    """Encode an async iterator of events for a StreamingResponse"""
+    async for event in events:
+        yield encode_event(event, stream_format)
+
+
+async def iterate_in_thread(executor, gen_func, *args, on_done=None, buffer_size=64, **kwargs):
+    """
+    Drive a blocking generator on executor and yield its items asynchronously.
+    At most ``buffer_size`` items wait for the consumer: a slow client blocks
+    the generator instead of letting it buffer a whole page of rows.
+    When the consumer stops early the generator is closed in its own thread,
+    so resources it holds (e.g. a pooled browser) are released there.
+    ``on_done`` is called once the worker thread has finished. The generator
+    runs in a copy of the caller's context (request timers included).
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=buffer_size)
+    stop = threading.Event()
+
+    def publish(item):
+        """Put item on the queue, waiting for room; False once the consumer is gone"""
+        try:
+            future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        except RuntimeError:
+            # Event loop already closed (server shutting down)
+            stop.set()
+            return False
+        while True:
+            try:
+                future.result(timeout=0.5)
+                return True
+            except concurrent.futures.TimeoutError:
+                if stop.is_set() or loop.is_closed():
+                    future.cancel()
+                    stop.set()
+                    return False
+            except concurrent.futures.CancelledError:
+                stop.set()
+                return False
+
+    def produce():
+        generator = gen_func(*args, **kwargs)
+        error = None
+        try:
+            for item in generator:
+                if stop.is_set() or not publish(item):
+                    break
+        except Exception as e:
+            error = e
+        finally:
+            generator.close()
+            if not stop.is_set():
+                publish((_DONE, error))
+
+    future = loop.run_in_executor(executor, contextvars.copy_context().run, produce)
+    if on_done:
+        future.add_done_callback(lambda _: on_done())
+    try:
+        while True:
+            item = await queue.get()
+            if isinstance(item, tuple) and len(item) == 2 and item[0] is _DONE:
+                if item[1] is not None:
+                    raise item[1]
+                break
+            yield item
+    finally:
+        stop.set()
+        # Free a producer blocked on a full queue right away
+        while not queue.empty():
+            queue.get_nowait()
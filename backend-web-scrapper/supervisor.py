@@ -0,0 +1,249 @@
+"""
+Supervised multi-process deployment.
+
+Browser-worker processes own the Chrome pools and only report healthy once
+their browsers are warmed up. API processes then share one listening socket,
+run the static-first work on every core and forward browser work to the
+workers (SCRAPER_BROWSER_WORKERS). A machine-wide slot budget
+(SCRAPER_MAX_BROWSERS) caps Chrome instances across all processes, children
+that die are restarted with backoff, and SIGTERM/SIGINT drains the API
+processes first and the browser workers last.
+
+Run from the repository root:
+    python -m backend-web-scrapper.supervisor --api-processes 4 --browser-workers 2 --pool-size 3
+"""
+import argparse
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+logger = logging.getLogger(__name__)
+
+APP = f"{__package__}.main:app"
+RESTART_BACKOFF_MAX = 30
+# A child that ran this long is considered stable again and its restart backoff is reset
+STABLE_AFTER = 60
+
+
+class Child:
+    """One supervised uvicorn process (in its own session, so Chrome children go down with it)"""
+
+    def __init__(self, name, argv, env, pass_fds=(), health_url=None):
+        self.name = name
+        self.argv = argv
+        self.env = env
+        self.pass_fds = tuple(pass_fds)
+        self.health_url = health_url
+        self.process = None
+        self.started_at = 0.0
+        self.restarts = 0
+        self.restart_at = None
+
+    def start(self):
+        self.process = subprocess.Popen(self.argv, env=self.env, pass_fds=self.pass_fds, start_new_session=True)
+        self.started_at = time.monotonic()
+        self.restart_at = None
+        logger.info(f"Started {self.name} (pid {self.process.pid})")
+
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def healthy(self):
+        try:
+            with urllib.request.urlopen(self.health_url, timeout=2) as response:
+                return response.status == 200
+        except OSError:
+            return False
+
+    def terminate(self):
+        if self.alive():
+            self.process.send_signal(signal.SIGTERM)
+
+    def wait(self, deadline):
+        """Wait for the process to exit; kill its whole session once the deadline has passed"""
+        if self.process is None:
+            return
+        try:
+            self.process.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            logger.warning(f"{self.name} did not stop in time, killing it")
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            except OSError:
+                pass
+            self.process.wait()
+
+
+class Supervisor:
+    def __init__(self, args):
+        self.args = args
+        self.stopping = False
+        self.socket = None
+        self.workers = []
+        self.api = []
+
+    def _uvicorn(self, *options):
+        return [
+            sys.executable, "-m", "uvicorn", APP,
+            "--timeout-graceful-shutdown", str(int(self.args.drain_timeout)),
+            "--log-level", self.args.log_level, *options,
+        ]
+
+    def _env(self, **overrides):
+        env = dict(os.environ)
+        env["SCRAPER_MAX_BROWSERS"] = str(self.args.max_browsers)
+        env["SCRAPER_DRAIN_TIMEOUT"] = str(self.args.drain_timeout)
+        env.update({key: str(value) for key, value in overrides.items()})
+        return env
+
+    def build_browser_workers(self):
+        for index in range(self.args.browser_workers):
+            port = self.args.worker_base_port + index
+            env = self._env(
+                SCRAPER_ROLE="browser",
+                SCRAPER_BROWSER_WORKERS="",
+                SCRAPER_POOL_SIZE=self.args.pool_size,
+                SCRAPER_POOL_WARMUP=os.getenv("SCRAPER_POOL_WARMUP", self.args.pool_size),
+                SCRAPER_DYNAMIC_WORKERS=self.args.pool_size,
+                # Jobs are only taken by API processes
+                SCRAPER_JOB_RESUME=0,
+            )
+            if self.args.worker_max_rss_mb:
+                env["SCRAPER_MAX_RSS_MB"] = str(self.args.worker_max_rss_mb)
+            self.workers.append(Child(
+                f"browser-worker-{index}",
+                self._uvicorn("--host", "127.0.0.1", "--port", str(port)),
+                env,
+                health_url=f"http://127.0.0.1:{port}/health",
+            ))
+
+    def build_api(self):
+        family = socket.AF_INET6 if ":" in self.args.host else socket.AF_INET
+        self.socket = socket.socket(family, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind((self.args.host, self.args.port))
+        self.socket.listen(2048)
+        fd = self.socket.fileno()
+        worker_urls = ",".join(f"http://127.0.0.1:{self.args.worker_base_port + i}" for i in range(self.args.browser_workers))
+        parse_processes = os.getenv("SCRAPER_PARSE_PROCESSES", max(1, (os.cpu_count() or 1) // self.args.api_processes))
+        for index in range(self.args.api_processes):
+            env = self._env(
+                SCRAPER_ROLE="api",
+                SCRAPER_BROWSER_WORKERS=worker_urls,
+                SCRAPER_POOL_WARMUP=0,
+                SCRAPER_PARSE_PROCESSES=parse_processes,
+                # Only the first API process resumes jobs left unfinished by a previous run
+                SCRAPER_JOB_RESUME=1 if index == 0 else 0,
+            )
+            self.api.append(Child(f"api-{index}", self._uvicorn("--fd", str(fd)), env, pass_fds=(fd,)))
+
+    def wait_until_healthy(self, children, timeout):
+        """Block until every child answers /health (browsers warmed up); False if one died or time ran out"""
+        deadline = time.monotonic() + timeout
+        pending = list(children)
+        while pending and not self.stopping:
+            for child in list(pending):
+                if not child.alive():
+                    logger.error(f"{child.name} exited during startup with code {child.process.returncode}")
+                    return False
+                if child.healthy():
+                    logger.info(f"{child.name} is ready")
+                    pending.remove(child)
+            if pending:
+                if time.monotonic() >= deadline:
+                    logger.error(f"{', '.join(child.name for child in pending)} not ready after {timeout} seconds")
+                    return False
+                time.sleep(0.5)
+        return not pending
+
+    def watch(self, child):
+        """Restart a child that exited on its own, with exponential backoff"""
+        if child.alive() or self.stopping:
+            return
+        now = time.monotonic()
+        if child.restart_at is None:
+            if now - child.started_at >= STABLE_AFTER:
+                child.restarts = 0
+            delay = min(2 ** child.restarts, RESTART_BACKOFF_MAX)
+            child.restarts += 1
+            child.restart_at = now + delay
+            logger.warning(f"{child.name} exited with code {child.process.returncode}, restarting in {delay} seconds")
+            # A restarted API process must not resume jobs still running in its siblings
+            child.env["SCRAPER_JOB_RESUME"] = "0"
+        elif now >= child.restart_at:
+            child.start()
+
+    def stop(self, signum=None, frame=None):
+        if not self.stopping:
+            logger.info("Shutting down: draining API processes, then browser workers")
+        self.stopping = True
+
+    def shutdown(self):
+        # API processes first so nothing forwards to workers that are already draining
+        grace = self.args.drain_timeout * 2 + 5
+        for group in (self.api, self.workers):
+            for child in group:
+                child.terminate()
+            deadline = time.monotonic() + grace
+            for child in group:
+                child.wait(deadline)
+        if self.socket is not None:
+            self.socket.close()
+        logger.info("All processes stopped")
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        self.build_browser_workers()
+        for child in self.workers:
+            child.start()
+        try:
+            if not self.wait_until_healthy(self.workers, self.args.startup_timeout):
+                return 1
+            self.build_api()
+            for child in self.api:
+                child.start()
+            logger.info(
+                f"Serving on {self.args.host}:{self.args.port} with {len(self.api)} API process(es), "
+                f"{len(self.workers)} browser worker(s) and at most {self.args.max_browsers} browsers"
+            )
+            while not self.stopping:
+                for child in self.workers + self.api:
+                    self.watch(child)
+                time.sleep(0.5)
+            return 0
+        finally:
+            self.shutdown()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--api-processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--browser-workers", type=int, default=1)
+    parser.add_argument("--worker-base-port", type=int, default=8100, help="browser workers listen on 127.0.0.1 from this port")
+    parser.add_argument("--pool-size", type=int, default=int(os.getenv("SCRAPER_POOL_SIZE", "2")), help="browsers per worker")
+    parser.add_argument("--max-browsers", type=int, default=None,
+                        help="machine-wide Chrome cap (defaults to browser workers x pool size)")
+    parser.add_argument("--worker-max-rss-mb", type=float, default=None,
+                        help="per browser worker (Chrome included) memory limit before browser work is held back")
+    parser.add_argument("--drain-timeout", type=float, default=float(os.getenv("SCRAPER_DRAIN_TIMEOUT", "30")))
+    parser.add_argument("--startup-timeout", type=float, default=120)
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args(argv)
+    if args.api_processes < 1 or args.browser_workers < 1:
+        parser.error("--api-processes and --browser-workers must be at least 1")
+    if args.max_browsers is None:
+        args.max_browsers = args.browser_workers * args.pool_size
+    return args
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    sys.exit(Supervisor(parse_args()).run())
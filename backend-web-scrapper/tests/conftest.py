@@ -0,0 +1,14 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+# The package directory name has a dash, so tests import it by name from the repository root
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+
+@pytest.fixture
+def scraper_module():
+    """Import a module of the backend-web-scrapper package by its short name"""
+    return lambda name: importlib.import_module(f"backend-web-scrapper.{name}")
@@ -0,0 +1,57 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+BUSY = "http://busy:8001"
+HEALTHY = "http://healthy:8002"
+
+
+def ndjson(*events):
+    return "".join(json.dumps(event) + "\n" for event in events)
+
+
+def worker_transport(scraper_module):
+    """Fake workers: BUSY answers 200 but reports pool exhaustion in-band, as a real worker's stream does"""
+    main = scraper_module("main")
+    pool_exhausted = main.error_event(scraper_module("driver_pool").PoolExhaustedError("No WebDriver available"), 0)
+
+    def handle(request):
+        if request.url.host == "busy":
+            body = ndjson({"type": "start", "url": "https://shop.example/"}, pool_exhausted)
+        else:
+            body = ndjson(
+                {"type": "start", "url": "https://shop.example/"},
+                {"type": "row", "data": {"title": "One"}},
+                {"type": "done", "rows": 1},
+            )
+        return httpx.Response(200, text=body, headers={"Content-Type": "application/x-ndjson"})
+
+    return httpx.MockTransport(handle)
+
+
+def test_stream_fails_over_from_rejecting_worker(scraper_module):
+    workers = scraper_module("browser_workers").BrowserWorkers([BUSY, HEALTHY])
+
+    async def collect():
+        async with httpx.AsyncClient(transport=worker_transport(scraper_module)) as client:
+            return [event async for event in workers.stream(client, "/scrape-dynamic/stream", {})]
+
+    events = asyncio.run(collect())
+    assert [event["type"] for event in events] == ["start", "row", "done"]
+    assert workers.metrics()["skipped"] == 1
+    assert workers.metrics()["forwarded"] == 1
+
+
+def test_stream_rejected_by_every_worker(scraper_module):
+    module = scraper_module("browser_workers")
+    workers = module.BrowserWorkers([BUSY, BUSY])
+
+    async def collect():
+        async with httpx.AsyncClient(transport=worker_transport(scraper_module)) as client:
+            return [event async for event in workers.stream(client, "/scrape-dynamic/stream", {})]
+
+    with pytest.raises(module.BrowserWorkerError) as raised:
+        asyncio.run(collect())
+    assert raised.value.status_code == 503
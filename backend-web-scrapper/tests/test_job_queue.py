@@ -0,0 +1,30 @@
+import asyncio
+
+
+def test_metrics_from_another_thread(scraper_module, tmp_path):
+    job_queue = scraper_module("job_queue")
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def runner(job, progress):
+            await release.wait()
+
+        queue = job_queue.JobQueue(job_queue.JobStore(str(tmp_path / "jobs.sqlite3")), runner, workers=2)
+        await queue.start()
+        for url in ["https://a.example/1", "https://a.example/2", "https://b.example/1"]:
+            await queue.submit("scrape", {"url": url})
+        await asyncio.sleep(0.2)
+        # /metrics renders gauges in a worker thread
+        running = await asyncio.to_thread(queue.metrics)
+        release.set()
+        await asyncio.sleep(0.2)
+        done = await asyncio.to_thread(queue.metrics)
+        await queue.stop()
+        return running, done
+
+    running, done = asyncio.run(scenario())
+    # One job per domain at a time: a.example/2 waits for a.example/1
+    assert (running["pending"], running["running"]) == (1, 2)
+    assert (done["pending"], done["running"]) == (0, 0)
+    assert done["by_status"] == {job_queue.SUCCEEDED: 3}
@@ -0,0 +1,43 @@
+import itertools
+import json
+import time
+
+
+class PollingPageDriver:
+    """Fake WebDriver for a loaded page that keeps starting requests (analytics, long polling)"""
+
+    def __init__(self, containers=10):
+        self.containers = containers
+        self._request_ids = itertools.count()
+
+    def execute_script(self, script, *args):
+        if "readyState" in script:
+            return "complete"
+        if "querySelectorAll" in script:
+            return self.containers
+        raise AssertionError(f"Unexpected script: {script}")
+
+    def get_log(self, log_type):
+        # A new request every poll that never finishes
+        message = {"message": {"method": "Network.requestWillBeSent", "params": {"requestId": str(next(self._request_ids))}}}
+        return [{"message": json.dumps(message)}] * 3
+
+
+def test_polling_page_is_ready_once_containers_settle(scraper_module):
+    readiness = scraper_module("page_readiness").PageReadiness(PollingPageDriver(), timeout=20, poll_interval=0.01)
+    started = time.monotonic()
+    readiness.wait_until_ready(".card")
+    assert time.monotonic() - started < 1
+
+
+def test_stages_share_one_deadline(scraper_module):
+    # No containers ever appear and the network never idles: every stage would time out
+    readiness = scraper_module("page_readiness").PageReadiness(PollingPageDriver(containers=0), timeout=0.5, poll_interval=0.01)
+    started = time.monotonic()
+    readiness.wait_until_ready(".card")
+    assert time.monotonic() - started < 0.8
+
+
+def test_network_idle_is_still_awaited_without_containers(scraper_module):
+    readiness = scraper_module("page_readiness").PageReadiness(PollingPageDriver(), timeout=0.3, poll_interval=0.01)
+    assert not readiness.wait_for_network_idle()
@@ -0,0 +1,26 @@
+import asyncio
+import os
+import signal
+
+HTML = "<div class='card'><h2>One</h2></div><div class='card'><h2>Two</h2></div>"
+FIELDS = [{"name": "title", "selector": "h2", "type": "text"}]
+
+
+def test_parse_survives_killed_worker(scraper_module):
+    main = scraper_module("main")
+    strategy = scraper_module("scrape_strategy")
+    main.parse_executor = main.new_parse_executor()
+    try:
+        parse = lambda: main.run_parse(strategy.evaluate_static_html, HTML, ".card", FIELDS, "https://example.com/", 0.5)
+        asyncio.run(parse())
+        broken = main.parse_executor
+        for process in list(broken._processes.values()):
+            os.kill(process.pid, signal.SIGKILL)
+            process.join()
+
+        records = asyncio.run(parse())[1]
+
+        assert [record["title"] for record in records] == ["One", "Two"]
+        assert main.parse_executor is not broken
+    finally:
+        main.parse_executor.shutdown(wait=True)
@@ -0,0 +1,58 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+# Prices are filled in by JavaScript on two of the three cards
+PAGE = """
+<div class="card"><h2>One</h2><span class="price">10</span></div>
+<div class="card"><h2>Two</h2><span class="price"></span></div>
+<div class="card"><h2>Three</h2><span class="price"></span></div>
+"""
+FIELDS = [
+    {"name": "title", "selector": "h2", "type": "text"},
+    {"name": "price", "selector": ".price", "type": "text"},
+]
+
+
+@pytest.fixture
+def main(scraper_module, monkeypatch):
+    main = scraper_module("main")
+    strategy = scraper_module("scrape_strategy")
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, text=PAGE))
+    monkeypatch.setattr(main, "http_client", httpx.AsyncClient(transport=transport))
+    monkeypatch.setattr(main, "strategy_memory", strategy.StrategyMemory())
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        monkeypatch.setattr(main, "parse_executor", executor)
+        yield main
+
+
+def test_partial_fields_are_not_sufficient(scraper_module):
+    evaluate = scraper_module("scrape_strategy").evaluate_static_html
+    sufficient, records, rates = evaluate(PAGE, ".card", FIELDS, "https://shop.example/", 0.5)
+    assert not sufficient
+    assert rates["title"] == 1.0
+    assert [record["title"] for record in records] == ["One", "Two", "Three"]
+
+
+def test_forced_static_returns_partial_records(main):
+    payload = {"url": "https://shop.example/", "container_selector": ".card", "custom_fields": FIELDS, "strategy": "static"}
+    records, strategy = asyncio.run(main.resolve_static(payload))
+    assert strategy == "static"
+    assert [(record["title"], record["price"]) for record in records] == [("One", "10"), ("Two", ""), ("Three", "")]
+    assert main.strategy_memory.get(payload["url"]) is None
+
+
+def test_auto_escalates_on_partial_fields(main):
+    payload = {"url": "https://shop.example/", "container_selector": ".card", "custom_fields": FIELDS}
+    assert asyncio.run(main.resolve_static(payload)) == (None, "dynamic")
+
+
+def test_auto_escalates_when_static_parse_fails(main, monkeypatch):
+    def broken_parse(*args):
+        raise ValueError("malformed selector")
+
+    monkeypatch.setattr(main, "evaluate_static_html", broken_parse)
+    payload = {"url": "https://shop.example/", "container_selector": ".card", "custom_fields": FIELDS}
+    assert asyncio.run(main.resolve_static(payload)) == (None, "dynamic")
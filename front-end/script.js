@@ -57,16 +57,29 @@ document.getElementById('dynamic-scrape').addEventListener('click', function() {
 
     document.getElementById('results').innerText = 'Scraping dynamically...';
 
+    const payload = {
+        url: url,
+        container_selector: containerSelector,
+        custom_fields: fields,
+        enable_scrolling: enableScrolling,
+        max_scrolls: maxScrolls
+    };
+
+    const exportFormat = document.getElementById('export-format').value;
+    if (exportFormat !== 'json') {
+        downloadExport(payload, exportFormat, document.getElementById('export-compression').value);
+        return;
+    }
+
+    if (document.getElementById('stream-results').checked) {
+        streamDynamicScrape(payload);
+        return;
+    }
+
     fetch('http://127.0.0.1:8002/scrape-dynamic', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-            url: url,
-            container_selector: containerSelector,
-            custom_fields: fields,
-            enable_scrolling: enableScrolling,
-            max_scrolls: maxScrolls
-        })
+        body: JSON.stringify(payload)
     })
     .then(res => res.json())
     .then(data => {
@@ -76,3 +89,107 @@ document.getElementById('dynamic-scrape').addEventListener('click', function() {
         document.getElementById('results').innerText = 'Dynamic scrape failed.';
     });
 });
+
+// Streaming dynamic scrape: render NDJSON rows as they arrive
+function streamDynamicScrape(payload) {
+    const results = document.getElementById('results');
+    const status = document.createElement('div');
+    const rows = document.createElement('div');
+    results.innerText = '';
+    results.appendChild(status);
+    results.appendChild(rows);
+    let rowCount = 0;
+    status.innerText = 'Streaming... 0 rows';
+
+    function handleEvent(event) {
+        if (event.type === 'row') {
+            rowCount += 1;
+            rows.appendChild(document.createTextNode(JSON.stringify(event.data, null, 2) + '\n'));
+            status.innerText = `Streaming... ${rowCount} rows`;
+        } else if (event.type === 'page') {
+            rows.appendChild(document.createTextNode(`--- page ${event.page} (${event.rows} rows) ---\n`));
+        } else if (event.type === 'done') {
+            status.innerText = `Done: ${event.rows} rows` + (event.strategy ? ` (${event.strategy})` : '');
+        } else if (event.type === 'error') {
+            status.innerText = `Error after ${event.rows} rows: ${event.detail}`;
+        }
+    }
+
+    fetch('http://127.0.0.1:8002/scrape-dynamic/stream', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(payload)
+    })
+    .then(async res => {
+        if (!res.ok) {
+            const error = await res.json();
+            throw new Error(error.detail);
+        }
+        const reader = res.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        while (true) {
+            const { done, value } = await reader.read();
+            if (done) {
+                break;
+            }
+            buffer += decoder.decode(value, { stream: true });
+            const lines = buffer.split('\n');
+            buffer = lines.pop();
+            lines.filter(line => line.trim()).forEach(line => handleEvent(JSON.parse(line)));
+        }
+        if (buffer.trim()) {
+            handleEvent(JSON.parse(buffer));
+        }
+    })
+    .catch(error => {
+        status.innerText = 'Dynamic scrape failed.' + (error.message ? ` ${error.message}` : '');
+    });
+}
+
+// Export download: pipe the response straight to disk when the browser supports it
+async function downloadExport(payload, format, compression) {
+    const results = document.getElementById('results');
+    let query = `format=${format}`;
+    let filename = `scrape-results.${format}`;
+    if (compression) {
+        query += `&compression=${compression}`;
+        if (format !== 'parquet') {
+            filename += compression === 'gzip' ? '.gz' : '.zst';
+        }
+    }
+    try {
+        // Ask for the target file first, while the click still counts as a user gesture
+        const writable = window.showSaveFilePicker
+            ? await (await window.showSaveFilePicker({ suggestedName: filename })).createWritable()
+            : null;
+        results.innerText = `Exporting ${format}...`;
+        const res = await fetch(`http://127.0.0.1:8002/scrape-dynamic?${query}`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(payload)
+        });
+        if (!res.ok) {
+            const error = await res.json();
+            if (writable) {
+                await writable.abort();
+            }
+            throw new Error(error.detail);
+        }
+        if (writable) {
+            // File System Access API: chunks are written as they arrive, nothing is buffered here
+            await res.body.pipeTo(writable);
+        } else {
+            // Fallback for browsers without it: the file is assembled in a Blob before saving
+            const blob = await res.blob();
+            const link = document.createElement('a');
+            link.href = URL.createObjectURL(blob);
+            link.download = filename;
+            link.click();
+            setTimeout(() => URL.revokeObjectURL(link.href), 0);
+        }
+        results.innerText = `Saved ${filename}`;
+    } catch (error) {
+        results.innerText = 'Export failed.' + (error.message ? ` ${error.message}` : '');
+    }
+}